@@ -3,40 +3,45 @@ FastAPI ML Service for Recommendation Engine
 Exposes HTTP endpoints for generating recommendations.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Query
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+import numpy as np
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import orjson
 from datetime import datetime
 import os
-import sys
-
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
 
+# Run from ml_service/ (`python -m api.main`, or uvicorn with --app-dir
+# ml_service) so these modules resolve without touching sys.path
 from recommendation_engine import (
     ProjectRecommendationEngine,
     TalentRecommendationEngine,
     ColdStartRecommender,
 )
 from feature_extractors import FeatureExtractor
+# Shared with the budget API; lives in its package so that image stays self-contained
+from budget_estimation.middleware import FastCORSMiddleware
 
 # Initialize FastAPI app
 app = FastAPI(
     title="WorkDev Recommendation API",
     description="ML-powered recommendation service for developer-project matching",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict to specific origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware: any origin, credentials allowed (restrict for production)
+# FastCORSMiddleware skips Starlette's generic Origin parsing on every request.
+app.add_middleware(FastCORSMiddleware)
 
 # Logging
 logging.basicConfig(level=logging.INFO)
@@ -51,64 +56,143 @@ feature_extractor = FeatureExtractor()
 # Model loaded flag
 MODEL_LOADED = False
 
+# Bounded pool for CPU-bound engine calls so they don't block the event loop
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", os.cpu_count() or 4))
+engine_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Caps in-flight engine calls; excess requests wait here instead of piling up
+request_slots = asyncio.Semaphore(MAX_WORKERS * 2)
+
+
+async def run_in_engine_pool(fn, *args, **kwargs):
+    """Run a blocking engine call on the bounded executor."""
+    async with request_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(engine_executor, functools.partial(fn, *args, **kwargs))
+
+
+# Serialized project-recommendation responses keyed on a hash of the request.
+# Only touched from the event loop thread, so no lock is needed.
+recommendation_cache = TTLCache(
+    maxsize=int(os.getenv("RECOMMENDATION_CACHE_SIZE", 10_000)),
+    ttl=int(os.getenv("RECOMMENDATION_CACHE_TTL", 60)),
+)
+
+
+def _request_cache_key(payload: dict) -> bytes:
+    """Hash a dumped request into a stable cache key."""
+    return hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+        digest_size=16,
+    ).digest()
+
+
+# Recommendation lists are streamed this many serialized items per chunk
+STREAM_CHUNK_ITEMS = int(os.getenv("STREAM_CHUNK_ITEMS", 10))
+
+
+async def _stream_json_array(
+    items: list[dict], on_complete: Callable[[bytes], None] | None = None
+):
+    """
+    Serialize a list as a JSON array, yielding a few items at a time.
+
+    `on_complete` receives the full body once the last chunk has been produced.
+    """
+    chunks = []
+    for start in range(0, max(len(items), 1), STREAM_CHUNK_ITEMS):
+        body = b",".join(
+            orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+            for item in items[start : start + STREAM_CHUNK_ITEMS]
+        )
+        prefix = b"[" if start == 0 else b","
+        suffix = b"]" if start + STREAM_CHUNK_ITEMS >= len(items) else b""
+        chunk = prefix + body + suffix
+        chunks.append(chunk)
+        yield chunk
+
+    if on_complete is not None:
+        on_complete(b"".join(chunks))
+
 
 # ==================== Pydantic Models ====================
 
 
 class DeveloperProfile(BaseModel):
+    # Request-only DTO: ignore unknown fields and skip per-assignment validation
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     user_id: str
-    skills: List[str]
+    skills: list[str]
     experience_level: str = Field(..., pattern="^(junior|mid|senior|expert)$")
     hourly_rate: float = Field(..., gt=0)
-    preferences: Optional[Dict] = None
-    average_rating: Optional[float] = Field(None, ge=0, le=5)
-    completion_rate: Optional[float] = Field(None, ge=0, le=1)
-    total_projects_completed: Optional[int] = Field(None, ge=0)
-    availability_status: Optional[str] = "available"
+    preferences: dict | None = None
+    average_rating: float | None = Field(None, ge=0, le=5)
+    completion_rate: float | None = Field(None, ge=0, le=1)
+    total_projects_completed: int | None = Field(None, ge=0)
+    availability_status: str | None = "available"
+
+    # Vocabulary indices of `skills`, resolved on first access. Lazy rather
+    # than a post-init hook or private attribute, either of which makes
+    # pydantic call back into Python for every candidate in a list
+    @functools.cached_property
+    def skill_ids(self) -> np.ndarray:
+        return feature_extractor.encode_skill_ids(self.skills)
 
 
 class Project(BaseModel):
+    # Request-only DTO: ignore unknown fields and skip per-assignment validation
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     id: str
-    required_skills: List[str]
+    required_skills: list[str]
     complexity_level: str = Field(..., pattern="^(low|medium|high|expert)$")
-    budget_range: Dict
-    project_type: Optional[str] = None
-    is_remote: Optional[bool] = True
-    industry: Optional[str] = None
-    created_at: Optional[str] = None
+    budget_range: dict
+    project_type: str | None = None
+    is_remote: bool | None = True
+    industry: str | None = None
+    # Parsed once at validation, so scoring never re-parses timestamp strings
+    created_at: datetime | None = None
+
+    # Vocabulary indices of `required_skills`, resolved on first access. Lazy rather
+    # than a post-init hook or private attribute, either of which makes
+    # pydantic call back into Python for every candidate in a list
+    @functools.cached_property
+    def skill_ids(self) -> np.ndarray:
+        return feature_extractor.encode_skill_ids(self.required_skills)
 
 
 class ProjectRecommendationRequest(BaseModel):
     developer_id: str
     developer_profile: DeveloperProfile
-    candidate_projects: List[Project]
+    candidate_projects: list[Project]
     limit: int = Field(10, ge=1, le=50)
-    hybrid_weights: Optional[Dict[str, float]] = None
+    hybrid_weights: dict[str, float] | None = None
     include_explanations: bool = True
 
 
 class TalentRecommendationRequest(BaseModel):
     client_user_id: str
     project: Project
-    candidate_developers: List[DeveloperProfile]
+    candidate_developers: list[DeveloperProfile]
     limit: int = Field(10, ge=1, le=50)
 
 
 class RecommendationResponse(BaseModel):
-    recommendation_id: Optional[str] = None
-    project_id: Optional[str] = None
-    developer_user_id: Optional[str] = None
+    recommendation_id: str | None = None
+    project_id: str | None = None
+    developer_user_id: str | None = None
     relevance_score: float
-    collaborative_score: Optional[float] = None
-    content_score: Optional[float] = None
-    skill_match_score: Optional[float] = None
-    budget_fit_score: Optional[float] = None
-    experience_match_score: Optional[float] = None
-    recency_score: Optional[float] = None
-    reputation_score: Optional[float] = None
-    availability_score: Optional[float] = None
+    collaborative_score: float | None = None
+    content_score: float | None = None
+    skill_match_score: float | None = None
+    budget_fit_score: float | None = None
+    experience_match_score: float | None = None
+    recency_score: float | None = None
+    reputation_score: float | None = None
+    availability_score: float | None = None
     rank_position: int
-    explanation: List[str]
+    explanation: list[str]
     model_version: str
 
 
@@ -120,16 +204,29 @@ class HealthResponse(BaseModel):
 
 
 class TrainingRequest(BaseModel):
-    interaction_data: List[Dict]
+    interaction_data: list[dict]
 
 
 # ==================== Startup & Health ====================
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Load model on startup if available."""
-    global MODEL_LOADED
+_artifacts_load_attempted = False
+
+
+def load_artifacts():
+    """Load the skill vocabulary and model once per process; later calls are no-ops."""
+    global MODEL_LOADED, _artifacts_load_attempted
+
+    if _artifacts_load_attempted:
+        return
+    _artifacts_load_attempted = True
+
+    vocabulary_path = os.getenv("SKILL_VOCABULARY_PATH", "models/skill_vocabulary.json")
+
+    if os.path.exists(vocabulary_path):
+        with open(vocabulary_path) as f:
+            feature_extractor.fit_skill_vocabulary(json.load(f))
+        logger.info(f"Loaded {len(feature_extractor.skill_to_index)} skills from {vocabulary_path}")
 
     model_path = os.getenv("MODEL_PATH", "models/recommendation_model_latest.pkl")
 
@@ -146,21 +243,63 @@ async def startup_event():
         MODEL_LOADED = False
 
 
+# Load at import so `gunicorn --preload` reads the model once in the master
+# and forked workers share the user-item matrix pages copy-on-write
+if os.getenv("PRELOAD_MODEL", "true").lower() == "true":
+    load_artifacts()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Load model and skill vocabulary on startup unless they were preloaded."""
+    load_artifacts()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the engine worker pool."""
+    engine_executor.shutdown(wait=False)
+
+
+# (epoch second, ISO string) of the last formatted health timestamp
+_timestamp_cache = (0, "")
+
+
+def _cached_timestamp() -> str:
+    """Return the current time as an ISO string, formatted at most once per second."""
+    global _timestamp_cache
+
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse(
+    # Fields are produced locally; skip constructor validation
+    return HealthResponse.model_construct(
         status="healthy",
         model_version=project_engine.model_version,
         model_loaded=MODEL_LOADED,
-        timestamp=datetime.now().isoformat(),
+        timestamp=_cached_timestamp(),
     )
 
 
+@app.get("/healthz", response_class=PlainTextResponse)
+async def liveness_probe():
+    """Minimal liveness probe for orchestrators that only check the status code."""
+    return "ok"
+
+
 # ==================== Recommendation Endpoints ====================
 
 
-@app.post("/api/v1/recommendations/projects", response_model=List[RecommendationResponse])
+@app.post(
+    "/api/v1/recommendations/projects",
+    responses={200: {"model": list[RecommendationResponse]}},
+)
 async def get_project_recommendations(request: ProjectRecommendationRequest):
     """
     Generate personalized project recommendations for a developer.
@@ -168,13 +307,25 @@ async def get_project_recommendations(request: ProjectRecommendationRequest):
     Returns a ranked list of projects with relevance scores and explanations.
     """
     try:
-        # Convert Pydantic models to dicts
-        developer_profile_dict = request.developer_profile.dict()
-        candidate_projects_dict = [p.dict() for p in request.candidate_projects]
+        # Dump the validated request once; nested models come out as plain dicts
+        payload = request.model_dump()
+
+        # Output is deterministic for a given request and model, so repeat
+        # polls are served from the cache without touching the engine
+        cache_key = _request_cache_key(payload)
+        cached_body = recommendation_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(
+                content=cached_body, media_type="application/json", headers={"X-Cache": "HIT"}
+            )
+
+        developer_profile_dict = payload["developer_profile"]
+        candidate_projects_dict = payload["candidate_projects"]
 
         # Generate recommendations
         if MODEL_LOADED:
-            recommendations = project_engine.generate_project_recommendations(
+            recommendations = await run_in_engine_pool(
+                project_engine.generate_project_recommendations,
                 developer_id=request.developer_id,
                 developer_profile=developer_profile_dict,
                 candidate_projects=candidate_projects_dict,
@@ -183,25 +334,36 @@ async def get_project_recommendations(request: ProjectRecommendationRequest):
             )
         else:
             # Use cold-start recommendations
-            recommendations = cold_start_recommender.get_cold_start_project_recommendations(
-                developer_profile=developer_profile_dict, limit=request.limit
+            recommendations = await run_in_engine_pool(
+                cold_start_recommender.get_cold_start_project_recommendations,
+                developer_profile=developer_profile_dict,
+                limit=request.limit,
             )
 
-        # Convert to response models
-        response = [RecommendationResponse(**rec) for rec in recommendations]
-
         logger.info(
-            f"Generated {len(response)} project recommendations for developer {request.developer_id}"
+            f"Generated {len(recommendations)} project recommendations for developer {request.developer_id}"
         )
 
-        return response
+        # Engine output is already response-shaped; stream it without re-validation
+        # and cache the assembled body once the last chunk is out
+        return StreamingResponse(
+            _stream_json_array(
+                recommendations,
+                on_complete=functools.partial(recommendation_cache.__setitem__, cache_key),
+            ),
+            media_type="application/json",
+            headers={"X-Cache": "MISS"},
+        )
 
     except Exception as e:
         logger.error(f"Error generating project recommendations: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/v1/recommendations/talent", response_model=List[RecommendationResponse])
+@app.post(
+    "/api/v1/recommendations/talent",
+    responses={200: {"model": list[RecommendationResponse]}},
+)
 async def get_talent_recommendations(request: TalentRecommendationRequest):
     """
     Generate talent recommendations for a project.
@@ -209,25 +371,25 @@ async def get_talent_recommendations(request: TalentRecommendationRequest):
     Returns a ranked list of developers with relevance scores and explanations.
     """
     try:
-        # Convert Pydantic models to dicts
-        project_dict = request.project.dict()
-        candidate_developers_dict = [d.dict() for d in request.candidate_developers]
+        # Dump the validated request once; nested models come out as plain dicts
+        payload = request.model_dump()
+        project_dict = payload["project"]
+        candidate_developers_dict = payload["candidate_developers"]
 
         # Generate recommendations
-        recommendations = talent_engine.generate_talent_recommendations(
+        recommendations = await run_in_engine_pool(
+            talent_engine.generate_talent_recommendations,
             project=project_dict,
             candidate_developers=candidate_developers_dict,
             limit=request.limit,
         )
 
-        # Convert to response models
-        response = [RecommendationResponse(**rec) for rec in recommendations]
-
         logger.info(
-            f"Generated {len(response)} talent recommendations for project {request.project.id}"
+            f"Generated {len(recommendations)} talent recommendations for project {request.project.id}"
         )
 
-        return response
+        # Engine output is already response-shaped; stream it without re-validation
+        return StreamingResponse(_stream_json_array(recommendations), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error generating talent recommendations: {e}")
@@ -244,17 +406,20 @@ async def get_similar_projects(
 
     Useful for "Developers who viewed this project also viewed..." features.
     """
-    try:
-        if not MODEL_LOADED:
-            raise HTTPException(
-                status_code=503,
-                detail="Collaborative model not loaded. Similar projects not available.",
-            )
+    if not MODEL_LOADED:
+        raise HTTPException(
+            status_code=503,
+            detail="Collaborative model not loaded. Similar projects not available.",
+        )
 
-        # TODO: Implement item-item similarity
-        # This would use the item_index and similarity matrix
+    if project_id not in project_engine.item_index:
+        raise HTTPException(status_code=404, detail=f"Unknown project: {project_id}")
 
-        return {"message": "Similar projects feature coming soon"}
+    try:
+        # Item-item cosine similarity over the interaction matrix, off the event loop
+        return await run_in_engine_pool(
+            project_engine.find_similar_projects, project_id, limit=limit
+        )
 
     except Exception as e:
         logger.error(f"Error finding similar projects: {e}")
@@ -271,7 +436,7 @@ async def reload_model():
 
     Useful for hot-swapping models without restarting the service.
     """
-    global MODEL_LOADED
+    global MODEL_LOADED, project_engine
 
     try:
         model_path = os.getenv("MODEL_PATH", "models/recommendation_model_latest.pkl")
@@ -279,8 +444,13 @@ async def reload_model():
         if not os.path.exists(model_path):
             raise HTTPException(status_code=404, detail=f"Model file not found: {model_path}")
 
-        project_engine.load_model(model_path)
+        # Load into a fresh engine and swap, so in-flight pool threads never
+        # observe a half-loaded model
+        engine = ProjectRecommendationEngine()
+        engine.load_model(model_path)
+        project_engine = engine
         MODEL_LOADED = True
+        recommendation_cache.clear()
 
         logger.info(f"Model reloaded successfully from {model_path}")
 
@@ -301,38 +471,38 @@ async def get_model_info():
     """
     Get information about the currently loaded model.
     """
+    # Counts and sparsity are cached on the engine when the model is loaded
     return {
         "model_version": project_engine.model_version,
         "model_loaded": MODEL_LOADED,
-        "num_users": (
-            len(project_engine.user_index) if project_engine.user_item_matrix is not None else 0
-        ),
-        "num_projects": (
-            len(project_engine.item_index) if project_engine.user_item_matrix is not None else 0
-        ),
-        "matrix_sparsity": (
-            1
-            - (
-                project_engine.user_item_matrix.astype(bool).sum().sum()
-                / project_engine.user_item_matrix.size
-            )
-            if project_engine.user_item_matrix is not None
-            else None
-        ),
+        **project_engine.matrix_stats,
     }
 
 
 # ==================== Feature Extraction ====================
 
 
+def _feature_response(features: np.ndarray) -> ORJSONResponse:
+    """
+    Serialize a feature vector straight from its buffer.
+
+    orjson (OPT_SERIALIZE_NUMPY) reads contiguous numpy arrays natively, so no
+    per-element Python floats are materialized.
+    """
+    features = np.ascontiguousarray(features, dtype=np.float32)
+    return ORJSONResponse(content={"features": features, "feature_length": features.shape[0]})
+
+
 @app.post("/api/v1/features/developer")
 async def extract_developer_features(developer: DeveloperProfile):
     """
     Extract feature vector from developer profile for debugging/analysis.
     """
     try:
-        features = feature_extractor.extract_developer_features(developer.dict())
-        return {"features": features.tolist(), "feature_length": len(features)}
+        features = feature_extractor.extract_developer_features(
+            developer.model_dump(), skill_ids=developer.skill_ids
+        )
+        return _feature_response(features)
     except Exception as e:
         logger.error(f"Error extracting developer features: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -344,8 +514,10 @@ async def extract_project_features(project: Project):
     Extract feature vector from project for debugging/analysis.
     """
     try:
-        features = feature_extractor.extract_project_features(project.dict())
-        return {"features": features.tolist(), "feature_length": len(features)}
+        features = feature_extractor.extract_project_features(
+            project.model_dump(), skill_ids=project.skill_ids
+        )
+        return _feature_response(features)
     except Exception as e:
         logger.error(f"Error extracting project features: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -357,4 +529,13 @@ if __name__ == "__main__":
     import uvicorn
 
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+
+    # Run as `python -m api.main` from ml_service/
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+    )
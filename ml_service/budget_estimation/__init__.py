@@ -1,12 +1,24 @@
 """Budget Estimation Package"""
 
-from .budget_estimator import BudgetEstimator
-from .feature_engineering import ProjectFeatureExtractor, MarketRateCalculator
-from .model_trainer import ModelTrainer
-
 __all__ = [
     'BudgetEstimator',
     'ProjectFeatureExtractor',
     'MarketRateCalculator',
     'ModelTrainer'
 ]
+
+
+def __getattr__(name):
+    # Exports are imported on first use: ModelTrainer pulls in
+    # sklearn.model_selection, which the API never needs, and the
+    # recommendation API imports only budget_estimation.middleware
+    if name == 'ModelTrainer':
+        from .model_trainer import ModelTrainer
+        return ModelTrainer
+    if name == 'BudgetEstimator':
+        from .budget_estimator import BudgetEstimator
+        return BudgetEstimator
+    if name in ('ProjectFeatureExtractor', 'MarketRateCalculator'):
+        from . import feature_engineering
+        return getattr(feature_engineering, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,60 +3,74 @@ FastAPI Budget Estimation Service
 High-performance API for ML-powered budget estimation
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import orjson
 import os
 import time
 
-# Import budget estimation models
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from threadpoolctl import threadpool_limits
 
+# Import budget estimation models (run from ml_service/ so the package resolves)
 from budget_estimation import BudgetEstimator, MarketRateCalculator
+from budget_estimation.batching import MicroBatcher
+from budget_estimation.middleware import FastCORSMiddleware
+
+# Cap BLAS/OpenMP threads per process: with several workers, each using
+# every core for intra-op parallelism oversubscribes the CPU
+threadpool_limits(limits=int(os.getenv("BLAS_THREADS", "1")))
 
 # ==================== Pydantic Models ====================
 
 class ProjectDetails(BaseModel):
     """Project details for budget estimation"""
+    
+    # Request-only DTO: ignore unknown fields and skip per-assignment validation
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
     description: str = Field(..., min_length=10, description="Project description")
-    required_skills: List[str] = Field(..., min_items=1, description="Required skills")
-    estimated_hours: Optional[int] = Field(160, ge=1, description="Estimated hours")
-    complexity_level: Optional[str] = Field("medium", description="Complexity level")
-    project_type: Optional[str] = Field("web_app", description="Project type")
-    region: Optional[str] = Field("Global", description="Geographic region")
-    estimated_duration_weeks: Optional[int] = Field(4, ge=1, description="Duration in weeks")
-    initial_budget_min: Optional[float] = Field(None, description="Client min budget")
-    initial_budget_max: Optional[float] = Field(None, description="Client max budget")
-    currency: Optional[str] = Field("USD", description="Currency code")
+    required_skills: list[str] = Field(..., min_length=1, description="Required skills")
+    estimated_hours: int | None = Field(160, ge=1, description="Estimated hours")
+    complexity_level: str | None = Field("medium", description="Complexity level")
+    project_type: str | None = Field("web_app", description="Project type")
+    region: str | None = Field("Global", description="Geographic region")
+    estimated_duration_weeks: int | None = Field(4, ge=1, description="Duration in weeks")
+    initial_budget_min: float | None = Field(None, description="Client min budget")
+    initial_budget_max: float | None = Field(None, description="Client max budget")
+    currency: str | None = Field("USD", description="Currency code")
 
 
 class BudgetEstimateResponse(BaseModel):
     """Budget estimation response"""
     estimated_budget: float
-    confidence_interval: Dict[str, float]
-    budget_breakdown: Dict[str, float]
-    market_insights: Dict[str, Any]
+    confidence_interval: dict[str, float]
+    budget_breakdown: dict[str, float]
+    market_insights: dict[str, Any]
     recommendation: str
     model_version: str
     model_confidence_score: float
-    warning_flags: List[str]
+    warning_flags: list[str]
     response_time_ms: float
 
 
 class MarketRateRequest(BaseModel):
     """Market rate inquiry request"""
-    skills: List[str] = Field(..., min_items=1)
-    region: Optional[str] = Field("Global")
-    hours: Optional[int] = Field(160, ge=1)
+    skills: list[str] = Field(..., min_length=1)
+    region: str | None = Field("Global")
+    hours: int | None = Field(160, ge=1)
 
 
 class MarketRateResponse(BaseModel):
     """Market rate response"""
-    skill_premiums: Dict[str, float]
-    estimated_budget_range: Dict[str, float]
+    skill_premiums: dict[str, float]
+    estimated_budget_range: dict[str, float]
     regional_adjustment: float
     average_hourly_rate: float
 
@@ -73,15 +87,15 @@ class BudgetValidationResponse(BaseModel):
     deviation_from_estimate: float
     deviation_percentage: float
     recommendation: str
-    warnings: List[str]
+    warnings: list[str]
 
 
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     model_loaded: bool
-    model_version: Optional[str]
-    model_info: Optional[Dict[str, Any]]
+    model_version: str | None
+    model_info: dict[str, Any] | None
 
 
 # ==================== FastAPI App ====================
@@ -89,34 +103,103 @@ class HealthResponse(BaseModel):
 app = FastAPI(
     title="Budget Estimation API",
     description="ML-powered project budget estimation service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware: any origin, credentials allowed (configure appropriately for production)
+# FastCORSMiddleware skips Starlette's generic Origin parsing on every request.
+app.add_middleware(FastCORSMiddleware)
 
 # Global model instance
-budget_estimator: Optional[BudgetEstimator] = None
+budget_estimator: BudgetEstimator | None = None
 market_calculator = MarketRateCalculator()
 
+
+def _estimate_batch(projects: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run queued estimate requests through the current model in one pass"""
+    return budget_estimator.estimate_budgets(projects, confidence_level=0.80)
+
+
+# Bounded pool for CPU-bound model calls so they don't block the event loop
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", os.cpu_count() or 4))
+model_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Caps in-flight model requests; excess callers wait here instead of piling up
+request_slots = asyncio.Semaphore(MAX_WORKERS * 2)
+
+# Concurrent /estimate requests are coalesced into one model call
+estimate_batcher = MicroBatcher(
+    _estimate_batch,
+    max_batch_size=int(os.getenv("BATCH_MAX_SIZE", 32)),
+    max_wait_ms=float(os.getenv("BATCH_MAX_WAIT_MS", 5)),
+    executor=model_executor
+)
+
+# Market-rate responses are pure functions of (skills, region, hours)
+MARKET_RATE_CACHE_TTL = int(os.getenv("CACHE_TTL", 3600))
+
+
+@lru_cache(maxsize=int(os.getenv("CACHE_MAX_SIZE", 8192)))
+def _market_rate_payload(
+    skills: tuple[str, ...],
+    region: str | None,
+    hours: int | None
+) -> tuple[bytes, str]:
+    """Compute and serialize the market-rate response for a canonical request"""
+    skill_list = list(skills)
+    
+    # Calculate skill premiums
+    skill_premiums = market_calculator.calculate_skill_premium(skill_list, region)
+    
+    # Estimate budget range
+    budget_min, budget_max = market_calculator.estimate_project_rate_range(
+        skill_list,
+        hours,
+        region
+    )
+    
+    # Calculate average hourly rate
+    avg_rate = sum(skill_premiums.values()) / len(skill_premiums) if skill_premiums else 0
+    
+    # Get regional adjustment
+    regional_adjustment = market_calculator.regional_adjustments.get(region, 1.0)
+    
+    body = orjson.dumps(
+        {
+            "skill_premiums": skill_premiums,
+            "estimated_budget_range": {
+                "min": round(budget_min, 2),
+                "max": round(budget_max, 2)
+            },
+            "regional_adjustment": regional_adjustment,
+            "average_hourly_rate": round(avg_rate, 2)
+        },
+        option=orjson.OPT_SERIALIZE_NUMPY
+    )
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    
+    return body, etag
+
 # ==================== Startup/Shutdown ====================
 
-@app.on_event("startup")
-async def startup_event():
-    """Load model on startup"""
-    global budget_estimator
+_model_load_attempted = False
+
+
+def load_budget_model():
+    """Load the model once per process; later calls are no-ops"""
+    global budget_estimator, _model_load_attempted
+    
+    if _model_load_attempted:
+        return
+    _model_load_attempted = True
     
     model_path = os.getenv("BUDGET_MODEL_PATH", "models/budget_estimator_latest.joblib")
     
     if os.path.exists(model_path):
         try:
-            budget_estimator = BudgetEstimator.load_model(model_path)
+            # Read weights now rather than on the first request
+            budget_estimator = BudgetEstimator.load_model(model_path, lazy=False)
             print(f"✓ Budget estimation model loaded from {model_path}")
         except Exception as e:
             print(f"✗ Failed to load model: {e}")
@@ -126,9 +209,24 @@ async def startup_event():
         print("  Train and save a model to enable budget estimation")
 
 
+# Load at import so `gunicorn --preload` reads the model once in the master
+# and forked workers share its pages
+if os.getenv("PRELOAD_MODEL", "true").lower() == "true":
+    load_budget_model()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Load model on startup unless it was preloaded"""
+    load_budget_model()
+    estimate_batcher.start()
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
+    await estimate_batcher.stop()
+    model_executor.shutdown(wait=False)
     print("Budget Estimation API shutting down...")
 
 
@@ -141,7 +239,7 @@ async def health_check():
     if budget_estimator and budget_estimator.is_trained:
         model_info = budget_estimator.get_model_info()
     
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy" if budget_estimator else "degraded",
         model_loaded=budget_estimator is not None and budget_estimator.is_trained,
         model_version=budget_estimator.model_version if budget_estimator else None,
@@ -149,7 +247,10 @@ async def health_check():
     )
 
 
-@app.post("/api/v1/budget/estimate", response_model=BudgetEstimateResponse)
+@app.post(
+    "/api/v1/budget/estimate",
+    responses={200: {"model": BudgetEstimateResponse}}
+)
 async def estimate_budget(project: ProjectDetails):
     """
     Estimate budget for a project
@@ -166,13 +267,11 @@ async def estimate_budget(project: ProjectDetails):
     
     try:
         # Convert to dict
-        project_dict = project.dict()
+        project_dict = project.model_dump()
         
-        # Get estimation
-        result = budget_estimator.estimate_budget(
-            project_details=project_dict,
-            confidence_level=0.80
-        )
+        # Get estimation (batched with other in-flight requests)
+        async with request_slots:
+            result = await estimate_batcher.submit(project_dict)
         
         # Calculate response time
         response_time_ms = (time.time() - start_time) * 1000
@@ -180,7 +279,8 @@ async def estimate_budget(project: ProjectDetails):
         # Add response time to result
         result['response_time_ms'] = round(response_time_ms, 2)
         
-        return BudgetEstimateResponse(**result)
+        # Result already matches BudgetEstimateResponse; skip re-validation
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         raise HTTPException(
@@ -189,52 +289,47 @@ async def estimate_budget(project: ProjectDetails):
         )
 
 
-@app.post("/api/v1/budget/market-rates", response_model=MarketRateResponse)
-async def get_market_rates(request: MarketRateRequest):
+@app.post(
+    "/api/v1/budget/market-rates",
+    responses={200: {"model": MarketRateResponse}}
+)
+async def get_market_rates(
+    request: MarketRateRequest,
+    if_none_match: str | None = Header(None)
+):
     """
     Get market rates for specified skills and region
+    
+    Responses are memoized per (skills, region, hours) and carry an ETag so
+    clients can revalidate with If-None-Match.
     """
     try:
-        # Calculate skill premiums
-        skill_premiums = market_calculator.calculate_skill_premium(
-            request.skills,
-            request.region
-        )
-        
-        # Estimate budget range
-        budget_min, budget_max = market_calculator.estimate_project_rate_range(
-            request.skills,
-            request.hours,
-            request.region
-        )
-        
-        # Calculate average hourly rate
-        avg_rate = sum(skill_premiums.values()) / len(skill_premiums) if skill_premiums else 0
-        
-        # Get regional adjustment
-        regional_adjustment = market_calculator.regional_adjustments.get(
+        body, etag = _market_rate_payload(
+            tuple(sorted(request.skills)),
             request.region,
-            1.0
-        )
-        
-        return MarketRateResponse(
-            skill_premiums=skill_premiums,
-            estimated_budget_range={
-                "min": round(budget_min, 2),
-                "max": round(budget_max, 2)
-            },
-            regional_adjustment=regional_adjustment,
-            average_hourly_rate=round(avg_rate, 2)
+            request.hours
         )
-        
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Market rate calculation failed: {str(e)}"
         )
+    
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={MARKET_RATE_CACHE_TTL}"
+    }
+    
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
-@app.post("/api/v1/budget/validate", response_model=BudgetValidationResponse)
+@app.post(
+    "/api/v1/budget/validate",
+    responses={200: {"model": BudgetValidationResponse}}
+)
 async def validate_budget(request: BudgetValidationRequest):
     """
     Validate if a proposed budget is realistic
@@ -247,8 +342,9 @@ async def validate_budget(request: BudgetValidationRequest):
     
     try:
         # Get ML estimate
-        project_dict = request.project_details.dict()
-        result = budget_estimator.estimate_budget(project_dict)
+        project_dict = request.project_details.model_dump()
+        async with request_slots:
+            result = await estimate_batcher.submit(project_dict)
         
         estimated_budget = result['estimated_budget']
         ci_lower = result['confidence_interval']['lower_bound']
@@ -283,13 +379,13 @@ async def validate_budget(request: BudgetValidationRequest):
             elif hourly_rate > 200:
                 warnings.append(f"Implied hourly rate (${hourly_rate:.2f}) is very high")
         
-        return BudgetValidationResponse(
-            is_realistic=is_realistic,
-            deviation_from_estimate=round(deviation, 2),
-            deviation_percentage=round(deviation_pct, 2),
-            recommendation=recommendation,
-            warnings=warnings
-        )
+        return ORJSONResponse(content={
+            'is_realistic': bool(is_realistic),
+            'deviation_from_estimate': round(deviation, 2),
+            'deviation_percentage': round(deviation_pct, 2),
+            'recommendation': recommendation,
+            'warnings': warnings
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -316,7 +412,7 @@ async def reload_model(background_tasks: BackgroundTasks):
         )
     
     try:
-        budget_estimator = BudgetEstimator.load_model(model_path)
+        budget_estimator = BudgetEstimator.load_model(model_path, lazy=False)
         
         return {
             "status": "success",
@@ -350,10 +446,13 @@ if __name__ == "__main__":
     
     port = int(os.getenv("PORT", 8001))
     
+    # Run as `python -m budget_estimation.api.main` from ml_service/
     uvicorn.run(
-        "main:app",
+        "budget_estimation.api.main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        reload=os.getenv("ENV") == "dev",
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
@@ -0,0 +1,106 @@
+"""
+Request Micro-Batching
+Coalesces concurrent single-item requests into one batched model call
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class MicroBatcher:
+    """Collect concurrent submissions and run them through one batch function"""
+    
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            batch_fn: Callable mapping a list of items to a list of results
+                      in the same order
+            max_batch_size: Upper bound on items handed to one batch_fn call
+            max_wait_ms: How long the first queued item waits for company
+            executor: Where batch_fn runs, keeping it off the event loop
+                      (None uses the loop's default executor)
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight = set()
+    
+    def start(self):
+        """Start the background batching task on the running event loop"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        """Cancel the background task and fail any requests still queued"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped"))
+    
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its individual result"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Keep collecting while the executor works on this batch
+            task = loop.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run one batch in the executor and resolve the waiting futures"""
+        items = [item for item, _ in batch]
+        loop = asyncio.get_running_loop()
+        
+        try:
+            results = await loop.run_in_executor(self.executor, self.batch_fn, items)
+        except Exception as e:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            # Isolate the failing item so one bad request doesn't fail the rest
+            await asyncio.gather(*(self._dispatch([entry]) for entry in batch))
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
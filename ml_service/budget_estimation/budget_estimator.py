@@ -6,39 +6,213 @@ Machine learning models for predicting project budgets with confidence intervals
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Tuple, Optional
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
 from sklearn.linear_model import Ridge
-from sklearn.model_selection import cross_val_score
+from sklearn.exceptions import ConvergenceWarning
 import joblib
+from joblib import Parallel, cpu_count, delayed
 import json
+import logging
+import os
+import pickle
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property, lru_cache
+from statistics import NormalDist
 import warnings
-warnings.filterwarnings('ignore')
 
 from .feature_engineering import ProjectFeatureExtractor, MarketRateCalculator
 
+logger = logging.getLogger(__name__)
+
+
+# Phase distribution templates
+PHASE_DISTRIBUTIONS = {
+    'web_app': {
+        'planning_and_design': 0.15,
+        'development': 0.50,
+        'testing_and_qa': 0.15,
+        'deployment_and_launch': 0.05,
+        'buffer_contingency': 0.15
+    },
+    'mobile_app': {
+        'planning_and_design': 0.20,
+        'development': 0.45,
+        'testing_and_qa': 0.20,
+        'deployment_and_launch': 0.05,
+        'buffer_contingency': 0.10
+    },
+    'api': {
+        'planning_and_design': 0.10,
+        'development': 0.60,
+        'testing_and_qa': 0.15,
+        'deployment_and_launch': 0.05,
+        'buffer_contingency': 0.10
+    },
+    'data': {
+        'planning_and_design': 0.25,
+        'development': 0.40,
+        'testing_and_qa': 0.20,
+        'deployment_and_launch': 0.05,
+        'buffer_contingency': 0.10
+    },
+    'default': {
+        'planning_and_design': 0.15,
+        'development': 0.50,
+        'testing_and_qa': 0.15,
+        'deployment_and_launch': 0.05,
+        'buffer_contingency': 0.15
+    }
+}
+
+# Buffer adjustment by complexity (taken from development)
+COMPLEXITY_BUFFER_ADJUSTMENT = {
+    'low': -0.05,
+    'medium': 0.0,
+    'high': 0.05,
+    'expert': 0.10
+}
+
+# Skills (lowercase) that raise the market demand factor
+PREMIUM_DEMAND_SKILLS = frozenset({'ai', 'ml', 'blockchain', 'web3'})
+
+# Skills (lowercase) that trigger the high-demand recommendation note
+HIGH_DEMAND_SKILLS = PREMIUM_DEMAND_SKILLS | {'rust'}
+
+PHASE_NAMES = (
+    'planning_and_design',
+    'development',
+    'testing_and_qa',
+    'deployment_and_launch',
+    'buffer_contingency'
+)
+
+# Warning messages, in the order _check_warning_flags reports them
+WARNING_MESSAGES = (
+    "Missing project description - estimate may be inaccurate",
+    "No skills specified - using general estimates",
+    "Estimated hourly rate exceeds $200 - verify project requirements",
+    "Estimated hourly rate below $20 - may be unrealistic",
+    "Estimate outside provided budget range - review project scope"
+)
+
+
+def _adjusted_phase_fractions(project_type: str, complexity: str) -> Tuple[float, ...]:
+    """Phase fractions for a project type with the complexity buffer applied"""
+    distribution = dict(PHASE_DISTRIBUTIONS[project_type])
+    buffer_adjustment = COMPLEXITY_BUFFER_ADJUSTMENT[complexity]
+    distribution['buffer_contingency'] += buffer_adjustment
+    distribution['development'] -= buffer_adjustment  # Compensate
+    return tuple(distribution[phase] for phase in PHASE_NAMES)
+
+
+# Final fractions per (project_type, complexity), computed once at import
+PHASE_FRACTIONS = {
+    (project_type, complexity): _adjusted_phase_fractions(project_type, complexity)
+    for project_type in PHASE_DISTRIBUTIONS
+    for complexity in COMPLEXITY_BUFFER_ADJUSTMENT
+}
+
+def _as_tree_input(X: np.ndarray) -> np.ndarray:
+    """C-contiguous float32 copy of X, the layout sklearn's forests work on"""
+    return np.ascontiguousarray(X, dtype=np.float32)
+
+
+def _model_input(model: Any, X: np.ndarray, X_trees: np.ndarray) -> np.ndarray:
+    """Forests get the shared float32 matrix, other models the float64 one"""
+    return X_trees if isinstance(model, RandomForestRegressor) else X
+
+
+@contextmanager
+def _suppress_fit_warnings():
+    """Silence routine sklearn fit warnings without touching global filters"""
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=ConvergenceWarning)
+        warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+        yield
+
+
+# Per-thread random generators, so concurrent estimates never contend on the
+# global NumPy RNG state
+_thread_local = threading.local()
+
+
+def _thread_rng() -> np.random.Generator:
+    """Return this thread's random generator, creating it on first use"""
+    rng = getattr(_thread_local, 'rng', None)
+    if rng is None:
+        rng = _thread_local.rng = np.random.default_rng()
+    return rng
+
+
+def _fit_extract_features(
+    feature_extractor: ProjectFeatureExtractor,
+    training_data: pd.DataFrame
+) -> Tuple[ProjectFeatureExtractor, np.ndarray]:
+    """Fit the extractor on training data; returns the fitted extractor and features"""
+    X = feature_extractor.extract_features(training_data, fit=True)
+    return feature_extractor, X
+
 
 class BudgetEstimator:
-    """Main budget estimation model with confidence intervals"""
+    """
+    Main budget estimation model with confidence intervals
+    
+    Once trained or loaded, estimation only reads model state: randomness
+    comes from per-thread generators, phase tables are module constants and
+    lazily loaded weights are read under a lock. One instance can therefore
+    serve concurrent estimate_budget(s) calls from a thread pool. train()
+    mutates the instance and must not run concurrently with estimation;
+    reloads should build a new instance and swap the reference.
+    """
+    
+    # Below this many rows, thread dispatch costs more than it saves
+    PARALLEL_PREDICT_MIN_ROWS = 512
     
-    def __init__(self, model_version: str = "1.0.0"):
+    # Trees are fit on all cores but predicted on one: per-request batches
+    # are small, and API workers already run in parallel
+    PREDICT_N_JOBS = 1
+    
+    def __init__(self, model_version: str = "1.0.0", memory: Optional[str] = None):
+        """
+        Args:
+            model_version: Version tag stored with the model
+            memory: Optional cache directory. Feature extraction in train() is
+                    then memoized on disk, keyed on the training data and the
+                    extractor's state, so repeated retrains on the same data
+                    skip re-extraction.
+        """
         self.model_version = model_version
         self.feature_extractor = ProjectFeatureExtractor()
         self.market_calculator = MarketRateCalculator()
+        self.memory = joblib.Memory(location=memory, verbose=0) if memory else None
+        
+        # Set by load_model when weights live in a separate file not yet read
+        self._weights_path = None
+        self._weights_mmap_mode = None
+        self._weights_lock = threading.Lock()
+        self._base_model_names = None
         
         # Primary prediction model (ensemble)
         self.base_models = [
+            # 100 trees of depth 10 on 70% bootstrap samples: predict cost
+            # scales with trees x leaves, and deeper/more trees add little
+            # on training sets of this size
             RandomForestRegressor(
-                n_estimators=200,
-                max_depth=15,
+                n_estimators=100,
+                max_depth=10,
                 min_samples_split=5,
                 min_samples_leaf=2,
+                max_samples=0.7,
                 random_state=42,
                 n_jobs=-1
             ),
-            GradientBoostingRegressor(
-                n_estimators=100,
-                max_depth=5,
+            # Histogram-based boosting: bins features instead of scanning
+            # every split point, so it trains far faster than exact GBRT
+            HistGradientBoostingRegressor(
+                max_iter=200,
+                max_depth=6,
                 learning_rate=0.1,
                 random_state=42
             ),
@@ -59,7 +233,73 @@ class BudgetEstimator:
         self.training_date = None
         self.training_samples = 0
         self.feature_importance = None
-        
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle/copy state without the weights lock, which cannot be pickled"""
+        state = self.__dict__.copy()
+        del state['_weights_lock']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._weights_lock = threading.Lock()
+        
+    @property
+    def base_models(self) -> List[Any]:
+        """Ensemble members (loaded from the weights file on first access)"""
+        if self._weights_path is not None:
+            self.load_weights()
+        return self._base_models
+    
+    @base_models.setter
+    def base_models(self, models: List[Any]):
+        self._base_models = models
+        self._base_model_names = [type(model).__name__ for model in models]
+        self._invalidate_model_info()
+    
+    @property
+    def uncertainty_model(self) -> Any:
+        """Error regressor (loaded from the weights file on first access)"""
+        if self._weights_path is not None:
+            self.load_weights()
+        return self._uncertainty_model
+    
+    @uncertainty_model.setter
+    def uncertainty_model(self, model: Any):
+        self._uncertainty_model = model
+    
+    @property
+    def ensemble_weights(self) -> np.ndarray:
+        """Per-model weights as a float64 array normalized to sum to 1"""
+        return self._ensemble_weights
+    
+    @ensemble_weights.setter
+    def ensemble_weights(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        total_weight = weights.sum()
+        if not np.isclose(total_weight, 1.0):
+            weights = weights / total_weight
+        self._ensemble_weights = weights
+        self._invalidate_model_info()
+    
+    def _use_predict_n_jobs(self, models: List[Any]):
+        """Switch fitted models that support n_jobs to PREDICT_N_JOBS"""
+        for model in models:
+            if 'n_jobs' in model.get_params():
+                model.set_params(n_jobs=self.PREDICT_N_JOBS)
+    
+    def load_weights(self):
+        """Read the fitted models saved by save_model, if not loaded yet"""
+        with self._weights_lock:
+            if self._weights_path is None:
+                return
+            
+            weights = joblib.load(self._weights_path, mmap_mode=self._weights_mmap_mode)
+            self._base_models = weights['base_models']
+            self._uncertainty_model = weights['uncertainty_model']
+            self._use_predict_n_jobs(self._base_models)
+            self._weights_path = None
+    
     def train(self, training_data: pd.DataFrame) -> Dict[str, float]:
         """
         Train the budget estimation model
@@ -70,28 +310,47 @@ class BudgetEstimator:
         Returns:
             Training metrics
         """
-        print(f"Training budget estimation model v{self.model_version}...")
+        logger.info(f"Training budget estimation model v{self.model_version}...")
         
         # Validate training data
         if len(training_data) < 50:
             raise ValueError("Insufficient training data. Need at least 50 samples.")
         
-        # Extract features and target
-        X = self.feature_extractor.extract_features(training_data, fit=True)
-        y = training_data['final_budget'].values
+        # Contiguous float64 target, so sklearn's fit loops never copy or upcast
+        # it; checked before feature extraction so bad labels fail cheaply
+        y = np.ascontiguousarray(training_data['final_budget'].to_numpy(dtype=np.float64))
+        if not np.isfinite(y).all():
+            raise ValueError("final_budget contains missing or non-finite values.")
+        
+        # Extract features
+        if self.memory is not None:
+            # The fitted extractor is cached alongside X, since fitting is the
+            # side effect that later predictions depend on
+            self.feature_extractor, X = self.memory.cache(_fit_extract_features)(
+                self.feature_extractor, training_data
+            )
+        else:
+            X = self.feature_extractor.extract_features(training_data, fit=True)
+        
+        # Forests convert X to float32 internally; do it once for all of them
+        X_trees = _as_tree_input(X)
         
         # Train base models
-        for i, model in enumerate(self.base_models):
-            print(f"Training base model {i+1}/{len(self.base_models)}...")
-            model.fit(X, y)
+        with _suppress_fit_warnings():
+            for i, model in enumerate(self.base_models):
+                logger.info(f"Training base model {i+1}/{len(self.base_models)}...")
+                model.fit(_model_input(model, X, X_trees), y)
         
         # Generate predictions for uncertainty estimation
-        predictions = self._ensemble_predict(X)
+        predictions = self._ensemble_predict(X, X_trees)
         prediction_errors = np.abs(predictions - y)
         
         # Train uncertainty model
-        print("Training uncertainty estimation model...")
-        self.uncertainty_model.fit(X, prediction_errors)
+        logger.info("Training uncertainty estimation model...")
+        with _suppress_fit_warnings():
+            self.uncertainty_model.fit(
+                _model_input(self.uncertainty_model, X, X_trees), prediction_errors
+            )
         
         # Calculate feature importance (from Random Forest)
         if hasattr(self.base_models[0], 'feature_importances_'):
@@ -101,24 +360,38 @@ class BudgetEstimator:
         self.is_trained = True
         self.training_date = datetime.now()
         self.training_samples = len(training_data)
+        self._invalidate_model_info()
+        self._use_predict_n_jobs(self.base_models)
         
         # Calculate training metrics
         metrics = self._calculate_metrics(y, predictions, prediction_errors)
         
-        print(f"Training complete! MAE: {metrics['mae']:.2f}, R²: {metrics['r2']:.4f}")
+        logger.info(f"Training complete! MAE: {metrics['mae']:.2f}, R²: {metrics['r2']:.4f}")
         
         return metrics
     
-    def _ensemble_predict(self, X: np.ndarray) -> np.ndarray:
+    def _ensemble_predict(self, X: np.ndarray, X_trees: Optional[np.ndarray] = None) -> np.ndarray:
         """Make ensemble predictions using weighted average"""
-        predictions = []
+        if X_trees is None:
+            X_trees = _as_tree_input(X)
+        
+        if X.shape[0] >= self.PARALLEL_PREDICT_MIN_ROWS and cpu_count() > 1:
+            # Tree predict paths release the GIL, so threads avoid pickling X
+            predictions = Parallel(n_jobs=len(self.base_models), backend='threading')(
+                delayed(model.predict)(_model_input(model, X, X_trees))
+                for model in self.base_models
+            )
+        else:
+            predictions = (
+                model.predict(_model_input(model, X, X_trees)) for model in self.base_models
+            )
         
-        for model in self.base_models:
-            pred = model.predict(X)
-            predictions.append(pred)
+        # Accumulate weighted predictions in place instead of stacking them
+        ensemble_pred = np.zeros(X.shape[0], dtype=np.float64)
         
-        # Weighted average
-        ensemble_pred = np.average(predictions, axis=0, weights=self.ensemble_weights)
+        # Weights are normalized when set, so no final division is needed
+        for weight, pred in zip(self.ensemble_weights, predictions):
+            ensemble_pred += weight * pred
         
         return ensemble_pred
     
@@ -136,28 +409,132 @@ class BudgetEstimator:
             
         Returns:
             Budget estimation with confidence intervals and breakdown
+            
+        Raises:
+            ValueError: If confidence_level is not strictly between 0 and 1
+        """
+        return self.estimate_budgets([project_details], confidence_level)[0]
+    
+    def estimate_budgets(
+        self,
+        projects: List[Dict[str, Any]],
+        confidence_level: float = 0.80
+    ) -> List[Dict[str, Any]]:
+        """
+        Estimate budgets for several projects with one model pass
+        
+        Features for all projects are extracted together and each model's
+        predict() is called once on the stacked matrix.
+        
+        Args:
+            projects: List of project information dicts
+            confidence_level: Confidence level for intervals (default 0.80)
+            
+        Returns:
+            Budget estimations in the same order as ``projects``
+            
+        Raises:
+            ValueError: If confidence_level is not strictly between 0 and 1
         """
         if not self.is_trained:
             raise RuntimeError("Model must be trained before making predictions")
         
-        # Extract features
-        features = self.feature_extractor.extract_single_project_features(project_details)
+        if not projects:
+            return []
+        
+        X = self.feature_extractor.extract_records_features(projects)
+        base_estimates, error_estimates, lower_bounds, upper_bounds = (
+            self._predict_with_intervals(X, confidence_level)
+        )
+        
+        # Average hourly rates, left at 0 where hours are missing or not positive
+        hours = np.fromiter(
+            (project.get('estimated_hours', 160) or 0 for project in projects),
+            dtype=np.float64,
+            count=len(projects)
+        )
+        hourly_rates = np.divide(
+            base_estimates, hours, out=np.zeros_like(base_estimates), where=hours > 0
+        )
         
-        # Generate base prediction
-        base_estimate = self._ensemble_predict(features.reshape(1, -1))[0]
+        # tolist() yields Python floats, keeping per-estimate arithmetic off NumPy scalars
+        return [
+            self._build_estimate(
+                project, base_estimate, error_estimate,
+                (lower_bound, upper_bound), hourly_rate, confidence_level
+            )
+            for project, base_estimate, error_estimate, lower_bound, upper_bound, hourly_rate
+            in zip(
+                projects,
+                base_estimates.tolist(),
+                error_estimates.tolist(),
+                lower_bounds.tolist(),
+                upper_bounds.tolist(),
+                hourly_rates.tolist()
+            )
+        ]
+    
+    def estimate_budget_batch(
+        self,
+        projects_df: pd.DataFrame,
+        confidence_level: float = 0.80
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Point estimates and confidence bounds for a DataFrame of projects
         
-        # Estimate uncertainty
-        error_estimate = self.uncertainty_model.predict(features.reshape(1, -1))[0]
+        Array-only counterpart of estimate_budgets for evaluation and bulk
+        scoring: no breakdowns, insights or per-project dicts are built.
         
-        # Calculate confidence interval based on confidence level
-        z_score = self._get_z_score(confidence_level)
-        margin = error_estimate * z_score
+        Args:
+            projects_df: DataFrame with one project per row
+            confidence_level: Confidence level for intervals (default 0.80)
+            
+        Returns:
+            Tuple of (estimates, lower_bounds, upper_bounds) arrays
+            
+        Raises:
+            ValueError: If confidence_level is not strictly between 0 and 1
+        """
+        if not self.is_trained:
+            raise RuntimeError("Model must be trained before making predictions")
         
-        confidence_interval = {
-            'lower_bound': max(0, base_estimate - margin),
-            'upper_bound': base_estimate + margin,
-            'confidence_level': confidence_level
-        }
+        X = self.feature_extractor.extract_features(projects_df, fit=False)
+        base_estimates, _, lower_bounds, upper_bounds = self._predict_with_intervals(
+            X, confidence_level
+        )
+        return base_estimates, lower_bounds, upper_bounds
+    
+    def _predict_with_intervals(
+        self,
+        X: np.ndarray,
+        confidence_level: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Ensemble estimates, error estimates and interval bounds for a feature matrix"""
+        X_trees = _as_tree_input(X)
+        base_estimates = self._ensemble_predict(X, X_trees)
+        error_estimates = self.uncertainty_model.predict(
+            _model_input(self.uncertainty_model, X, X_trees)
+        )
+        
+        # Confidence intervals for the whole batch in a few in-place array ops
+        margins = error_estimates * self._get_z_score(confidence_level)
+        upper_bounds = base_estimates + margins
+        lower_bounds = np.subtract(base_estimates, margins, out=margins)
+        np.maximum(lower_bounds, 0.0, out=lower_bounds)
+        
+        return base_estimates, error_estimates, lower_bounds, upper_bounds
+    
+    def _build_estimate(
+        self,
+        project_details: Dict[str, Any],
+        base_estimate: float,
+        error_estimate: float,
+        bounds: Tuple[float, float],
+        hourly_rate: float,
+        confidence_level: float
+    ) -> Dict[str, Any]:
+        """Assemble the estimation result from raw model outputs and interval bounds"""
+        lower_bound, upper_bound = bounds
         
         # Generate budget breakdown
         breakdown = self._generate_budget_breakdown(
@@ -166,7 +543,7 @@ class BudgetEstimator:
         )
         
         # Get market insights
-        market_insights = self._get_market_insights(project_details, base_estimate)
+        market_insights = self._get_market_insights(project_details, base_estimate, hourly_rate)
         
         # Generate recommendation
         recommendation = self._generate_recommendation(
@@ -186,8 +563,8 @@ class BudgetEstimator:
         return {
             'estimated_budget': round(base_estimate, 2),
             'confidence_interval': {
-                'lower_bound': round(confidence_interval['lower_bound'], 2),
-                'upper_bound': round(confidence_interval['upper_bound'], 2),
+                'lower_bound': round(lower_bound, 2),
+                'upper_bound': round(upper_bound, 2),
                 'confidence_level': confidence_level
             },
             'budget_breakdown': breakdown,
@@ -208,64 +585,18 @@ class BudgetEstimator:
         project_type = project_details.get('project_type', 'web_app').lower()
         complexity = project_details.get('complexity_level', 'medium').lower()
         
-        # Phase distribution templates
-        phase_distributions = {
-            'web_app': {
-                'planning_and_design': 0.15,
-                'development': 0.50,
-                'testing_and_qa': 0.15,
-                'deployment_and_launch': 0.05,
-                'buffer_contingency': 0.15
-            },
-            'mobile_app': {
-                'planning_and_design': 0.20,
-                'development': 0.45,
-                'testing_and_qa': 0.20,
-                'deployment_and_launch': 0.05,
-                'buffer_contingency': 0.10
-            },
-            'api': {
-                'planning_and_design': 0.10,
-                'development': 0.60,
-                'testing_and_qa': 0.15,
-                'deployment_and_launch': 0.05,
-                'buffer_contingency': 0.10
-            },
-            'data': {
-                'planning_and_design': 0.25,
-                'development': 0.40,
-                'testing_and_qa': 0.20,
-                'deployment_and_launch': 0.05,
-                'buffer_contingency': 0.10
-            },
-            'default': {
-                'planning_and_design': 0.15,
-                'development': 0.50,
-                'testing_and_qa': 0.15,
-                'deployment_and_launch': 0.05,
-                'buffer_contingency': 0.15
-            }
-        }
-        
-        # Select appropriate distribution
-        distribution = phase_distributions.get(project_type, phase_distributions['default'])
-        
-        # Adjust buffer based on complexity
-        complexity_buffer_adjustment = {
-            'low': -0.05,
-            'medium': 0.0,
-            'high': 0.05,
-            'expert': 0.10
-        }
+        # Unknown types use the default template; unknown complexity gets no adjustment
+        if project_type not in PHASE_DISTRIBUTIONS:
+            project_type = 'default'
+        if complexity not in COMPLEXITY_BUFFER_ADJUSTMENT:
+            complexity = 'medium'
         
-        buffer_adjustment = complexity_buffer_adjustment.get(complexity, 0.0)
-        distribution['buffer_contingency'] += buffer_adjustment
-        distribution['development'] -= buffer_adjustment  # Compensate
+        fractions = PHASE_FRACTIONS[(project_type, complexity)]
         
         # Calculate breakdown
         breakdown = {
-            phase: round(total_budget * percentage, 2)
-            for phase, percentage in distribution.items()
+            phase: round(total_budget * fraction, 2)
+            for phase, fraction in zip(PHASE_NAMES, fractions)
         }
         
         return breakdown
@@ -273,25 +604,25 @@ class BudgetEstimator:
     def _get_market_insights(
         self, 
         project_details: Dict[str, Any], 
-        estimated_budget: float
+        estimated_budget: float,
+        hourly_rate: float
     ) -> Dict[str, Any]:
         """Generate market insights for the project"""
         skills = project_details.get('required_skills', [])
         region = project_details.get('region', 'Global')
-        hours = project_details.get('estimated_hours', 160)
         
         # Get skill premiums
         skill_premiums = self.market_calculator.calculate_skill_premium(skills, region)
         
         # Calculate similar projects average (simulated - in production, query DB)
-        similar_projects_avg = estimated_budget * np.random.uniform(0.9, 1.1)
+        similar_projects_avg = estimated_budget * _thread_rng().uniform(0.9, 1.1)
         
         # Regional adjustment factor
         regional_adjustment = self.market_calculator.regional_adjustments.get(region, 1.0)
         
         # Market demand factor (simulated - in production, calculate from recent data)
         market_demand_factor = 1.0
-        if any(skill.lower() in ['ai', 'ml', 'blockchain', 'web3'] for skill in skills):
+        if not PREMIUM_DEMAND_SKILLS.isdisjoint(skill.lower() for skill in skills):
             market_demand_factor = 1.2
         
         return {
@@ -302,7 +633,7 @@ class BudgetEstimator:
             },
             'regional_adjustment': round(regional_adjustment, 2),
             'market_demand_factor': round(market_demand_factor, 2),
-            'average_hourly_rate': round(estimated_budget / hours if hours > 0 else 0, 2)
+            'average_hourly_rate': round(hourly_rate, 2)
         }
     
     def _generate_recommendation(
@@ -340,8 +671,7 @@ class BudgetEstimator:
         
         # Skills availability
         skills = project_details.get('required_skills', [])
-        high_demand_skills = ['ai', 'ml', 'blockchain', 'web3', 'rust']
-        if any(skill.lower() in high_demand_skills for skill in skills):
+        if not HIGH_DEMAND_SKILLS.isdisjoint(skill.lower() for skill in skills):
             recommendations.append("High-demand skills may command premium rates. Budget reflects current market premiums.")
         
         return " ".join(recommendations)
@@ -374,44 +704,30 @@ class BudgetEstimator:
         estimated_budget: float
     ) -> List[str]:
         """Check for warning flags in the estimation"""
-        warnings = []
-        
-        # Check for missing critical information
-        if not project_details.get('description'):
-            warnings.append("Missing project description - estimate may be inaccurate")
-        
-        if not project_details.get('required_skills'):
-            warnings.append("No skills specified - using general estimates")
-        
-        # Check for unrealistic estimates
         hours = project_details.get('estimated_hours', 0)
-        if hours > 0:
-            hourly_rate = estimated_budget / hours
-            if hourly_rate > 200:
-                warnings.append("Estimated hourly rate exceeds $200 - verify project requirements")
-            elif hourly_rate < 20:
-                warnings.append("Estimated hourly rate below $20 - may be unrealistic")
-        
-        # Check budget ranges
+        hourly_rate = estimated_budget / hours if hours > 0 else None
         budget_min = project_details.get('initial_budget_min', 0)
         budget_max = project_details.get('initial_budget_max', 0)
-        if budget_max > 0 and (estimated_budget < budget_min or estimated_budget > budget_max):
-            warnings.append("Estimate outside provided budget range - review project scope")
-        
-        return warnings
-    
-    def _get_z_score(self, confidence_level: float) -> float:
-        """Get z-score for confidence level"""
-        z_scores = {
-            0.50: 0.674,
-            0.60: 0.842,
-            0.70: 1.036,
-            0.80: 1.282,
-            0.90: 1.645,
-            0.95: 1.960,
-            0.99: 2.576
-        }
-        return z_scores.get(confidence_level, 1.282)
+        
+        # One flag per entry in WARNING_MESSAGES
+        flags = (
+            not project_details.get('description'),
+            not project_details.get('required_skills'),
+            hourly_rate is not None and hourly_rate > 200,
+            hourly_rate is not None and hourly_rate < 20,
+            budget_max > 0 and not budget_min <= estimated_budget <= budget_max
+        )
+        return [message for message, flag in zip(WARNING_MESSAGES, flags) if flag]
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_z_score(confidence_level: float) -> float:
+        """Get two-sided z-score for any confidence level in (0, 1), memoized per level"""
+        if not 0 < confidence_level < 1:
+            raise ValueError(
+                f"confidence_level must be between 0 and 1 (exclusive), got {confidence_level!r}"
+            )
+        return NormalDist().inv_cdf(0.5 + confidence_level / 2.0)
     
     def _calculate_metrics(
         self,
@@ -420,18 +736,24 @@ class BudgetEstimator:
         errors: np.ndarray
     ) -> Dict[str, float]:
         """Calculate model performance metrics"""
-        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        # One residual pass shared by every metric; `errors` is |y_pred - y_true|
+        residuals = y_true - y_pred
+        squared_error = np.dot(residuals, residuals)
+        pct_errors = errors / y_true
         
-        mae = mean_absolute_error(y_true, y_pred)
-        mse = mean_squared_error(y_true, y_pred)
-        rmse = np.sqrt(mse)
-        r2 = r2_score(y_true, y_pred)
+        mae = float(errors.mean())
+        mse = squared_error / len(y_true)
+        rmse = float(np.sqrt(mse))
+        
+        centered = y_true - y_true.mean()
+        total_variance = np.dot(centered, centered)
+        r2 = float(1 - squared_error / total_variance) if total_variance else 0.0
         
         # Calculate MAPE (Mean Absolute Percentage Error)
-        mape = np.mean(np.abs((y_true - y_pred) / y_true)) * 100
+        mape = float(pct_errors.mean() * 100)
         
         # Calculate accuracy within 10%
-        within_10_percent = np.mean(np.abs((y_true - y_pred) / y_true) <= 0.10) * 100
+        within_10_percent = float(np.count_nonzero(pct_errors <= 0.10) / len(y_true) * 100)
         
         return {
             'mae': mae,
@@ -441,16 +763,39 @@ class BudgetEstimator:
             'within_10_percent_accuracy': within_10_percent
         }
     
-    def save_model(self, filepath: str):
-        """Save trained model to disk"""
+    def save_model(self, filepath: str, compress: int = 0):
+        """
+        Save trained model to disk
+        
+        Metadata and the feature pipeline go to `filepath`; the fitted models
+        go to `filepath + '.weights'`, so tools that only need metadata never
+        read the forests.
+        
+        Args:
+            filepath: Model path (the metadata file)
+            compress: joblib compression level for the weights file. The
+                      default (0) keeps it uncompressed so load_model can
+                      memory-map it; compress for distribution/archival.
+        """
         if not self.is_trained:
             raise RuntimeError("Cannot save untrained model")
         
+        weights_path = filepath + '.weights'
+        joblib.dump(
+            {
+                'base_models': self.base_models,
+                'uncertainty_model': self.uncertainty_model
+            },
+            weights_path,
+            compress=compress,
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+        
         model_data = {
             'model_version': self.model_version,
-            'base_models': self.base_models,
+            'weights_file': os.path.basename(weights_path),
+            'base_model_names': self._base_model_names,
             'ensemble_weights': self.ensemble_weights,
-            'uncertainty_model': self.uncertainty_model,
             'feature_extractor': self.feature_extractor,
             'market_calculator': self.market_calculator,
             'training_date': self.training_date,
@@ -458,18 +803,31 @@ class BudgetEstimator:
             'feature_importance': self.feature_importance
         }
         
-        joblib.dump(model_data, filepath)
-        print(f"Model saved to {filepath}")
+        joblib.dump(model_data, filepath, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.info(f"Model saved to {filepath} (weights: {weights_path})")
     
     @classmethod
-    def load_model(cls, filepath: str) -> 'BudgetEstimator':
-        """Load trained model from disk"""
-        model_data = joblib.load(filepath)
+    def load_model(
+        cls,
+        filepath: str,
+        mmap_mode: Optional[str] = 'r',
+        lazy: bool = True
+    ) -> 'BudgetEstimator':
+        """
+        Load trained model from disk
+        
+        Large arrays are memory-mapped read-only by default, so worker
+        processes share them through the OS page cache instead of each
+        holding a private copy. Pass mmap_mode=None to read fully into memory.
+        
+        With lazy=True the fitted models are only read on first prediction;
+        metadata (get_model_info) is available immediately. Single-file models
+        saved by older versions are always loaded eagerly.
+        """
+        model_data = joblib.load(filepath, mmap_mode=mmap_mode)
         
         estimator = cls(model_version=model_data['model_version'])
-        estimator.base_models = model_data['base_models']
         estimator.ensemble_weights = model_data['ensemble_weights']
-        estimator.uncertainty_model = model_data['uncertainty_model']
         estimator.feature_extractor = model_data['feature_extractor']
         estimator.market_calculator = model_data['market_calculator']
         estimator.training_date = model_data['training_date']
@@ -477,19 +835,45 @@ class BudgetEstimator:
         estimator.feature_importance = model_data.get('feature_importance')
         estimator.is_trained = True
         
-        print(f"Model loaded from {filepath}")
-        print(f"Version: {estimator.model_version}, Trained: {estimator.training_date}")
+        if 'weights_file' in model_data:
+            estimator._base_model_names = model_data['base_model_names']
+            estimator._weights_path = os.path.join(
+                os.path.dirname(filepath), model_data['weights_file']
+            )
+            estimator._weights_mmap_mode = mmap_mode
+            if not lazy:
+                estimator.load_weights()
+        else:
+            estimator.base_models = model_data['base_models']
+            estimator.uncertainty_model = model_data['uncertainty_model']
+            estimator._use_predict_n_jobs(estimator.base_models)
+        
+        estimator._invalidate_model_info()
+        
+        logger.info(
+            f"Model loaded from {filepath} "
+            f"(version: {estimator.model_version}, trained: {estimator.training_date})"
+        )
         
         return estimator
     
-    def get_model_info(self) -> Dict[str, Any]:
-        """Get model metadata and information"""
+    @cached_property
+    def model_info(self) -> Dict[str, Any]:
+        """Model metadata, built once and reset by train/load_model"""
         return {
             'model_version': self.model_version,
             'is_trained': self.is_trained,
             'training_date': self.training_date.isoformat() if self.training_date else None,
             'training_samples': self.training_samples,
-            'base_models': [type(model).__name__ for model in self.base_models],
-            'ensemble_weights': self.ensemble_weights,
+            'base_models': self._base_model_names,
+            'ensemble_weights': self.ensemble_weights.tolist(),
             'feature_count': len(self.feature_extractor.get_feature_names()) if self.is_trained else 0
         }
+    
+    def _invalidate_model_info(self):
+        """Drop the cached model_info so it is rebuilt on next access"""
+        self.__dict__.pop('model_info', None)
+    
+    def get_model_info(self) -> Dict[str, Any]:
+        """Get model metadata and information"""
+        return dict(self.model_info)
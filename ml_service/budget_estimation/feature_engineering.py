@@ -6,26 +6,147 @@ Extracts and engineers features from project data for ML models
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Tuple
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
 import re
-import json
+import orjson
+from functools import lru_cache
+from joblib import Parallel, cpu_count, delayed
+
+
+def _compile_keyword_groups(keyword_groups) -> Tuple[re.Pattern, ...]:
+    """Compile each group of literal keywords into one alternation regex"""
+    return tuple(
+        re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+        for keywords in keyword_groups
+    )
+
+
+# Skill categories used for skill features and market premiums
+SKILL_CATEGORIES = {
+    'frontend': ['react', 'vue', 'angular', 'javascript', 'typescript', 'html', 'css', 'next.js'],
+    'backend': ['node.js', 'python', 'java', 'golang', 'rust', 'php', 'ruby', '.net'],
+    'mobile': ['react native', 'flutter', 'swift', 'kotlin', 'ios', 'android'],
+    'database': ['postgresql', 'mongodb', 'mysql', 'redis', 'elasticsearch', 'dynamodb'],
+    'devops': ['docker', 'kubernetes', 'aws', 'azure', 'gcp', 'ci/cd', 'terraform'],
+    'ai_ml': ['machine learning', 'tensorflow', 'pytorch', 'nlp', 'computer vision', 'deep learning'],
+    'blockchain': ['ethereum', 'solidity', 'web3', 'smart contracts', 'blockchain'],
+    'specialized': ['embedded systems', 'iot', 'ar/vr', 'game development', 'graphics']
+}
+
+SKILL_CATEGORY_PATTERNS = _compile_keyword_groups(SKILL_CATEGORIES.values())
+
+# Description keyword groups behind the has_* complexity features
+DESCRIPTION_KEYWORD_PATTERNS = _compile_keyword_groups([
+    ['api'],
+    ['database', 'db', 'sql', 'nosql'],
+    ['auth', 'login', 'oauth', 'jwt'],
+    ['payment', 'stripe', 'paypal', 'checkout'],
+    ['realtime', 'websocket', 'live'],
+    ['mobile', 'ios', 'android', 'app']
+])
+
+COMPLEXITY_SCORES = {'low': 1, 'medium': 2, 'high': 3, 'expert': 4}
+
+# Regional cost multipliers (based on typical market rates)
+REGION_MULTIPLIERS = {
+    'North America': 1.3,
+    'Western Europe': 1.2,
+    'Eastern Europe': 0.7,
+    'Asia Pacific': 0.8,
+    'Latin America': 0.6,
+    'Middle East': 0.9,
+    'Africa': 0.5,
+    'Global': 1.0
+}
+
+# Regions as a categorical dtype, with multipliers indexed by category code
+REGION_DTYPE = pd.CategoricalDtype(categories=list(REGION_MULTIPLIERS))
+REGION_MULTIPLIER_ARRAY = np.array(list(REGION_MULTIPLIERS.values()), dtype=np.float64)
+
+# Project type keyword groups behind the is_* market features
+PROJECT_TYPE_PATTERNS = _compile_keyword_groups([
+    ['web'],
+    ['mobile'],
+    ['api'],
+    ['ecommerce', 'e-commerce'],
+    ['data', 'analytics']
+])
+
+
+@lru_cache(maxsize=4096)
+def _skill_category_flags(skill: str, category_patterns: Tuple[re.Pattern, ...]) -> Tuple[bool, ...]:
+    """Which categories a normalized skill belongs to (memoized per skill)"""
+    return tuple(pattern.search(skill) is not None for pattern in category_patterns)
+
+
+@lru_cache(maxsize=4096)
+def _primary_skill_category(skill: str) -> str:
+    """First SKILL_CATEGORIES entry a normalized skill matches, else 'frontend'"""
+    flags = _skill_category_flags(skill, SKILL_CATEGORY_PATTERNS)
+    return next(
+        (category for category, matched in zip(SKILL_CATEGORIES, flags) if matched),
+        'frontend'
+    )
+
+
+def _parse_created_at(values, now: pd.Timestamp) -> pd.DatetimeIndex:
+    """
+    Parse created_at values as naive UTC, with unparseable or missing ones as now
+    
+    Shared by the DataFrame and record paths so training and serving see the
+    same month and weekday. Aware and mixed-offset timestamps are converted
+    to UTC, which also keeps the result a datetime dtype.
+    """
+    parsed = pd.to_datetime(values, errors='coerce', format='mixed', utc=True)
+    return pd.DatetimeIndex(parsed).tz_convert(None).fillna(now)
+
+
+@lru_cache(maxsize=8192)
+def _skill_premiums(
+    skills_lower: Tuple[str, ...],
+    regional_adjustment: float,
+    base_rates: Tuple[Tuple[str, float], ...]
+) -> Tuple[Tuple[str, float], ...]:
+    """Memoized (skill, premium) pairs for normalized skills under one rate table"""
+    rates = dict(base_rates)
+    skill_premiums = {}
+    
+    for skill in skills_lower:
+        # Find category (first matching category, memoized per skill)
+        category = _primary_skill_category(skill)
+        
+        # Get base rate and apply regional adjustment
+        base_rate = rates.get(category, 75.0)
+        adjusted_rate = base_rate * regional_adjustment
+        
+        skill_premiums[skill] = adjusted_rate
+    
+    return tuple(skill_premiums.items())
 
 
 class ProjectFeatureExtractor:
     """Extract and engineer features from project data"""
     
+    # Hash buckets for description n-grams
+    TEXT_HASH_FEATURES = 512
+    
     def __init__(self):
-        self.description_vectorizer = TfidfVectorizer(
-            max_features=500,
-            stop_words='english',
-            ngram_range=(1, 2),
-            min_df=2
+        # Hashed TF-IDF: no vocabulary to build or look up, so fitting only
+        # learns IDF weights and transform needs no per-token dict lookups
+        self.description_vectorizer = make_pipeline(
+            HashingVectorizer(
+                n_features=self.TEXT_HASH_FEATURES,
+                stop_words='english',
+                ngram_range=(1, 2),
+                alternate_sign=False,
+                norm=None,
+                dtype=np.float32
+            ),
+            TfidfTransformer()
         )
-        self.skill_encoder = None
         self.scaler = StandardScaler()
-        self.region_encoder = LabelEncoder()
-        self.type_encoder = LabelEncoder()
         
         # Skill categories and premiums
         self.skill_categories = self._initialize_skill_categories()
@@ -33,16 +154,7 @@ class ProjectFeatureExtractor:
         
     def _initialize_skill_categories(self) -> Dict[str, List[str]]:
         """Initialize skill categories for feature engineering"""
-        return {
-            'frontend': ['react', 'vue', 'angular', 'javascript', 'typescript', 'html', 'css', 'next.js'],
-            'backend': ['node.js', 'python', 'java', 'golang', 'rust', 'php', 'ruby', '.net'],
-            'mobile': ['react native', 'flutter', 'swift', 'kotlin', 'ios', 'android'],
-            'database': ['postgresql', 'mongodb', 'mysql', 'redis', 'elasticsearch', 'dynamodb'],
-            'devops': ['docker', 'kubernetes', 'aws', 'azure', 'gcp', 'ci/cd', 'terraform'],
-            'ai_ml': ['machine learning', 'tensorflow', 'pytorch', 'nlp', 'computer vision', 'deep learning'],
-            'blockchain': ['ethereum', 'solidity', 'web3', 'smart contracts', 'blockchain'],
-            'specialized': ['embedded systems', 'iot', 'ar/vr', 'game development', 'graphics']
-        }
+        return {category: list(skills) for category, skills in SKILL_CATEGORIES.items()}
     
     def _initialize_tech_complexity(self) -> Dict[str, float]:
         """Initialize technology complexity multipliers"""
@@ -68,255 +180,370 @@ class ProjectFeatureExtractor:
         Returns:
             Feature matrix as numpy array
         """
-        features = []
-        
-        # Text features from descriptions
+        # Text features from descriptions (sparse)
         text_features = self._extract_text_features(projects_df['description'], fit)
-        features.append(text_features)
         
-        # Skill-based features
-        skill_features = self._extract_skill_features(projects_df['required_skills'])
-        features.append(skill_features)
+        # Dense feature blocks: skills, complexity, temporal, market
+        dense_features = [
+            self._extract_skill_features(projects_df['required_skills']),
+            self._extract_complexity_features(projects_df),
+            self._extract_temporal_features(projects_df),
+            self._extract_market_features(projects_df)
+        ]
         
-        # Complexity features
-        complexity_features = self._extract_complexity_features(projects_df)
-        features.append(complexity_features)
+        combined_features = self._combine_features(text_features, dense_features)
         
-        # Temporal features
-        temporal_features = self._extract_temporal_features(projects_df)
-        features.append(temporal_features)
+        # Scale numerical features in place
+        if fit:
+            self.scaler.fit(combined_features)
+        self._scale_in_place(combined_features)
         
-        # Market features
-        market_features = self._extract_market_features(projects_df)
-        features.append(market_features)
+        return combined_features
+    
+    def extract_features_parallel(
+        self,
+        projects_df: pd.DataFrame,
+        n_jobs: int = -1,
+        min_rows_per_chunk: int = 5000
+    ) -> np.ndarray:
+        """
+        Extract features for a large dataframe on several processes
         
-        # Combine all features
-        combined_features = np.hstack(features)
+        Rows are independent once the transformers are fitted, so the frame
+        is split into contiguous chunks transformed in parallel and stacked
+        back in order. Frames too small to amortize worker startup are
+        processed inline.
         
-        # Scale numerical features
-        if fit:
-            combined_features = self.scaler.fit_transform(combined_features)
-        else:
-            combined_features = self.scaler.transform(combined_features)
+        Args:
+            projects_df: DataFrame with project data
+            n_jobs: Worker processes (-1 for all cores)
+            min_rows_per_chunk: Smallest chunk worth sending to a worker
+        """
+        workers = cpu_count() if n_jobs < 0 else n_jobs
+        num_chunks = min(workers, len(projects_df) // min_rows_per_chunk)
+        if num_chunks <= 1:
+            return self.extract_features(projects_df, fit=False)
+        
+        chunk_bounds = np.linspace(0, len(projects_df), num_chunks + 1, dtype=int)
+        parts = Parallel(n_jobs=num_chunks, backend='loky')(
+            delayed(self.extract_features)(projects_df.iloc[start:stop], fit=False)
+            for start, stop in zip(chunk_bounds[:-1], chunk_bounds[1:])
+        )
+        return np.vstack(parts)
+    
+    def extract_records_features(self, projects: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Extract features for project dicts without building a DataFrame
+        
+        Serving fast path for small batches: pandas construction and
+        column dispatch dominate at a handful of rows. Each row equals what
+        extract_features gives for that project alone on the fitted
+        transformers; training keeps the DataFrame path.
+        """
+        descriptions = []
+        for project in projects:
+            description = project.get('description')
+            descriptions.append('' if description is None or description != description else str(description))
+        text_features = self.description_vectorizer.transform(descriptions)
+        
+        dense_features = [
+            self._extract_skill_features([project.get('required_skills') for project in projects]),
+            np.array([self._record_dense_features(project) for project in projects], dtype=np.float64)
+        ]
+        combined_features = self._combine_features(text_features, dense_features)
+        self._scale_in_place(combined_features)
         
         return combined_features
     
-    def _extract_text_features(self, descriptions: pd.Series, fit: bool) -> np.ndarray:
-        """Extract TF-IDF features from project descriptions"""
+    @staticmethod
+    def _combine_features(text_features, dense_features: List[np.ndarray]) -> np.ndarray:
+        """Combine sparse text and dense blocks into one preallocated matrix"""
+        # Scatter only the TF-IDF non-zeros instead of densifying and re-stacking them
+        num_text = text_features.shape[1]
+        combined_features = np.zeros(
+            (text_features.shape[0], num_text + sum(block.shape[1] for block in dense_features))
+        )
+        text_coo = text_features.tocoo()
+        combined_features[text_coo.row, text_coo.col] = text_coo.data
+        
+        column = num_text
+        for block in dense_features:
+            combined_features[:, column:column + block.shape[1]] = block
+            column += block.shape[1]
+        
+        return combined_features
+    
+    def _scale_in_place(self, features: np.ndarray):
+        """Apply the fitted scaler to the combined buffer without copying it"""
+        # Same arithmetic as StandardScaler.transform, minus its input
+        # validation and output allocation
+        if self.scaler.mean_ is not None:
+            np.subtract(features, self.scaler.mean_, out=features)
+        if self.scaler.scale_ is not None:
+            np.divide(features, self.scaler.scale_, out=features)
+    
+    def _record_dense_features(self, project: Dict[str, Any]) -> List[float]:
+        """Complexity, temporal and market features for one project dict"""
+        def number(name: str) -> float:
+            value = project.get(name)
+            return 0.0 if value is None or value != value else float(value)
+        
+        # Complexity features (see _extract_complexity_features)
+        estimated_hours = number('estimated_hours')
+        duration_weeks = number('estimated_duration_weeks')
+        if 'complexity_level' in project:
+            complexity_score = COMPLEXITY_SCORES.get(str(project['complexity_level']).lower(), 2)
+        else:
+            complexity_score = 2
+        description = str(project['description']) if 'description' in project else ''
+        description_lower = description.lower()
+        keyword_flags = [
+            pattern.search(description_lower) is not None
+            for pattern in DESCRIPTION_KEYWORD_PATTERNS
+        ]
+        budget_min = number('initial_budget_min')
+        budget_max = number('initial_budget_max')
+        budget_range_size = budget_max - budget_min if budget_max > budget_min else 0.0
+        
+        # Temporal features (see _extract_temporal_features)
+        now = pd.Timestamp.now()
+        if 'created_at' in project:
+            created_at = _parse_created_at([project['created_at']], now)[0]
+        else:
+            created_at = now
+        month_angle = 2 * np.pi * float(created_at.month) / 12
+        dow_angle = 2 * np.pi * float(created_at.dayofweek) / 7
+        
+        # Market features (see _extract_market_features)
+        region = project.get('region', 'Global')
+        region_multiplier = REGION_MULTIPLIERS.get(region, 1.0) if region == region else 1.0
+        is_usd = project.get('currency', 'USD') == 'USD'
+        project_type = str(project['project_type']).lower() if 'project_type' in project else 'other'
+        type_flags = [
+            pattern.search(project_type) is not None
+            for pattern in PROJECT_TYPE_PATTERNS
+        ]
+        
+        return [
+            estimated_hours,
+            duration_weeks,
+            complexity_score,
+            len(description),
+            len(description.split()),
+            *keyword_flags,
+            budget_min,
+            budget_max,
+            budget_range_size,
+            (float(created_at.month) - 1) // 3 + 1,
+            np.sin(month_angle),
+            np.cos(month_angle),
+            np.sin(dow_angle),
+            np.cos(dow_angle),
+            region_multiplier,
+            is_usd,
+            *type_flags
+        ]
+    
+    def _extract_text_features(self, descriptions: pd.Series, fit: bool):
+        """Extract TF-IDF features from project descriptions (sparse matrix)"""
         # Clean descriptions
         descriptions = descriptions.fillna('').astype(str)
         
         if fit:
-            return self.description_vectorizer.fit_transform(descriptions).toarray()
+            return self.description_vectorizer.fit_transform(descriptions)
         else:
-            return self.description_vectorizer.transform(descriptions).toarray()
+            return self.description_vectorizer.transform(descriptions)
+    
+    def _category_patterns(self) -> Tuple[re.Pattern, ...]:
+        """One compiled alternation per skill category, in skill_categories order"""
+        patterns = self.__dict__.get('_compiled_category_patterns')
+        if patterns is None:
+            # Built lazily so extractors pickled before this existed still work
+            patterns = _compile_keyword_groups(self.skill_categories.values())
+            self._compiled_category_patterns = patterns
+        return patterns
     
     def _extract_skill_features(self, skills: pd.Series) -> np.ndarray:
         """Extract features from required skills"""
-        features = []
-        
-        for skill_list in skills:
-            if isinstance(skill_list, str):
-                skill_list = json.loads(skill_list)
+        category_patterns = self._category_patterns()
+        num_rows = len(skills)
+        num_skills = np.zeros(num_rows)
+        category_counts = np.zeros((num_rows, len(category_patterns)))
+        
+        for row, skill_list in enumerate(skills):
+            # Lists are the normal case (API input, jsonb decoded by psycopg2);
+            # JSON text only comes from exports such as CSV
             if not isinstance(skill_list, list):
-                skill_list = []
-            
-            # Normalize skills to lowercase
-            skills_lower = [s.lower().strip() for s in skill_list]
-            
-            # Count total skills
-            num_skills = len(skills_lower)
-            
-            # Count skills by category
-            category_counts = {}
-            for category, category_skills in self.skill_categories.items():
-                count = sum(1 for skill in skills_lower 
-                           if any(cs in skill for cs in category_skills))
-                category_counts[category] = count
-            
-            # Calculate tech stack diversity (entropy)
-            total_categorized = sum(category_counts.values())
-            if total_categorized > 0:
-                category_probs = [c / total_categorized for c in category_counts.values() if c > 0]
-                diversity = -sum(p * np.log(p) for p in category_probs)
-            else:
-                diversity = 0
+                if isinstance(skill_list, (str, bytes)):
+                    skill_list = orjson.loads(skill_list)
+                if not isinstance(skill_list, list):
+                    skill_list = []
             
-            # Calculate complexity multiplier
-            complexity_multiplier = 1.0
-            for category, count in category_counts.items():
-                if count > 0:
-                    complexity_multiplier *= self.tech_stack_complexity.get(category, 1.0)
+            num_skills[row] = len(skill_list)
             
-            # Build feature vector
-            feature_vector = [
-                num_skills,
-                diversity,
-                complexity_multiplier,
-                *category_counts.values()
-            ]
-            
-            features.append(feature_vector)
+            # Count skills by category; each skill counts once per matching category
+            for skill in skill_list:
+                flags = _skill_category_flags(skill.lower().strip(), category_patterns)
+                category_counts[row] += flags
+        
+        # Calculate tech stack diversity (entropy) over the categories present
+        total_categorized = category_counts.sum(axis=1)
+        category_probs = np.divide(
+            category_counts,
+            total_categorized[:, None],
+            out=np.zeros_like(category_counts),
+            where=total_categorized[:, None] > 0
+        )
+        # p * log(p) for every cell in two whole-matrix ufunc calls (0 where p == 0)
+        p_log_p = np.log(category_probs, out=np.zeros_like(category_probs), where=category_probs > 0)
+        p_log_p *= category_probs
+        diversity = np.zeros(num_rows)
+        for column in p_log_p.T:
+            # Column by column keeps the original summation order
+            diversity -= column
+        
+        # Calculate complexity multiplier from the categories present
+        category_complexity = np.array([
+            self.tech_stack_complexity.get(category, 1.0) for category in self.skill_categories
+        ])
+        complexity_multiplier = np.where(category_counts > 0, category_complexity, 1.0).prod(axis=1)
         
-        return np.array(features)
+        # Build feature matrix
+        return np.column_stack([num_skills, diversity, complexity_multiplier, category_counts])
     
     def _extract_complexity_features(self, projects_df: pd.DataFrame) -> np.ndarray:
         """Extract project complexity indicators"""
-        features = []
-        
-        for _, project in projects_df.iterrows():
-            # Estimated hours
-            estimated_hours = project.get('estimated_hours', 0) or 0
-            
-            # Duration in weeks
-            duration_weeks = project.get('estimated_duration_weeks', 0) or 0
-            
-            # Complexity level encoding
-            complexity_map = {'low': 1, 'medium': 2, 'high': 3, 'expert': 4}
-            complexity_score = complexity_map.get(
-                str(project.get('complexity_level', 'medium')).lower(), 2
+        num_rows = len(projects_df)
+        
+        def numeric_column(name: str) -> np.ndarray:
+            if name not in projects_df:
+                return np.zeros(num_rows)
+            return projects_df[name].fillna(0).to_numpy(dtype=np.float64)
+        
+        # Estimated hours and duration in weeks
+        estimated_hours = numeric_column('estimated_hours')
+        duration_weeks = numeric_column('estimated_duration_weeks')
+        
+        # Complexity level encoding (unknown levels count as medium)
+        if 'complexity_level' in projects_df:
+            complexity_score = (
+                projects_df['complexity_level'].map(str).str.lower()
+                .map(COMPLEXITY_SCORES).fillna(2).to_numpy(dtype=np.float64)
             )
-            
-            # Calculate features from project description
-            description = str(project.get('description', ''))
-            description_length = len(description)
-            word_count = len(description.split())
-            
-            # Feature extraction patterns
-            has_api_integration = int('api' in description.lower())
-            has_database = int(any(db in description.lower() 
-                                  for db in ['database', 'db', 'sql', 'nosql']))
-            has_authentication = int(any(auth in description.lower() 
-                                        for auth in ['auth', 'login', 'oauth', 'jwt']))
-            has_payment = int(any(pay in description.lower() 
-                                 for pay in ['payment', 'stripe', 'paypal', 'checkout']))
-            has_realtime = int(any(rt in description.lower() 
-                                  for rt in ['realtime', 'websocket', 'live']))
-            has_mobile = int(any(mobile in description.lower() 
-                                for mobile in ['mobile', 'ios', 'android', 'app']))
-            
-            # Budget range if provided
-            budget_min = project.get('initial_budget_min', 0) or 0
-            budget_max = project.get('initial_budget_max', 0) or 0
-            budget_range_size = budget_max - budget_min if budget_max > budget_min else 0
-            
-            feature_vector = [
-                estimated_hours,
-                duration_weeks,
-                complexity_score,
-                description_length,
-                word_count,
-                has_api_integration,
-                has_database,
-                has_authentication,
-                has_payment,
-                has_realtime,
-                has_mobile,
-                budget_min,
-                budget_max,
-                budget_range_size
-            ]
-            
-            features.append(feature_vector)
+        else:
+            complexity_score = np.full(num_rows, 2.0)
         
-        return np.array(features)
+        # Calculate features from project description
+        if 'description' in projects_df:
+            descriptions = projects_df['description'].map(str)
+        else:
+            descriptions = pd.Series([''] * num_rows, dtype=object)
+        description_length = descriptions.str.len().to_numpy(dtype=np.float64)
+        # Count words straight into an array; .str.split() would first build a
+        # whole Series of token lists
+        word_count = np.fromiter(
+            (len(description.split()) for description in descriptions),
+            dtype=np.float64,
+            count=num_rows
+        )
+        
+        # Keyword flags: api, database, authentication, payment, realtime, mobile
+        descriptions_lower = descriptions.str.lower()
+        keyword_flags = [
+            descriptions_lower.str.contains(pattern).to_numpy(dtype=np.float64)
+            for pattern in DESCRIPTION_KEYWORD_PATTERNS
+        ]
+        
+        # Budget range if provided
+        budget_min = numeric_column('initial_budget_min')
+        budget_max = numeric_column('initial_budget_max')
+        budget_range_size = np.where(budget_max > budget_min, budget_max - budget_min, 0.0)
+        
+        return np.column_stack([
+            estimated_hours,
+            duration_weeks,
+            complexity_score,
+            description_length,
+            word_count,
+            *keyword_flags,
+            budget_min,
+            budget_max,
+            budget_range_size
+        ])
     
     def _extract_temporal_features(self, projects_df: pd.DataFrame) -> np.ndarray:
         """Extract temporal features"""
-        features = []
-        
-        for _, project in projects_df.iterrows():
-            created_at = pd.to_datetime(project.get('created_at', pd.Timestamp.now()))
-            
-            # Extract temporal components
-            month = created_at.month
-            quarter = (month - 1) // 3 + 1
-            day_of_week = created_at.dayofweek
-            
-            # Cyclical encoding for month and day of week
-            month_sin = np.sin(2 * np.pi * month / 12)
-            month_cos = np.cos(2 * np.pi * month / 12)
-            dow_sin = np.sin(2 * np.pi * day_of_week / 7)
-            dow_cos = np.cos(2 * np.pi * day_of_week / 7)
-            
-            feature_vector = [
-                quarter,
-                month_sin,
-                month_cos,
-                dow_sin,
-                dow_cos
-            ]
-            
-            features.append(feature_vector)
-        
-        return np.array(features)
+        now = pd.Timestamp.now()
+        if 'created_at' in projects_df:
+            created_at = _parse_created_at(projects_df['created_at'], now)
+            month = created_at.month.to_numpy(dtype=np.float64)
+            day_of_week = created_at.dayofweek.to_numpy(dtype=np.float64)
+        else:
+            month = np.full(len(projects_df), float(now.month))
+            day_of_week = np.full(len(projects_df), float(now.dayofweek))
+        
+        # Extract temporal components
+        quarter = (month - 1) // 3 + 1
+        
+        # Cyclical encoding for month and day of week
+        month_angle = 2 * np.pi * month / 12
+        dow_angle = 2 * np.pi * day_of_week / 7
+        
+        return np.column_stack([
+            quarter,
+            np.sin(month_angle),
+            np.cos(month_angle),
+            np.sin(dow_angle),
+            np.cos(dow_angle)
+        ])
     
     def _extract_market_features(self, projects_df: pd.DataFrame) -> np.ndarray:
         """Extract market and regional features"""
-        features = []
+        num_rows = len(projects_df)
         
-        for _, project in projects_df.iterrows():
-            # Region encoding
-            region = project.get('region', 'Global')
-            
-            # Regional cost multipliers (based on typical market rates)
-            region_multipliers = {
-                'North America': 1.3,
-                'Western Europe': 1.2,
-                'Eastern Europe': 0.7,
-                'Asia Pacific': 0.8,
-                'Latin America': 0.6,
-                'Middle East': 0.9,
-                'Africa': 0.5,
-                'Global': 1.0
-            }
-            
-            region_multiplier = region_multipliers.get(region, 1.0)
-            
-            # Currency encoding (1 for USD, adjust for others)
-            currency = project.get('currency', 'USD')
-            is_usd = 1 if currency == 'USD' else 0
-            
-            # Project type one-hot encoding (top categories)
-            project_type = str(project.get('project_type', 'other')).lower()
-            is_web_app = 1 if 'web' in project_type else 0
-            is_mobile_app = 1 if 'mobile' in project_type else 0
-            is_api = 1 if 'api' in project_type else 0
-            is_ecommerce = 1 if 'ecommerce' in project_type or 'e-commerce' in project_type else 0
-            is_data = 1 if 'data' in project_type or 'analytics' in project_type else 0
-            
-            feature_vector = [
-                region_multiplier,
-                is_usd,
-                is_web_app,
-                is_mobile_app,
-                is_api,
-                is_ecommerce,
-                is_data
-            ]
-            
-            features.append(feature_vector)
+        # Region encoding; unknown regions get the global multiplier
+        if 'region' in projects_df:
+            region_codes = projects_df['region'].astype(REGION_DTYPE).cat.codes.to_numpy()
+            region_multiplier = np.where(
+                region_codes >= 0, REGION_MULTIPLIER_ARRAY[region_codes], 1.0
+            )
+        else:
+            region_multiplier = np.ones(num_rows)
         
-        return np.array(features)
+        # Currency encoding (1 for USD, adjust for others)
+        if 'currency' in projects_df:
+            is_usd = projects_df['currency'].eq('USD').to_numpy(dtype=np.float64)
+        else:
+            is_usd = np.ones(num_rows)
+        
+        # Project type flags: web, mobile, api, ecommerce, data
+        if 'project_type' in projects_df:
+            project_types = projects_df['project_type'].map(str).str.lower()
+        else:
+            project_types = pd.Series(['other'] * num_rows, dtype=object)
+        type_flags = [
+            project_types.str.contains(pattern).to_numpy(dtype=np.float64)
+            for pattern in PROJECT_TYPE_PATTERNS
+        ]
+        
+        return np.column_stack([region_multiplier, is_usd, *type_flags])
     
     def extract_single_project_features(self, project_data: Dict[str, Any]) -> np.ndarray:
         """Extract features for a single project (for prediction)"""
-        # Convert to DataFrame with single row
-        df = pd.DataFrame([project_data])
-        
-        # Extract features
-        features = self.extract_features(df, fit=False)
-        
-        return features[0]
+        return self.extract_records_features([project_data])[0]
     
     def get_feature_names(self) -> List[str]:
         """Get names of all features"""
         feature_names = []
         
         # Text features
-        if hasattr(self.description_vectorizer, 'get_feature_names_out'):
+        if isinstance(self.description_vectorizer, TfidfVectorizer):
+            # Vocabulary-based vectorizer pickled with older models
             feature_names.extend([f'text_{name}' for name in 
                                 self.description_vectorizer.get_feature_names_out()])
+        else:
+            hashing_vectorizer = self.description_vectorizer.steps[0][1]
+            feature_names.extend([f'text_hash_{i}' for i in range(hashing_vectorizer.n_features)])
         
         # Skill features
         feature_names.extend([
@@ -402,29 +629,16 @@ class MarketRateCalculator:
     
     def calculate_skill_premium(self, skills: List[str], region: str = 'Global') -> Dict[str, float]:
         """Calculate premium factors for given skills"""
-        skill_premiums = {}
-        
-        skills_lower = [s.lower().strip() for s in skills]
-        regional_adjustment = self.regional_adjustments.get(region, 1.0)
-        
-        # Categorize skills
-        skill_categories = ProjectFeatureExtractor()._initialize_skill_categories()
-        
-        for skill in skills_lower:
-            # Find category
-            category = 'frontend'  # default
-            for cat, cat_skills in skill_categories.items():
-                if any(cs in skill for cs in cat_skills):
-                    category = cat
-                    break
-            
-            # Get base rate and apply regional adjustment
-            base_rate = self.base_rates.get(category, 75.0)
-            adjusted_rate = base_rate * regional_adjustment
-            
-            skill_premiums[skill] = adjusted_rate
-        
-        return skill_premiums
+        # Skill lists repeat heavily across projects; key on the normalized
+        # skills in input order so the result keeps that order
+        skills_lower = tuple(s.lower().strip() for s in skills)
+        # The cache is module-level and keyed on this instance's rate values,
+        # so it never holds a reference to the calculator itself
+        return dict(_skill_premiums(
+            skills_lower,
+            self.regional_adjustments.get(region, 1.0),
+            tuple(self.base_rates.items())
+        ))
     
     def estimate_project_rate_range(
         self, 
@@ -438,8 +652,9 @@ class MarketRateCalculator:
         
         skill_premiums = self.calculate_skill_premium(skills, region)
         
-        # Calculate weighted average rate
-        avg_rate = np.mean(list(skill_premiums.values()))
+        # Calculate weighted average rate (plain Python: only a handful of skills)
+        premiums = skill_premiums.values()
+        avg_rate = sum(premiums) / len(premiums)
         
         # Apply demand multiplier (simulated - in production, fetch from DB)
         demand_multiplier = 1.0
@@ -0,0 +1,71 @@
+"""
+ASGI Middleware
+Lightweight replacements for generic Starlette middleware on hot paths.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+
+ALLOWED_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class FastCORSMiddleware:
+    """
+    Permissive CORS (any origin, credentials allowed) with minimal per-request work.
+
+    Equivalent to CORSMiddleware(allow_origins=["*"], allow_credentials=True,
+    allow_methods=["*"], allow_headers=["*"]): preflights are answered
+    directly, other responses get the request origin echoed back, and
+    requests without an Origin header pass straight through untouched.
+    """
+
+    def __init__(self, app: Callable, max_age: int = 600):
+        self.app = app
+        self.max_age = str(max_age).encode()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + [
+                (b"access-control-allow-methods", ALLOWED_METHODS),
+                (b"access-control-max-age", self.max_age),
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", b"2"),
+            ]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message: Dict[str, Any]):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -5,19 +5,46 @@ Trains and evaluates budget estimation models with cross-validation
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple, List
-from sklearn.model_selection import train_test_split, cross_val_score, KFold
+from typing import Dict, Tuple, List, Optional
+from sklearn.model_selection import StratifiedKFold
 from datetime import datetime
-import json
+from joblib import Parallel, delayed
+import logging
+import orjson
 
 from .budget_estimator import BudgetEstimator
 
+logger = logging.getLogger(__name__)
+
+
+# Inputs passed to the estimator when scoring held-out rows, with the
+# defaults used when a column is absent
+EVALUATION_INPUT_DEFAULTS = {
+    'description': '',
+    'required_skills': None,
+    'estimated_hours': 160,
+    'complexity_level': 'medium',
+    'project_type': 'web_app',
+    'region': 'Global',
+    'estimated_duration_weeks': 4
+}
+
+# Low-cardinality label columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ('complexity_level', 'region', 'project_type')
+
+# Number of equal-frequency budget bins cross-validation folds stratify on
+CV_BUDGET_BINS = 10
+
+# Relative-error thresholds reported as within_{5,10,20}_percent
+ACCURACY_THRESHOLDS = np.array([0.05, 0.10, 0.20])
+
 
 class ModelTrainer:
     """Train and evaluate budget estimation models"""
     
-    def __init__(self, model_version: str = "1.0.0"):
+    def __init__(self, model_version: str = "1.0.0", memory: Optional[str] = None):
         self.model_version = model_version
+        self.memory = memory  # Feature-extraction cache dir passed to estimators
         self.estimator = None
         self.evaluation_results = {}
         
@@ -31,36 +58,50 @@ class ModelTrainer:
         Returns:
             Cleaned DataFrame ready for training
         """
-        print("Preparing training data...")
+        logger.info("Preparing training data...")
         
-        df = raw_data.copy()
+        # Build one retention mask against raw_data so the only copy made is
+        # of the rows that survive cleaning
+        budgets = raw_data['final_budget'].to_numpy(dtype=np.float64)
         
         # Remove rows with missing critical fields
-        df = df.dropna(subset=['final_budget', 'description'])
-        
-        # Remove outliers (budget > 3 std devs from mean)
-        mean_budget = df['final_budget'].mean()
-        std_budget = df['final_budget'].std()
-        df = df[df['final_budget'] <= mean_budget + (3 * std_budget)]
-        df = df[df['final_budget'] >= mean_budget - (3 * std_budget)]
-        
-        # Ensure positive budgets
-        df = df[df['final_budget'] > 0]
+        present = ~np.isnan(budgets) & raw_data['description'].notna().to_numpy()
+        
+        # Remove outliers (budget > 3 std devs from mean) and non-positive
+        # budgets, with the band taken over the rows that are present
+        mean_budget = budgets[present].mean()
+        std_budget = budgets[present].std(ddof=1)  # Sample std, as pandas computes it
+        keep = (
+            present
+            & (budgets <= mean_budget + (3 * std_budget))
+            & (budgets >= mean_budget - (3 * std_budget))
+            & (budgets > 0)
+        )
         
         # Fill missing values
-        df['estimated_hours'] = df['estimated_hours'].fillna(160)
-        df['estimated_duration_weeks'] = df['estimated_duration_weeks'].fillna(4)
-        df['complexity_level'] = df['complexity_level'].fillna('medium')
-        df['region'] = df['region'].fillna('Global')
-        df['project_type'] = df['project_type'].fillna('web_app')
+        df = raw_data[keep].fillna({
+            'estimated_hours': 160,
+            'estimated_duration_weeks': 4,
+            'complexity_level': 'medium',
+            'region': 'Global',
+            'project_type': 'web_app'
+        })
+        
+        # Store the low-cardinality labels as categoricals and the counts in
+        # the smallest integer type that holds them; feature extraction then
+        # works on the few categories instead of every row
+        for column in CATEGORICAL_COLUMNS:
+            df[column] = df[column].astype('category')
+        for column in ('estimated_hours', 'estimated_duration_weeks'):
+            df[column] = pd.to_numeric(df[column], downcast='integer')
         
         # Ensure required_skills is a list
         if 'required_skills' in df.columns:
             df['required_skills'] = df['required_skills'].apply(
-                lambda x: x if isinstance(x, list) else (json.loads(x) if isinstance(x, str) else [])
+                lambda x: x if isinstance(x, list) else (orjson.loads(x) if isinstance(x, str) else [])
             )
         
-        print(f"Training data prepared: {len(df)} samples")
+        logger.info(f"Training data prepared: {len(df)} samples")
         
         return df
     
@@ -83,44 +124,40 @@ class ModelTrainer:
         Returns:
             Training results and metrics
         """
-        print(f"\nTraining Budget Estimation Model v{self.model_version}")
-        print("=" * 60)
+        logger.info(f"Training Budget Estimation Model v{self.model_version}")
         
         # Prepare data
         cleaned_data = self.prepare_training_data(training_data)
         
-        # Split data
-        train_val, test = train_test_split(
-            cleaned_data, 
-            test_size=test_size, 
-            random_state=random_state
-        )
-        
-        train, val = train_test_split(
-            train_val,
-            test_size=validation_size / (1 - test_size),
-            random_state=random_state
+        # Split data with one shuffle into test, validation and training
+        # rows; sizes round up as train_test_split rounds them
+        n_samples = len(cleaned_data)
+        n_test = int(np.ceil(n_samples * test_size))
+        n_val = int(np.ceil(n_samples * validation_size))
+        order = np.random.default_rng(random_state).permutation(n_samples)
+        test = cleaned_data.iloc[order[:n_test]]
+        val = cleaned_data.iloc[order[n_test:n_test + n_val]]
+        train = cleaned_data.iloc[order[n_test + n_val:]]
+        
+        logger.info(
+            f"Data split: {len(train)} training, {len(val)} validation, "
+            f"{len(test)} test samples"
         )
         
-        print(f"\nData split:")
-        print(f"  Training: {len(train)} samples")
-        print(f"  Validation: {len(val)} samples")
-        print(f"  Test: {len(test)} samples")
-        
         # Initialize and train model
-        self.estimator = BudgetEstimator(model_version=self.model_version)
+        self.estimator = BudgetEstimator(model_version=self.model_version, memory=self.memory)
         training_metrics = self.estimator.train(train)
         
         # Evaluate on validation set
-        print("\nEvaluating on validation set...")
+        logger.info("Evaluating on validation set...")
         val_metrics = self._evaluate_model(val, "Validation")
         
         # Evaluate on test set
-        print("\nEvaluating on test set...")
+        logger.info("Evaluating on test set...")
         test_metrics = self._evaluate_model(test, "Test")
         
         # Perform cross-validation
-        print("\nPerforming cross-validation...")
+        logger.info("Performing cross-validation...")
         cv_metrics = self._cross_validate(cleaned_data)
         
         # Compile all results
@@ -145,130 +182,94 @@ class ModelTrainer:
         
         return results
     
+    @staticmethod
+    def _evaluation_frame(data: pd.DataFrame) -> pd.DataFrame:
+        """Project inputs the estimator sees at evaluation time, with defaults"""
+        return pd.DataFrame({
+            column: data[column] if column in data else default
+            for column, default in EVALUATION_INPUT_DEFAULTS.items()
+        }, index=data.index)
+    
     def _evaluate_model(self, data: pd.DataFrame, set_name: str) -> Dict[str, float]:
         """Evaluate model on a dataset"""
-        predictions = []
-        actuals = []
-        errors = []
-        within_ci = []
-        
-        for _, row in data.iterrows():
-            try:
-                # Create project details dict
-                project_details = {
-                    'description': row['description'],
-                    'required_skills': row['required_skills'],
-                    'estimated_hours': row.get('estimated_hours', 160),
-                    'complexity_level': row.get('complexity_level', 'medium'),
-                    'project_type': row.get('project_type', 'web_app'),
-                    'region': row.get('region', 'Global'),
-                    'estimated_duration_weeks': row.get('estimated_duration_weeks', 4)
-                }
-                
-                # Get prediction
-                result = self.estimator.estimate_budget(project_details)
-                
-                predicted = result['estimated_budget']
-                actual = row['final_budget']
-                
-                predictions.append(predicted)
-                actuals.append(actual)
-                errors.append(abs(predicted - actual))
-                
-                # Check if within confidence interval
-                ci_lower = result['confidence_interval']['lower_bound']
-                ci_upper = result['confidence_interval']['upper_bound']
-                within_ci.append(ci_lower <= actual <= ci_upper)
-                
-            except Exception as e:
-                print(f"Error evaluating row: {e}")
-                continue
-        
-        # Calculate metrics
-        predictions = np.array(predictions)
-        actuals = np.array(actuals)
-        errors = np.array(errors)
-        
-        mae = np.mean(errors)
-        rmse = np.sqrt(np.mean(errors ** 2))
-        mape = np.mean(np.abs((actuals - predictions) / actuals)) * 100
+        # One batched prediction over the whole set
+        predictions, ci_lower, ci_upper = self.estimator.estimate_budget_batch(
+            self._evaluation_frame(data)
+        )
+        actuals = data['final_budget'].to_numpy(dtype=np.float64)
+        within_ci = (ci_lower <= actuals) & (actuals <= ci_upper)
+        
+        # Calculate metrics from one shared residual pass
+        residuals = actuals - predictions
+        errors = np.abs(residuals)
+        pct_errors = errors / actuals
+        
+        mae = errors.mean()
+        squared_error = np.dot(residuals, residuals)
+        rmse = np.sqrt(squared_error / len(actuals))
+        mape = pct_errors.mean() * 100
         
         # R-squared
-        ss_res = np.sum((actuals - predictions) ** 2)
-        ss_tot = np.sum((actuals - np.mean(actuals)) ** 2)
-        r2 = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+        centered = actuals - actuals.mean()
+        ss_tot = np.dot(centered, centered)
+        r2 = 1 - (squared_error / ss_tot) if ss_tot > 0 else 0
         
-        # Accuracy within thresholds
-        within_5_pct = np.mean(np.abs((actuals - predictions) / actuals) <= 0.05) * 100
-        within_10_pct = np.mean(np.abs((actuals - predictions) / actuals) <= 0.10) * 100
-        within_20_pct = np.mean(np.abs((actuals - predictions) / actuals) <= 0.20) * 100
+        # Accuracy within thresholds (5%, 10%, 20%) in one comparison
+        within_5_pct, within_10_pct, within_20_pct = (
+            (pct_errors[:, None] <= ACCURACY_THRESHOLDS).mean(axis=0) * 100
+        )
         
         # Confidence interval coverage
         ci_coverage = np.mean(within_ci) * 100
         
+        # Round every metric in one call and unbox to plain floats
+        (
+            mae, rmse, mape, within_5_pct, within_10_pct, within_20_pct, ci_coverage
+        ) = np.round(
+            [mae, rmse, mape, within_5_pct, within_10_pct, within_20_pct, ci_coverage], 2
+        ).tolist()
+        
         return {
-            'mae': round(mae, 2),
-            'rmse': round(rmse, 2),
-            'mape': round(mape, 2),
-            'r2': round(r2, 4),
-            'within_5_percent': round(within_5_pct, 2),
-            'within_10_percent': round(within_10_pct, 2),
-            'within_20_percent': round(within_20_pct, 2),
-            'ci_coverage_80': round(ci_coverage, 2),
+            'mae': mae,
+            'rmse': rmse,
+            'mape': mape,
+            'r2': round(float(r2), 4),
+            'within_5_percent': within_5_pct,
+            'within_10_percent': within_10_pct,
+            'within_20_percent': within_20_pct,
+            'ci_coverage_80': ci_coverage,
             'sample_size': len(predictions)
         }
     
-    def _cross_validate(self, data: pd.DataFrame, n_folds: int = 5) -> Dict[str, float]:
-        """Perform k-fold cross-validation"""
-        kf = KFold(n_splits=n_folds, shuffle=True, random_state=42)
-        
-        fold_metrics = []
+    def _cross_validate(
+        self,
+        data: pd.DataFrame,
+        n_folds: int = 5,
+        n_jobs: int = -1
+    ) -> Dict[str, float]:
+        """Perform k-fold cross-validation, training the folds in parallel"""
+        # Stratify on equal-frequency budget bins so every fold sees the
+        # same spread of the heavy-tailed budget distribution
+        budget_ranks = data['final_budget'].to_numpy().argsort(kind='stable').argsort()
+        n_bins = max(1, min(CV_BUDGET_BINS, len(data) // n_folds))
+        budget_bins = budget_ranks * n_bins // len(data)
+        skf = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=42)
+        
+        # Folds are independent, so each one trains in its own worker process
+        fold_metrics = Parallel(n_jobs=n_jobs)(
+            delayed(_run_fold)(
+                data.iloc[train_idx],
+                data.iloc[val_idx],
+                f"{self.model_version}-cv{fold_idx}",
+                self.memory
+            )
+            for fold_idx, (train_idx, val_idx) in enumerate(skf.split(data, budget_bins), 1)
+        )
         
-        for fold_idx, (train_idx, val_idx) in enumerate(kf.split(data), 1):
-            print(f"  Fold {fold_idx}/{n_folds}...", end=" ")
-            
-            train_fold = data.iloc[train_idx]
-            val_fold = data.iloc[val_idx]
-            
-            # Train temporary model
-            temp_estimator = BudgetEstimator(model_version=f"{self.model_version}-cv{fold_idx}")
-            temp_estimator.train(train_fold)
-            
-            # Evaluate
-            fold_predictions = []
-            fold_actuals = []
-            
-            for _, row in val_fold.iterrows():
-                try:
-                    project_details = {
-                        'description': row['description'],
-                        'required_skills': row['required_skills'],
-                        'estimated_hours': row.get('estimated_hours', 160),
-                        'complexity_level': row.get('complexity_level', 'medium'),
-                        'project_type': row.get('project_type', 'web_app'),
-                        'region': row.get('region', 'Global')
-                    }
-                    
-                    result = temp_estimator.estimate_budget(project_details)
-                    fold_predictions.append(result['estimated_budget'])
-                    fold_actuals.append(row['final_budget'])
-                except:
-                    continue
-            
-            # Calculate fold metrics
-            fold_predictions = np.array(fold_predictions)
-            fold_actuals = np.array(fold_actuals)
-            
-            fold_mae = np.mean(np.abs(fold_predictions - fold_actuals))
-            fold_r2 = 1 - (np.sum((fold_actuals - fold_predictions) ** 2) / 
-                          np.sum((fold_actuals - np.mean(fold_actuals)) ** 2))
-            
-            fold_metrics.append({
-                'mae': fold_mae,
-                'r2': fold_r2
-            })
-            
-            print(f"MAE: {fold_mae:.2f}, R²: {fold_r2:.4f}")
+        for fold_idx, metrics in enumerate(fold_metrics, 1):
+            logger.info(
+                f"Fold {fold_idx}/{n_folds}: MAE: {metrics['mae']:.2f}, R²: {metrics['r2']:.4f}"
+            )
         
         # Aggregate metrics
         avg_mae = np.mean([m['mae'] for m in fold_metrics])
@@ -334,14 +335,49 @@ class ModelTrainer:
         
         # Save evaluation results
         results_filepath = filepath.replace('.joblib', '_eval.json')
-        with open(results_filepath, 'w') as f:
-            json.dump(self.evaluation_results, f, indent=2)
+        with open(results_filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                self.evaluation_results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
         
-        print(f"Evaluation results saved to {results_filepath}")
+        logger.info(f"Evaluation results saved to {results_filepath}")
+
+
+def _run_fold(
+    train_fold: pd.DataFrame,
+    val_fold: pd.DataFrame,
+    model_version: str,
+    memory: Optional[str] = None
+) -> Dict[str, float]:
+    """Train a temporary estimator on one CV fold and score its held-out rows"""
+    temp_estimator = BudgetEstimator(model_version=model_version, memory=memory)
+    # The folds already run one per core; fitting each fold's forest on all
+    # cores as well would oversubscribe them
+    for model in temp_estimator.base_models:
+        if 'n_jobs' in model.get_params():
+            model.set_params(n_jobs=1)
+    temp_estimator.train(train_fold)
+    
+    fold_predictions, _, _ = temp_estimator.estimate_budget_batch(
+        ModelTrainer._evaluation_frame(val_fold)
+    )
+    fold_actuals = val_fold['final_budget'].to_numpy(dtype=np.float64)
+    
+    # Calculate fold metrics
+    fold_residuals = fold_actuals - fold_predictions
+    fold_centered = fold_actuals - fold_actuals.mean()
+    return {
+        'mae': np.abs(fold_residuals).mean(),
+        'r2': 1 - (np.dot(fold_residuals, fold_residuals) /
+                   np.dot(fold_centered, fold_centered))
+    }
 
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Load historical data (example)
     print("Budget Estimation Model Training Example")
     print("-" * 60)
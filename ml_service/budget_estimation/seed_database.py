@@ -6,10 +6,11 @@ Populates initial data for Budget Estimation system
 
 import os
 import sys
-import json
 from datetime import datetime, timedelta
-import random
+import numpy as np
+import orjson
 import psycopg2
+from psycopg2.extras import Json, execute_values
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -395,72 +396,119 @@ PROJECT_TEMPLATES = [
 
 REGIONS = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Global']
 
+# Market rate entries keyed by skill name, in MARKET_RATES order
+SKILL_RATE_INDEX = {rate['skill_name']: rate for rate in MARKET_RATES}
+
+# Skills each template's projects can pick up as extras, in MARKET_RATES order
+TEMPLATE_EXTRA_SKILLS = [
+    [name for name in SKILL_RATE_INDEX if name not in template['skills']]
+    for template in PROJECT_TEMPLATES
+]
+
+# Hourly rate multipliers per complexity level
+COMPLEXITY_RATE_MULTIPLIERS = {'low': 0.9, 'medium': 1.0, 'high': 1.15}
+
+# Tech stack options sampled for generated projects
+TECH_LANGUAGES = ('JavaScript', 'TypeScript', 'Python', 'Java', 'Go', 'Rust')
+TECH_FRAMEWORKS = ('React', 'Vue', 'Angular', 'Node.js', 'Django', 'Flask')
+TECH_DATABASES = ('PostgreSQL', 'MongoDB', 'Redis', 'MySQL')
+
+def _orjson_dumps(obj):
+    """Serialize with orjson for psycopg2's Json adapter, which expects str"""
+    return orjson.dumps(obj).decode()
+
+def _sample(rng, items, k):
+    """Pick k distinct items, keeping them plain Python objects for psycopg2"""
+    return [items[i] for i in rng.choice(len(items), size=k, replace=False)]
+
 def seed_market_rates(conn):
-    """Insert market rate data"""
+    """Insert market rate data; the caller commits"""
     print("\nSeeding market rate data...")
     cursor = conn.cursor()
     
-    for rate in MARKET_RATES:
-        try:
-            cursor.execute("""
-                INSERT INTO market_rate_data (
-                    skill_name,
-                    skill_category,
-                    base_hourly_rate,
-                    regional_rates,
-                    demand_factor,
-                    data_source,
-                    last_updated
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (skill_name) DO UPDATE SET
-                    base_hourly_rate = EXCLUDED.base_hourly_rate,
-                    regional_rates = EXCLUDED.regional_rates,
-                    demand_factor = EXCLUDED.demand_factor,
-                    last_updated = EXCLUDED.last_updated
-            """, (
-                rate['skill_name'],
-                rate['skill_category'],
-                rate['base_hourly_rate'],
-                json.dumps(rate['regional_rates']),
-                rate['demand_factor'],
-                rate['data_source'],
-                datetime.now()
-            ))
-            print(f"  ✓ {rate['skill_name']} - ${rate['base_hourly_rate']}/hr")
-        except Exception as e:
-            print(f"  ✗ {rate['skill_name']} - Error: {e}")
+    last_updated = datetime.now()
+    rows = [
+        (
+            rate['skill_name'],
+            rate['skill_category'],
+            rate['base_hourly_rate'],
+            Json(rate['regional_rates'], dumps=_orjson_dumps),
+            rate['demand_factor'],
+            rate['data_source'],
+            last_updated
+        )
+        for rate in MARKET_RATES
+    ]
+    
+    # One multi-row upsert instead of a round-trip per skill
+    execute_values(cursor, """
+        INSERT INTO market_rate_data (
+            skill_name,
+            skill_category,
+            base_hourly_rate,
+            regional_rates,
+            demand_factor,
+            data_source,
+            last_updated
+        ) VALUES %s
+        ON CONFLICT (skill_name) DO UPDATE SET
+            base_hourly_rate = EXCLUDED.base_hourly_rate,
+            regional_rates = EXCLUDED.regional_rates,
+            demand_factor = EXCLUDED.demand_factor,
+            last_updated = EXCLUDED.last_updated
+    """, rows, page_size=100)
     
-    conn.commit()
-    print(f"✓ Seeded {len(MARKET_RATES)} market rates")
+    print(f"✓ Seeded {len(rows)} market rates")
+    return len(rows)
 
 def generate_historical_projects(conn, count=150):
-    """Generate synthetic historical project data"""
+    """Generate synthetic historical project data; the caller commits"""
     print(f"\nGenerating {count} historical projects...")
     cursor = conn.cursor()
     
-    inserted = 0
-    for i in range(count):
-        # Pick random template
-        template = random.choice(PROJECT_TEMPLATES)
+    now = datetime.now()
+    rng = np.random.default_rng()
+    
+    # Draw every per-project scalar for the whole batch at once
+    template_idx = rng.integers(len(PROJECT_TEMPLATES), size=count)
+    hours_low, hours_high = np.array(
+        [template['hours_range'] for template in PROJECT_TEMPLATES]
+    ).T
+    estimated_hours = rng.integers(
+        hours_low[template_idx], hours_high[template_idx], endpoint=True
+    )
+    # Actual hours vary -20% to +40% from estimate
+    actual_hours = (estimated_hours * rng.uniform(0.8, 1.4, size=count)).astype(np.int64)
+    region_idx = rng.integers(len(REGIONS), size=count)
+    # Add some random additional skills (20% chance)
+    adds_extra_skills = rng.random(size=count) < 0.2
+    # Completion date between 6 months and 2 years ago
+    days_ago = rng.integers(180, 730, size=count, endpoint=True)
+    # Tech stack sizes: 1-3 languages, 1-2 frameworks, 1-2 databases
+    stack_sizes = rng.integers(1, [3, 2, 2], size=(count, 3), endpoint=True)
+    
+    rows = []
+    for template_i, est_hours, act_hours, region_i, adds_extra, days, stack_size in zip(
+        template_idx.tolist(),
+        estimated_hours.tolist(),
+        actual_hours.tolist(),
+        region_idx.tolist(),
+        adds_extra_skills.tolist(),
+        days_ago.tolist(),
+        stack_sizes.tolist()
+    ):
+        template = PROJECT_TEMPLATES[template_i]
         
         # Generate project details
-        description = random.choice(template['descriptions'])
+        description = _sample(rng, template['descriptions'], 1)[0]
         skills = template['skills'].copy()
         
-        # Add some random additional skills (20% chance)
-        if random.random() < 0.2:
-            extra_skills = random.sample([r['skill_name'] for r in MARKET_RATES if r['skill_name'] not in skills], k=min(2, len(MARKET_RATES)))
-            skills.extend(extra_skills)
-        
-        estimated_hours = random.randint(*template['hours_range'])
-        
-        # Actual hours vary -20% to +40% from estimate
-        variance = random.uniform(0.8, 1.4)
-        actual_hours = int(estimated_hours * variance)
+        if adds_extra:
+            skills.extend(_sample(rng, TEMPLATE_EXTRA_SKILLS[template_i], 2))
         
         # Calculate budget based on skills and region
-        region = random.choice(REGIONS)
-        skill_rates = [r for r in MARKET_RATES if r['skill_name'] in skills]
+        region = REGIONS[region_i]
+        skill_rates = [SKILL_RATE_INDEX[skill] for skill in skills if skill in SKILL_RATE_INDEX]
         
         if region == 'Global':
             avg_rate = sum(r['base_hourly_rate'] for r in skill_rates) / len(skill_rates)
@@ -468,58 +516,53 @@ def generate_historical_projects(conn, count=150):
             avg_rate = sum(r['regional_rates'].get(region, r['base_hourly_rate']) for r in skill_rates) / len(skill_rates)
         
         # Add complexity multiplier
-        complexity_multipliers = {'low': 0.9, 'medium': 1.0, 'high': 1.15}
-        avg_rate *= complexity_multipliers[template['complexity']]
-        
-        final_budget = actual_hours * avg_rate
+        avg_rate *= COMPLEXITY_RATE_MULTIPLIERS[template['complexity']]
         
-        # Completion date between 6 months and 2 years ago
-        days_ago = random.randint(180, 730)
-        completion_date = datetime.now() - timedelta(days=days_ago)
+        final_budget = act_hours * avg_rate
+        completion_date = now - timedelta(days=days)
         
         # Tech stack
+        num_languages, num_frameworks, num_databases = stack_size
         tech_stack = {
-            'languages': random.sample(['JavaScript', 'TypeScript', 'Python', 'Java', 'Go', 'Rust'], k=random.randint(1, 3)),
-            'frameworks': random.sample(['React', 'Vue', 'Angular', 'Node.js', 'Django', 'Flask'], k=random.randint(1, 2)),
-            'databases': random.sample(['PostgreSQL', 'MongoDB', 'Redis', 'MySQL'], k=random.randint(1, 2))
+            'languages': _sample(rng, TECH_LANGUAGES, num_languages),
+            'frameworks': _sample(rng, TECH_FRAMEWORKS, num_frameworks),
+            'databases': _sample(rng, TECH_DATABASES, num_databases)
         }
         
-        try:
-            cursor.execute("""
-                INSERT INTO historical_project_budgets (
-                    description,
-                    required_skills,
-                    estimated_hours,
-                    actual_hours,
-                    final_budget,
-                    complexity_level,
-                    project_type,
-                    region,
-                    tech_stack,
-                    completion_date
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                description,
-                skills,
-                estimated_hours,
-                actual_hours,
-                round(final_budget, 2),
-                template['complexity'],
-                template['type'],
-                region,
-                json.dumps(tech_stack),
-                completion_date
-            ))
-            inserted += 1
-            
-            if (i + 1) % 25 == 0:
-                print(f"  Progress: {i + 1}/{count} projects generated")
+        rows.append((
+            description,
+            skills,
+            est_hours,
+            act_hours,
+            round(final_budget, 2),
+            template['complexity'],
+            template['type'],
+            region,
+            Json(tech_stack, dumps=_orjson_dumps),
+            completion_date
+        ))
         
-        except Exception as e:
-            print(f"  ✗ Error generating project {i+1}: {e}")
+        if len(rows) % 25 == 0:
+            print(f"  Progress: {len(rows)}/{count} projects generated")
+    
+    # Insert every generated project in a few multi-row statements
+    execute_values(cursor, """
+        INSERT INTO historical_project_budgets (
+            description,
+            required_skills,
+            estimated_hours,
+            actual_hours,
+            final_budget,
+            complexity_level,
+            project_type,
+            region,
+            tech_stack,
+            completion_date
+        ) VALUES %s
+    """, rows, page_size=500)
     
-    conn.commit()
-    print(f"✓ Generated {inserted} historical projects")
+    print(f"✓ Generated {len(rows)} historical projects")
+    return len(rows)
 
 def main():
     print("=" * 80)
@@ -540,20 +583,20 @@ def main():
         print(f"✗ Connection failed: {e}")
         sys.exit(1)
     
-    # Seed data
-    seed_market_rates(conn)
-    generate_historical_projects(conn, count=150)
-    
-    # Summary
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM market_rate_data")
-    rates_count = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM historical_project_budgets")
-    projects_count = cursor.fetchone()[0]
-    
-    cursor.close()
-    conn.close()
+    # Seed data in one transaction, committed (or rolled back) as a whole
+    try:
+        cursor = conn.cursor()
+        # Seed data can be regenerated, so don't wait on the WAL flush
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        rates_count = seed_market_rates(conn)
+        projects_count = generate_historical_projects(conn, count=150)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"✗ Seed failed, all changes rolled back: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
     
     print()
     print("=" * 80)
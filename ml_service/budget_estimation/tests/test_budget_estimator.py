@@ -0,0 +1,74 @@
+"""
+Budget estimator tests
+Run from ml_service/: python -m unittest discover -s budget_estimation/tests -t .
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from budget_estimation.budget_estimator import BudgetEstimator
+
+
+def _training_data(n_samples: int = 200) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'description': [f"Project {i} with a web frontend and api" for i in range(n_samples)],
+        'required_skills': [
+            [f"skill_{j}" for j in range(rng.integers(2, 6))] for _ in range(n_samples)
+        ],
+        'final_budget': rng.lognormal(10, 0.5, n_samples),
+        'estimated_hours': rng.integers(80, 400, n_samples),
+        'estimated_duration_weeks': rng.integers(1, 20, n_samples),
+        'complexity_level': rng.choice(['low', 'medium', 'high'], n_samples),
+        'project_type': rng.choice(['web_app', 'mobile_app', 'api'], n_samples),
+        'region': rng.choice(['North America', 'Western Europe', 'Asia Pacific'], n_samples)
+    })
+
+
+class ZScoreTest(unittest.TestCase):
+    def test_known_levels(self):
+        self.assertAlmostEqual(BudgetEstimator._get_z_score(0.80), 1.2816, places=4)
+        self.assertAlmostEqual(BudgetEstimator._get_z_score(0.95), 1.9600, places=4)
+        self.assertAlmostEqual(BudgetEstimator._get_z_score(0.99), 2.5758, places=4)
+    
+    def test_rejects_levels_outside_open_unit_interval(self):
+        for confidence_level in (0.0, 1.0, -0.5, 1.5, float('nan')):
+            with self.subTest(confidence_level=confidence_level):
+                with self.assertRaises(ValueError):
+                    BudgetEstimator._get_z_score(confidence_level)
+
+
+class EstimateBudgetConfidenceLevelTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.estimator = BudgetEstimator()
+        cls.estimator.train(_training_data())
+        cls.project = {
+            'description': 'Web app with an api',
+            'required_skills': ['python', 'react'],
+            'estimated_hours': 160,
+            'complexity_level': 'medium',
+            'project_type': 'web_app',
+            'region': 'Global'
+        }
+    
+    def test_valid_level_widens_interval(self):
+        narrow = self.estimator.estimate_budget(self.project, confidence_level=0.50)
+        wide = self.estimator.estimate_budget(self.project, confidence_level=0.95)
+        def width(estimate):
+            interval = estimate['confidence_interval']
+            return interval['upper_bound'] - interval['lower_bound']
+        
+        self.assertLessEqual(width(narrow), width(wide))
+    
+    def test_invalid_level_raises_value_error(self):
+        for confidence_level in (0.0, 1.0, -0.2):
+            with self.subTest(confidence_level=confidence_level):
+                with self.assertRaises(ValueError):
+                    self.estimator.estimate_budget(self.project, confidence_level=confidence_level)
+
+
+if __name__ == '__main__':
+    unittest.main()
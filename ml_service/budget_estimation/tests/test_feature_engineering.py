@@ -0,0 +1,69 @@
+"""
+Feature extraction tests
+Run from ml_service/: python -m unittest discover -s budget_estimation/tests -t .
+"""
+
+import datetime
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from budget_estimation.feature_engineering import ProjectFeatureExtractor
+
+
+BASE_PROJECT = {
+    'description': 'Build a web app with a REST api and payment integration',
+    'required_skills': ['python', 'react', 'postgresql'],
+    'estimated_hours': 120,
+    'estimated_duration_weeks': 6,
+    'complexity_level': 'medium',
+    'project_type': 'web_app',
+    'region': 'Western Europe',
+    'initial_budget_min': 5000,
+    'initial_budget_max': 9000
+}
+
+
+class RecordsMatchDataFrameTest(unittest.TestCase):
+    """extract_records_features (serving) must equal extract_features (training)"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.extractor = ProjectFeatureExtractor()
+        training = pd.DataFrame([
+            {**BASE_PROJECT, 'created_at': f'2024-{month:02d}-15T10:00:00'}
+            for month in range(1, 13)
+        ])
+        cls.extractor.extract_features(training, fit=True)
+    
+    def assert_paths_match(self, created_ats):
+        records = [{**BASE_PROJECT, 'created_at': created_at} for created_at in created_ats]
+        np.testing.assert_array_equal(
+            self.extractor.extract_records_features(records),
+            self.extractor.extract_features(pd.DataFrame(records))
+        )
+    
+    def test_naive_timestamps(self):
+        self.assert_paths_match(['2024-03-31T23:30:00', '2024-12-31', '2024-06-01 08:00'])
+    
+    def test_aware_timestamps(self):
+        self.assert_paths_match(['2024-03-31T23:30:00-05:00', '2024-12-31T23:30:00+00:00'])
+    
+    def test_mixed_offset_timestamps(self):
+        self.assert_paths_match([
+            '2024-03-31T23:30:00-05:00',
+            '2024-06-30T22:00:00+09:00',
+            '2024-07-01T12:00:00'
+        ])
+    
+    def test_datetime_objects(self):
+        eastern = datetime.timezone(datetime.timedelta(hours=-5))
+        self.assert_paths_match([
+            datetime.datetime(2024, 3, 31, 23, 30, tzinfo=eastern),
+            datetime.datetime(2024, 1, 1, 9, 0)
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
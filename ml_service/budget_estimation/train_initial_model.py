@@ -6,7 +6,9 @@ Trains the first version of the Budget Estimation ML model
 
 import os
 import sys
+import itertools
 import json
+import logging
 from datetime import datetime
 import pandas as pd
 import psycopg2
@@ -20,7 +22,32 @@ from budget_estimation import ModelTrainer, BudgetEstimator
 # Load environment variables
 load_dotenv()
 
+# Rows pulled from the server-side cursor per round-trip
+FETCH_BATCH_SIZE = 10_000
+
+def fetch_training_data(conn, query):
+    """Stream query results through a server-side cursor into a DataFrame
+
+    Rows arrive FETCH_BATCH_SIZE at a time instead of being buffered whole
+    in libpq before pandas copies them again. DECIMAL columns such as
+    final_budget are coerced to float64 as pd.read_sql would.
+    """
+    with conn.cursor(name='budget_training_data') as cursor:
+        cursor.itersize = FETCH_BATCH_SIZE
+        cursor.execute(query)
+        # A named cursor only describes its columns after the first fetch
+        first_batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+        columns = [column.name for column in cursor.description]
+        return pd.DataFrame.from_records(
+            itertools.chain(first_batch, cursor),
+            columns=columns,
+            coerce_float=True
+        )
+
 def main():
+    # Surface the trainer's progress logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("=" * 80)
     print("Budget Estimation Model - Initial Training")
     print("=" * 80)
@@ -42,7 +69,8 @@ def main():
 
     print()
 
-    # Fetch training data
+    # Fetch training data. psycopg2 decodes the jsonb required_skills column
+    # into Python lists, so feature extraction never re-parses JSON
     print("Fetching training data from historical_project_budgets...")
     query = """
         SELECT 
@@ -65,7 +93,7 @@ def main():
     """
     
     try:
-        df = pd.read_sql(query, conn)
+        df = fetch_training_data(conn, query)
         print(f"✓ Loaded {len(df)} training samples")
     except Exception as e:
         print(f"✗ Failed to load data: {e}")
@@ -5,10 +5,85 @@ Extracts and transforms features from user profiles and project data.
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Set
+from scipy import sparse
+from typing import List, Dict, Set, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 import hashlib
 
+# Numeric features appended after the skill block of each feature vector
+DEVELOPER_NUMERIC_FEATURES = 7
+PROJECT_NUMERIC_FEATURES = 11
+
+# Interaction types counted by InteractionAggregator, with their output columns
+INTERACTION_COUNT_COLUMNS = {
+    "view": "total_views",
+    "apply": "total_applies",
+    "hire": "total_hires",
+}
+
+# Categorical dtype for interaction_type, so comparisons, maps and groupbys
+# work on small integer codes instead of re-hashing strings
+INTERACTION_TYPE_DTYPE = pd.CategoricalDtype(list(INTERACTION_COUNT_COLUMNS))
+
+# Interaction strength features and implicit feedback weights per type
+INTERACTION_TYPE_WEIGHTS = {"view": 0.2, "apply": 0.6, "hire": 1.0}
+IMPLICIT_FEEDBACK_WEIGHTS = {"view": 1, "apply": 3, "hire": 5}
+
+# The same values as lookup tables indexed by INTERACTION_TYPE_DTYPE codes;
+# the last slot holds the value for unknown types, which have code -1
+INTERACTION_STRENGTH_LUT = np.array(
+    [INTERACTION_TYPE_WEIGHTS[t] for t in INTERACTION_TYPE_DTYPE.categories] + [0.2],
+    dtype=np.float32,
+)
+IMPLICIT_FEEDBACK_WEIGHT_LUT = np.array(
+    [IMPLICIT_FEEDBACK_WEIGHTS[t] for t in INTERACTION_TYPE_DTYPE.categories] + [0],
+    dtype=np.int32,
+)
+
+# Ordinal scores for categorical profile fields
+EXPERIENCE_LEVEL_SCORES = {"junior": 0.25, "mid": 0.5, "senior": 0.75, "expert": 1.0}
+COMPLEXITY_LEVEL_SCORES = {"low": 0.25, "medium": 0.5, "high": 0.75, "expert": 1.0}
+
+# Project types with a one-hot slot in project features, mapped to their slot
+PROJECT_TYPE_SLOTS = {
+    project_type: slot
+    for slot, project_type in enumerate(
+        ["web_development", "mobile_app", "data_science", "devops", "api_development"]
+    )
+}
+
+
+@lru_cache(maxsize=65536)
+def _parse_timestamp(value: str) -> pd.Timestamp:
+    """Parse an ISO timestamp string; profiles repeat across pairs, so parse each once."""
+    return pd.to_datetime(value)
+
+
+def as_interaction_categories(interactions: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast interaction_type to INTERACTION_TYPE_DTYPE.
+
+    Types outside the known vocabulary become NaN, which every consumer
+    already treats as an unweighted, uncounted interaction.
+
+    Returns:
+        The input itself when already cast, otherwise a shallow copy
+    """
+    types = interactions["interaction_type"]
+    if types.dtype == INTERACTION_TYPE_DTYPE:
+        return interactions
+
+    types = types.astype("category").cat.set_categories(INTERACTION_TYPE_DTYPE.categories)
+    return interactions.assign(interaction_type=types)
+
+
+def _interaction_type_codes(types: pd.Series) -> np.ndarray:
+    """INTERACTION_TYPE_DTYPE codes for an interaction_type column, -1 where unknown."""
+    if types.dtype == INTERACTION_TYPE_DTYPE:
+        return types.cat.codes.to_numpy()
+    return INTERACTION_TYPE_DTYPE.categories.get_indexer(types)
+
 
 class FeatureExtractor:
     """Extract and transform features for ML models."""
@@ -27,7 +102,25 @@ class FeatureExtractor:
         self.skill_universe = set(all_skills)
         self.skill_to_index = {skill: idx for idx, skill in enumerate(sorted(self.skill_universe))}
 
-    def extract_developer_features(self, developer: Dict) -> np.ndarray:
+    def encode_skill_ids(self, skills: List[str]) -> np.ndarray:
+        """
+        Map skills to their vocabulary indices, dropping unknown skills.
+
+        Lets callers resolve skills once (e.g. at request parse time) and pass
+        the ids to the extract_* methods instead of re-hashing the strings.
+
+        Returns:
+            int32 array of skill indices
+        """
+        index = self.skill_to_index
+        return np.fromiter((index[s] for s in skills if s in index), dtype=np.int32)
+
+    def extract_developer_features(
+        self,
+        developer: Dict,
+        skill_ids: Optional[np.ndarray] = None,
+        now: Optional[datetime] = None,
+    ) -> np.ndarray:
         """
         Extract feature vector from developer profile.
 
@@ -41,40 +134,49 @@ class FeatureExtractor:
         - Account age (days)
         - Response time (hours)
 
+        Args:
+            developer: Developer profile dict
+            skill_ids: Precomputed skill indices from encode_skill_ids (optional)
+            now: Reference time for account age (defaults to the current time)
+
         Returns:
-            Feature vector as numpy array
+            float32 feature vector
         """
-        features = []
-
-        # Skill vector (binary encoding)
-        skill_vector = self._encode_skills(developer.get("skills", []))
-        features.extend(skill_vector)
+        # Skill bits and numeric features share one preallocated vector
+        out = self._encode_skills(
+            developer.get("skills", []), skill_ids, trailing=DEVELOPER_NUMERIC_FEATURES
+        )
+        v = len(self.skill_to_index)
 
         # Experience level (0-1 scale)
-        experience_map = {"junior": 0.25, "mid": 0.5, "senior": 0.75, "expert": 1.0}
-        features.append(experience_map.get(developer.get("experience_level", "mid"), 0.5))
+        out[v] = EXPERIENCE_LEVEL_SCORES.get(developer.get("experience_level", "mid"), 0.5)
 
         # Hourly rate (normalized to 0-1, assuming range 10-200)
         hourly_rate = developer.get("hourly_rate", 50)
-        features.append(min((hourly_rate - 10) / 190, 1.0))
+        out[v + 1] = min((hourly_rate - 10) / 190, 1.0)
 
         # Reputation features
-        features.append(developer.get("average_rating", 4.0) / 5.0)  # Rating 0-1
-        features.append(developer.get("completion_rate", 0.8))  # Already 0-1
-        features.append(
-            min(developer.get("total_projects_completed", 0) / 50, 1.0)
+        out[v + 2] = developer.get("average_rating", 4.0) / 5.0  # Rating 0-1
+        out[v + 3] = developer.get("completion_rate", 0.8)  # Already 0-1
+        out[v + 4] = min(
+            developer.get("total_projects_completed", 0) / 50, 1.0
         )  # Normalize to 0-1
 
         # Activity features
-        account_age = self._calculate_account_age(developer.get("created_at"))
-        features.append(min(account_age / 730, 1.0))  # 2 years = 1.0
+        account_age = self._calculate_account_age(developer.get("created_at"), now)
+        out[v + 5] = min(account_age / 730, 1.0)  # 2 years = 1.0
 
         avg_response_time = developer.get("avg_response_time_hours", 24)
-        features.append(max(1.0 - (avg_response_time / 48), 0))  # Faster = higher score
+        out[v + 6] = max(1.0 - (avg_response_time / 48), 0)  # Faster = higher score
 
-        return np.array(features)
+        return out
 
-    def extract_project_features(self, project: Dict) -> np.ndarray:
+    def extract_project_features(
+        self,
+        project: Dict,
+        skill_ids: Optional[np.ndarray] = None,
+        now: Optional[datetime] = None,
+    ) -> np.ndarray:
         """
         Extract feature vector from project.
 
@@ -88,18 +190,22 @@ class FeatureExtractor:
         - Client rating
         - Project age (days)
 
+        Args:
+            project: Project dict
+            skill_ids: Precomputed required-skill indices from encode_skill_ids (optional)
+            now: Reference time for project age (defaults to the current time)
+
         Returns:
-            Feature vector as numpy array
+            float32 feature vector
         """
-        features = []
-
-        # Skill vector
-        skill_vector = self._encode_skills(project.get("required_skills", []))
-        features.extend(skill_vector)
+        # Skill bits and numeric features share one preallocated vector
+        out = self._encode_skills(
+            project.get("required_skills", []), skill_ids, trailing=PROJECT_NUMERIC_FEATURES
+        )
+        v = len(self.skill_to_index)
 
         # Complexity level
-        complexity_map = {"low": 0.25, "medium": 0.5, "high": 0.75, "expert": 1.0}
-        features.append(complexity_map.get(project.get("complexity_level", "medium"), 0.5))
+        out[v] = COMPLEXITY_LEVEL_SCORES.get(project.get("complexity_level", "medium"), 0.5)
 
         # Budget (using max of range, normalized)
         budget_range = project.get("budget_range", {})
@@ -108,67 +214,68 @@ class FeatureExtractor:
         else:
             budget = budget_range.get("max", 5000)
 
-        features.append(min(budget / 20000, 1.0))  # Normalize to 0-1
+        out[v + 1] = min(budget / 20000, 1.0)  # Normalize to 0-1
 
         # Project type (one-hot for common types)
-        project_types = [
-            "web_development",
-            "mobile_app",
-            "data_science",
-            "devops",
-            "api_development",
-        ]
-        project_type = project.get("project_type", "other")
-        features.extend([1 if pt == project_type else 0 for pt in project_types])
+        slot = PROJECT_TYPE_SLOTS.get(project.get("project_type", "other"))
+        if slot is not None:
+            out[v + 2 + slot] = 1
 
         # Remote flag
-        features.append(1 if project.get("is_remote", True) else 0)
+        out[v + 7] = 1 if project.get("is_remote", True) else 0
 
         # Expected duration (weeks, normalized)
         duration_weeks = project.get("expected_duration_weeks", 4)
-        features.append(min(duration_weeks / 52, 1.0))  # Up to 1 year
+        out[v + 8] = min(duration_weeks / 52, 1.0)  # Up to 1 year
 
         # Client reputation
         client_rating = project.get("client_rating", 4.0)
-        features.append(client_rating / 5.0)
+        out[v + 9] = client_rating / 5.0
 
         # Project age
-        project_age = self._calculate_project_age(project.get("created_at"))
-        features.append(max(1.0 - (project_age / 30), 0))  # Fresher = higher score
+        project_age = self._calculate_project_age(project.get("created_at"), now)
+        out[v + 10] = max(1.0 - (project_age / 30), 0)  # Fresher = higher score
 
-        return np.array(features)
+        return out
 
-    def _encode_skills(self, skills: List[str]) -> List[int]:
+    def _encode_skills(
+        self, skills: List[str], skill_ids: Optional[np.ndarray] = None, trailing: int = 0
+    ) -> np.ndarray:
         """
         Encode skills as binary vector based on skill vocabulary.
 
+        Args:
+            skills: Skill names
+            skill_ids: Precomputed skill indices from encode_skill_ids (optional)
+            trailing: Zeroed slots to reserve after the skill block for numeric features
+
         Returns:
-            Binary vector where 1 indicates skill presence
+            float32 vector where 1 indicates skill presence
         """
+        vector = np.zeros(len(self.skill_to_index) + trailing, dtype=np.float32)
         if not self.skill_universe:
-            return []
+            return vector
 
-        vector = [0] * len(self.skill_universe)
+        if skill_ids is None:
+            skill_ids = self.encode_skill_ids(skills)
 
-        for skill in skills:
-            if skill in self.skill_to_index:
-                vector[self.skill_to_index[skill]] = 1
+        vector[skill_ids] = 1
 
         return vector
 
-    def _calculate_account_age(self, created_at) -> int:
-        """Calculate account age in days."""
+    def _calculate_account_age(self, created_at, now: Optional[datetime] = None) -> int:
+        """Calculate account age in days, relative to now (defaults to the current time)."""
         if not created_at:
             return 0
 
         if isinstance(created_at, str):
-            created_at = pd.to_datetime(created_at)
+            created_at = _parse_timestamp(created_at)
 
-        return (datetime.now() - created_at).days
+        return ((now or datetime.now()) - created_at).days
 
-    def _calculate_project_age(self, created_at) -> int:
+    def _calculate_project_age(self, created_at, now: Optional[datetime] = None) -> int:
         """Calculate project age in days."""
-        return self._calculate_account_age(created_at)
+        return self._calculate_account_age(created_at, now)
 
     def calculate_skill_similarity(self, skills1: Set[str], skills2: Set[str]) -> float:
         """
@@ -185,12 +292,53 @@ class FeatureExtractor:
 
         return intersection / union if union > 0 else 0.0
 
-    def extract_interaction_features(self, interaction: Dict) -> Dict[str, float]:
+    def encode_skill_bits(
+        self, skills: List[str], skill_ids: Optional[np.ndarray] = None
+    ) -> int:
+        """
+        Pack skills into an integer bitset over the skill vocabulary.
+
+        Bit i is set when the skill with vocabulary index i is present;
+        unknown skills are dropped, as in encode_skill_ids. Encode each
+        entity once and compare with calculate_skill_bits_similarity.
+
+        Returns:
+            Bitset as a Python int
+        """
+        if skill_ids is None:
+            skill_ids = self.encode_skill_ids(skills)
+
+        bits = 0
+        for idx in skill_ids.tolist():
+            bits |= 1 << idx
+
+        return bits
+
+    @staticmethod
+    def calculate_skill_bits_similarity(bits1: int, bits2: int) -> float:
+        """
+        Calculate Jaccard similarity between two skill bitsets.
+
+        Equivalent to calculate_skill_similarity on the vocabulary skills,
+        using popcounts instead of hashing every skill string.
+
+        Returns:
+            Similarity score between 0 and 1
+        """
+        if not bits1 or not bits2:
+            return 0.0
+
+        return (bits1 & bits2).bit_count() / (bits1 | bits2).bit_count()
+
+    def extract_interaction_features(
+        self, interaction: Dict, now: Optional[datetime] = None
+    ) -> Dict[str, float]:
         """
         Extract features from a user-project interaction.
 
         Args:
             interaction: Dict with user_id, project_id, interaction_type, timestamp, outcome
+            now: Reference time for recency (defaults to the current time)
 
         Returns:
             Dictionary of interaction features
@@ -198,8 +346,7 @@ class FeatureExtractor:
         features = {}
 
         # Interaction type weights
-        type_weights = {"view": 0.2, "apply": 0.6, "hire": 1.0}
-        features["interaction_strength"] = type_weights.get(
+        features["interaction_strength"] = INTERACTION_TYPE_WEIGHTS.get(
             interaction.get("interaction_type", "view"), 0.2
         )
 
@@ -210,8 +357,8 @@ class FeatureExtractor:
         timestamp = interaction.get("timestamp")
         if timestamp:
             if isinstance(timestamp, str):
-                timestamp = pd.to_datetime(timestamp)
-            days_ago = (datetime.now() - timestamp).days
+                timestamp = _parse_timestamp(timestamp)
+            days_ago = ((now or datetime.now()) - timestamp).days
             features["recency_score"] = max(1.0 - (days_ago / 90), 0)  # Decay over 90 days
         else:
             features["recency_score"] = 0.5
@@ -221,12 +368,99 @@ class FeatureExtractor:
 
         return features
 
+    def extract_interaction_features_batch(
+        self, interactions: pd.DataFrame, now: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        Extract interaction features for a whole DataFrame of interactions.
+
+        Column-wise equivalent of extract_interaction_features.
+
+        Args:
+            interactions: DataFrame with interaction_type, timestamp and, optionally,
+                time_spent_seconds and outcome columns
+            now: Reference time for recency (defaults to the current time)
+
+        Returns:
+            DataFrame of interaction features aligned to the input index
+        """
+        features = pd.DataFrame(index=interactions.index)
+        missing = pd.Series(np.nan, index=interactions.index)
+
+        # Interaction type weights, gathered by type code
+        features["interaction_strength"] = INTERACTION_STRENGTH_LUT[
+            _interaction_type_codes(interactions.get("interaction_type", missing))
+        ]
+
+        # Time spent on project page (if available)
+        features["time_spent_seconds"] = (
+            interactions.get("time_spent_seconds", missing).fillna(0).astype(np.float32)
+        )
+
+        # Interaction recency
+        timestamps = pd.to_datetime(interactions.get("timestamp", missing), format="ISO8601")
+        days_ago = (pd.Timestamp(now or datetime.now()) - timestamps).dt.days
+        features["recency_score"] = (
+            (1.0 - days_ago / 90).clip(lower=0).fillna(0.5).astype(np.float32)
+        )
+
+        # Outcome (for supervised learning)
+        features["outcome_success"] = (
+            interactions.get("outcome", missing).eq("hired").astype(np.int8)
+        )
+
+        return features
+
+    def build_developer_matrix(self, users: List[Dict]) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        Extract features for every developer into one matrix.
+
+        Ages are measured against a single clock reading taken for the batch.
+
+        Returns:
+            (matrix with one row per user, mapping of user_id to row index)
+        """
+        now = datetime.now()
+        matrix = self._build_matrix(
+            users, lambda user: self.extract_developer_features(user, now=now)
+        )
+        return matrix, {user["user_id"]: row for row, user in enumerate(users)}
+
+    def build_project_matrix(self, projects: List[Dict]) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        Extract features for every project into one matrix.
+
+        Ages are measured against a single clock reading taken for the batch.
+
+        Returns:
+            (matrix with one row per project, mapping of project id to row index)
+        """
+        now = datetime.now()
+        matrix = self._build_matrix(
+            projects, lambda project: self.extract_project_features(project, now=now)
+        )
+        return matrix, {project["id"]: row for row, project in enumerate(projects)}
+
+    @staticmethod
+    def _build_matrix(records: List[Dict], extract) -> np.ndarray:
+        """Fill a preallocated matrix with extract(record), sized from the first row."""
+        matrix = None
+        for row, record in enumerate(records):
+            features = extract(record)
+            if matrix is None:
+                matrix = np.empty((len(records), features.shape[0]), dtype=features.dtype)
+            matrix[row] = features
+        return matrix if matrix is not None else np.empty((0, 0))
+
     def create_user_project_pairs(
         self, users: List[Dict], projects: List[Dict], interactions: pd.DataFrame = None
     ) -> pd.DataFrame:
         """
         Create training dataset of user-project pairs with features.
 
+        Each user and project is featurized once (see build_developer_matrix
+        and build_project_matrix); pairs then gather rows from those matrices.
+
         Args:
             users: List of user profiles
             projects: List of projects
@@ -235,83 +469,79 @@ class FeatureExtractor:
         Returns:
             DataFrame with columns [user_id, project_id, user_features, project_features, label]
         """
-        pairs = []
+        user_matrix, user_rows = self.build_developer_matrix(users)
+        project_matrix, project_rows = self.build_project_matrix(projects)
 
         if interactions is not None:
-            # Create pairs from historical interactions
-            user_map = {u["user_id"]: u for u in users}
-            project_map = {p["id"]: p for p in projects}
-
-            for _, interaction in interactions.iterrows():
-                user_id = interaction["user_id"]
-                project_id = interaction["project_id"]
-
-                if user_id not in user_map or project_id not in project_map:
-                    continue
-
-                user_features = self.extract_developer_features(user_map[user_id])
-                project_features = self.extract_project_features(project_map[project_id])
-
-                # Label: 1 if hired, 0 otherwise
-                label = 1 if interaction.get("interaction_type") == "hire" else 0
-
-                pairs.append(
-                    {
-                        "user_id": user_id,
-                        "project_id": project_id,
-                        "user_features": user_features,
-                        "project_features": project_features,
-                        "label": label,
-                    }
-                )
-        else:
-            # Create all possible pairs (for prediction)
-            for user in users:
-                user_features = self.extract_developer_features(user)
-
-                for project in projects:
-                    project_features = self.extract_project_features(project)
-
-                    pairs.append(
-                        {
-                            "user_id": user["user_id"],
-                            "project_id": project["id"],
-                            "user_features": user_features,
-                            "project_features": project_features,
-                            "label": None,  # Unknown label for prediction
-                        }
-                    )
+            # Create pairs from historical interactions with a known user and project
+            user_idx = interactions["user_id"].map(user_rows)
+            project_idx = interactions["project_id"].map(project_rows)
+            known = (user_idx.notna() & project_idx.notna()).to_numpy()
+            user_idx = user_idx[known].to_numpy(dtype=np.intp)
+            project_idx = project_idx[known].to_numpy(dtype=np.intp)
+
+            # Label: 1 if hired, 0 otherwise
+            if "interaction_type" in interactions:
+                labels = interactions["interaction_type"].eq("hire").to_numpy()[known].astype(int)
+            else:
+                labels = np.zeros(len(user_idx), dtype=int)
+
+            return pd.DataFrame(
+                {
+                    "user_id": interactions["user_id"].to_numpy()[known],
+                    "project_id": interactions["project_id"].to_numpy()[known],
+                    "user_features": list(user_matrix[user_idx]),
+                    "project_features": list(project_matrix[project_idx]),
+                    "label": labels,
+                }
+            )
 
-        return pd.DataFrame(pairs)
+        # Create all possible pairs (for prediction)
+        num_users, num_projects = len(users), len(projects)
+        return pd.DataFrame(
+            {
+                "user_id": np.repeat([u["user_id"] for u in users], num_projects),
+                "project_id": np.tile([p["id"] for p in projects], num_users),
+                "user_features": list(np.repeat(user_matrix, num_projects, axis=0)),
+                "project_features": list(np.tile(project_matrix, (num_users, 1))),
+                "label": None,  # Unknown label for prediction
+            }
+        )
 
 
 class InteractionAggregator:
     """Aggregate interaction data for model training."""
 
+    @staticmethod
+    def _count_interaction_types(interactions: pd.DataFrame, key: str) -> pd.DataFrame:
+        """Count views, applies and hires per key value, zero-filling absent types."""
+        # dropna=False keeps keys whose interactions are all of unknown type
+        counts = (
+            pd.crosstab(interactions[key], interactions["interaction_type"], dropna=False)
+            .reindex(columns=list(INTERACTION_COUNT_COLUMNS), fill_value=0)
+            .rename(columns=INTERACTION_COUNT_COLUMNS)
+            .rename_axis(columns=None)
+        )
+        return counts[counts.index.notna()]
+
     @staticmethod
     def aggregate_user_interactions(interactions: pd.DataFrame) -> pd.DataFrame:
         """
         Aggregate interactions per user to create user-level statistics.
 
         Returns:
-            DataFrame with columns [user_id, total_views, total_applies, total_hires, avg_time_to_apply]
+            DataFrame with columns [user_id, total_views, total_applies, total_hires,
+            first_interaction, last_interaction, interaction_count]
         """
-        user_stats = (
-            interactions.groupby("user_id")
-            .agg(
-                {
-                    "interaction_type": lambda x: {
-                        "total_views": (x == "view").sum(),
-                        "total_applies": (x == "apply").sum(),
-                        "total_hires": (x == "hire").sum(),
-                    },
-                    "timestamp": ["min", "max", "count"],
-                }
-            )
-            .reset_index()
+        interactions = as_interaction_categories(interactions)
+        type_counts = InteractionAggregator._count_interaction_types(interactions, "user_id")
+        activity = interactions.groupby("user_id").agg(
+            first_interaction=("timestamp", "min"),
+            last_interaction=("timestamp", "max"),
+            interaction_count=("timestamp", "count"),
         )
 
-        return user_stats
+        return type_counts.join(activity).reset_index()
 
     @staticmethod
     def aggregate_project_interactions(interactions: pd.DataFrame) -> pd.DataFrame:
@@ -321,15 +551,9 @@ class InteractionAggregator:
         Returns:
             DataFrame with columns [project_id, total_views, total_applies, view_to_apply_rate]
         """
-        project_stats = (
-            interactions.groupby("project_id")
-            .agg(
-                total_views=("interaction_type", lambda x: (x == "view").sum()),
-                total_applies=("interaction_type", lambda x: (x == "apply").sum()),
-                total_hires=("interaction_type", lambda x: (x == "hire").sum()),
-            )
-            .reset_index()
-        )
+        project_stats = InteractionAggregator._count_interaction_types(
+            as_interaction_categories(interactions), "project_id"
+        ).reset_index()
 
         # Calculate conversion rates
         project_stats["view_to_apply_rate"] = (
@@ -343,7 +567,9 @@ class InteractionAggregator:
         return project_stats
 
     @staticmethod
-    def create_implicit_feedback_matrix(interactions: pd.DataFrame) -> pd.DataFrame:
+    def create_implicit_feedback_matrix(
+        interactions: pd.DataFrame,
+    ) -> Tuple[sparse.csr_matrix, pd.Index, pd.Index]:
         """
         Create implicit feedback matrix for collaborative filtering.
 
@@ -352,19 +578,27 @@ class InteractionAggregator:
         - apply: 3
         - hire: 5
 
+        Interaction types outside the weight map contribute nothing.
+
         Returns:
-            Pivot table with users as rows, projects as columns, weighted interactions as values
+            (sparse CSR matrix with users as rows and projects as columns holding
+            summed interaction weights, user_id of each row, project_id of each column)
         """
-        weight_map = {"view": 1, "apply": 3, "hire": 5}
-
-        interactions["weight"] = interactions["interaction_type"].map(weight_map)
+        user_codes, user_ids = pd.factorize(interactions["user_id"], sort=True)
+        project_codes, project_ids = pd.factorize(interactions["project_id"], sort=True)
+        weights = IMPLICIT_FEEDBACK_WEIGHT_LUT[
+            _interaction_type_codes(interactions["interaction_type"])
+        ]
 
-        # Aggregate by user-project
-        feedback_matrix = interactions.pivot_table(
-            index="user_id", columns="project_id", values="weight", aggfunc="sum", fill_value=0
-        )
+        # Repeated user-project pairs are summed when converting to CSR; int32
+        # keeps those sums from overflowing for heavy users
+        feedback_matrix = sparse.coo_matrix(
+            (weights, (user_codes, project_codes)),
+            shape=(len(user_ids), len(project_ids)),
+        ).tocsr()
+        feedback_matrix.eliminate_zeros()
 
-        return feedback_matrix
+        return feedback_matrix, pd.Index(user_ids), pd.Index(project_ids)
 
 
 def hash_user_id(user_id: str, salt: str = "recommendation") -> int:
@@ -374,8 +608,10 @@ def hash_user_id(user_id: str, salt: str = "recommendation") -> int:
     Returns:
         Integer hash value
     """
+    # MD5 is kept so existing users stay in their buckets; reading the digest
+    # bytes gives the same integer as parsing the hex digest
     hash_obj = hashlib.md5((user_id + salt).encode())
-    return int(hash_obj.hexdigest(), 16)
+    return int.from_bytes(hash_obj.digest(), "big")
 
 
 def assign_to_ab_test(user_id: str, traffic_split: float = 0.5) -> str:
@@ -6,12 +6,10 @@ Trains models on historical interaction data and evaluates performance.
 import pandas as pd
 import numpy as np
 from typing import Dict, Tuple
-from sklearn.model_selection import train_test_split
 from sklearn.metrics import (
     precision_score,
     recall_score,
     f1_score,
-    ndcg_score,
     mean_absolute_error,
 )
 import logging
@@ -23,7 +21,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from recommendation_engine import ProjectRecommendationEngine, TalentRecommendationEngine
-from feature_extractors import FeatureExtractor, InteractionAggregator
+from feature_extractors import (
+    FeatureExtractor,
+    InteractionAggregator,
+    as_interaction_categories,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -54,10 +56,14 @@ class ModelTrainer:
         """
         logger.info("Starting project recommendation model training...")
 
-        # Split data into train and test
-        train_data, test_data = train_test_split(
-            interaction_data, test_size=test_size, random_state=42
-        )
+        interaction_data = as_interaction_categories(interaction_data)
+
+        # Split data into train and test with one shuffle of row positions;
+        # the test size rounds up as train_test_split rounds it
+        n_test = int(np.ceil(len(interaction_data) * test_size))
+        order = np.random.default_rng(42).permutation(len(interaction_data))
+        test_data = interaction_data.iloc[order[:n_test]]
+        train_data = interaction_data.iloc[order[n_test:]]
 
         logger.info(f"Train size: {len(train_data)}, Test size: {len(test_data)}")
 
@@ -94,73 +100,76 @@ class ModelTrainer:
         """
         metrics = {}
 
-        # Group test data by user
-        user_groups = test_data.groupby("user_id")
-
-        for k in k_values:
-            precisions = []
-            recalls = []
-            ndcgs = []
-
-            for user_id, user_interactions in user_groups:
-                # Get actual positive interactions (applies and hires)
-                relevant_projects = set(
-                    user_interactions[
-                        user_interactions["interaction_type"].isin(["apply", "hire"])
-                    ]["project_id"].values
+        # Actual positive interactions (applies and hires) per user; users
+        # without any are not evaluated
+        positives = test_data[test_data["interaction_type"].isin(["apply", "hire"])]
+        relevant_by_user = positives.groupby("user_id")["project_id"].agg(set)
+
+        # All candidate projects, shared by every user
+        all_projects = test_data["project_id"].unique()
+        candidate_projects = [{"id": pid} for pid in all_projects]
+
+        # Rank once per user at the largest K; recommendations are a sorted
+        # list truncated to the limit, so each smaller K is a prefix of it
+        max_k = max(k_values)
+        hit_rows = []
+        num_recommended = []
+        num_relevant = []
+        for user_id, relevant_projects in relevant_by_user.items():
+            # Generate recommendations (mock developer profile for testing)
+            developer_profile = {
+                "user_id": user_id,
+                "skills": [],
+                "experience_level": "mid",
+                "hourly_rate": 50,
+            }
+
+            try:
+                recommendations = self.project_engine.generate_project_recommendations(
+                    user_id, developer_profile, candidate_projects, limit=max_k
                 )
+            except Exception as e:
+                logger.warning(f"Error generating recommendations for user {user_id}: {e}")
+                continue
+
+            # Relevance row (True for relevant) in rank order, padded to max_k
+            hits = np.zeros(max_k, dtype=bool)
+            hits[: len(recommendations)] = [
+                r["project_id"] in relevant_projects for r in recommendations
+            ]
+            hit_rows.append(hits)
+            num_recommended.append(len(recommendations))
+            num_relevant.append(len(relevant_projects))
+
+        hit_matrix = np.array(hit_rows, dtype=bool).reshape(-1, max_k)
+        num_recommended = np.array(num_recommended, dtype=np.int64)
+        num_relevant = np.array(num_relevant, dtype=np.int64)
+
+        # Cumulative log2 discounts: cum_discounts[n] is the ideal DCG of n hits
+        cum_discounts = np.concatenate(
+            [[0.0], np.cumsum(1.0 / np.log2(np.arange(2, max_k + 2)))]
+        )
 
-                if not relevant_projects:
-                    continue
-
-                # Get all candidate projects
-                all_projects = test_data["project_id"].unique()
-
-                # Generate recommendations (mock developer profile for testing)
-                developer_profile = {
-                    "user_id": user_id,
-                    "skills": [],
-                    "experience_level": "mid",
-                    "hourly_rate": 50,
-                }
-
-                candidate_projects = [{"id": pid} for pid in all_projects]
-
-                try:
-                    recommendations = self.project_engine.generate_project_recommendations(
-                        user_id, developer_profile, candidate_projects, limit=k
-                    )
-
-                    recommended_ids = [r["project_id"] for r in recommendations]
-
-                    # Calculate precision and recall
-                    relevant_recommended = len(set(recommended_ids) & relevant_projects)
-                    precision = relevant_recommended / k if k > 0 else 0
-                    recall = (
-                        relevant_recommended / len(relevant_projects)
-                        if relevant_projects
-                        else 0
-                    )
-
-                    precisions.append(precision)
-                    recalls.append(recall)
-
-                    # Calculate NDCG
-                    # Create relevance vector (1 for relevant, 0 for not)
-                    relevance = [1 if pid in relevant_projects else 0 for pid in recommended_ids]
-                    if sum(relevance) > 0:
-                        ndcgs.append(
-                            ndcg_score([relevance], [[1] * len(relevance)], k=len(relevance))
-                        )
-
-                except Exception as e:
-                    logger.warning(f"Error generating recommendations for user {user_id}: {e}")
-                    continue
+        for k in k_values:
+            # Calculate precision and recall
+            relevant_recommended = hit_matrix[:, :k].sum(axis=1)
+            precisions = relevant_recommended / k
+            recalls = relevant_recommended / num_relevant
+
+            # Calculate NDCG for users with at least one hit, giving every
+            # ranked item the same score: tied items share the mean gain, so
+            # DCG = hits / n * IDCG(n) over the n ranked items
+            scored = relevant_recommended > 0
+            ranked = np.minimum(num_recommended, k)[scored]
+            ndcgs = (
+                relevant_recommended[scored] / ranked * cum_discounts[ranked]
+                / cum_discounts[relevant_recommended[scored]]
+            )
 
             # Average metrics across users
-            metrics[f"precision@{k}"] = np.mean(precisions) if precisions else 0
-            metrics[f"recall@{k}"] = np.mean(recalls) if recalls else 0
-            metrics[f"ndcg@{k}"] = np.mean(ndcgs) if ndcgs else 0
+            metrics[f"precision@{k}"] = np.mean(precisions) if precisions.size else 0
+            metrics[f"recall@{k}"] = np.mean(recalls) if recalls.size else 0
+            metrics[f"ndcg@{k}"] = np.mean(ndcgs) if ndcgs.size else 0
 
         # Calculate overall F1 score
         if metrics.get("precision@10") and metrics.get("recall@10"):
@@ -186,6 +195,8 @@ class ModelTrainer:
         """
         metrics = {}
 
+        interaction_data = as_interaction_categories(interaction_data)
+
         # Count interaction types
         total_views = (interaction_data["interaction_type"] == "view").sum()
         total_applies = (interaction_data["interaction_type"] == "apply").sum()
@@ -200,27 +211,22 @@ class ModelTrainer:
         if "timestamp" in interaction_data.columns:
             interaction_data["timestamp"] = pd.to_datetime(interaction_data["timestamp"])
 
-            # Calculate time to apply (time between first view and apply)
-            user_project_times = interaction_data.sort_values("timestamp").groupby(
-                ["user_id", "project_id"]
-            )
-
-            apply_times = []
-            for (user_id, project_id), group in user_project_times:
-                views = group[group["interaction_type"] == "view"]
-                applies = group[group["interaction_type"] == "apply"]
-
-                if not views.empty and not applies.empty:
-                    first_view = views.iloc[0]["timestamp"]
-                    first_apply = applies.iloc[0]["timestamp"]
-                    time_diff_hours = (first_apply - first_view).total_seconds() / 3600
-                    apply_times.append(time_diff_hours)
+            # Calculate time to apply (time between first view and first apply)
+            first_times = {
+                interaction_type: interaction_data[
+                    interaction_data["interaction_type"] == interaction_type
+                ].groupby(["user_id", "project_id"])["timestamp"].min()
+                for interaction_type in ("view", "apply")
+            }
+            apply_times = (
+                (first_times["apply"] - first_times["view"]).dropna().dt.total_seconds() / 3600
+            ).to_numpy()
 
             metrics["avg_time_to_apply_hours"] = (
-                np.mean(apply_times) if apply_times else None
+                np.mean(apply_times) if apply_times.size else None
             )
             metrics["median_time_to_apply_hours"] = (
-                np.median(apply_times) if apply_times else None
+                np.median(apply_times) if apply_times.size else None
             )
 
         return metrics
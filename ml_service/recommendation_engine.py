@@ -6,17 +6,83 @@ for developer-project and client-talent matching.
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from typing import List, Dict, Tuple, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.preprocessing import StandardScaler
+import os
 import pickle
 import logging
+import uuid
+import orjson
+
+from feature_extractors import InteractionAggregator
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return indices of the k highest scores, best first.
+
+    Uses argpartition so only the selected k entries are sorted
+    (O(N + k log k) instead of a full O(N log N) sort). Ties are broken by
+    position, matching a stable descending sort.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return np.argsort(-scores, kind="stable")
+
+    kth_score = -np.partition(-scores, k - 1)[k - 1]
+    # Every entry tied with the k-th score, in original order
+    top = np.flatnonzero(scores >= kth_score)
+    return top[np.argsort(-scores[top], kind="stable")][:k]
+
+
+# Similar users precomputed per user at train time; larger top_k_similar
+# requests fall back to computing the user's similarity row on demand
+NEIGHBORHOOD_SIZE = 50
+
+# Upper bound on similarity entries materialized per block while the
+# neighbourhoods are precomputed
+NEIGHBORHOOD_BLOCK_ENTRIES = 1 << 22
+
+# Default pool for batch recommendation calls, shared by every engine; worker
+# threads are only started on first use
+BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+# Ordinal ranks shared by both engines' experience fit; unknown values rank 2
+EXPERIENCE_LEVEL_RANKS = {"junior": 1, "mid": 2, "senior": 3, "expert": 4}
+COMPLEXITY_LEVEL_RANKS = {"low": 1, "medium": 2, "high": 3, "expert": 4}
+
+
+def experience_fit_scores(developer_levels, project_complexities) -> np.ndarray:
+    """
+    Calculate experience-complexity match, broadcasting a single level or
+    complexity against a list of the other.
+
+    Levels: junior, mid, senior, expert
+    Complexity: low, medium, high, expert
+
+    Perfect match = 1.0, one level off = 0.7, two+ levels = 0.4
+    """
+    dev_level = np.array(
+        [EXPERIENCE_LEVEL_RANKS.get(level, 2) for level in np.atleast_1d(developer_levels)]
+    )
+    proj_complexity = np.array(
+        [
+            COMPLEXITY_LEVEL_RANKS.get(complexity, 2)
+            for complexity in np.atleast_1d(project_complexities)
+        ]
+    )
+
+    diff = np.abs(dev_level - proj_complexity)
+    return np.select([diff == 0, diff == 1], [1.0, 0.7], 0.4)
+
+
 class ProjectRecommendationEngine:
     """
     Main recommendation engine combining collaborative filtering
@@ -24,12 +90,16 @@ class ProjectRecommendationEngine:
     """
 
     def __init__(self):
-        self.similarity_model = None
+        self.user_vectors = None
+        self.neighbor_indices = None
+        self.neighbor_similarities = None
         self.content_model = None
-        self.scaler = StandardScaler()
         self.user_item_matrix = None
         self.user_index = {}
         self.item_index = {}
+        self.item_ids = []
+        self.item_vectors = None
+        self.matrix_stats = {"num_users": 0, "num_projects": 0, "matrix_sparsity": None}
         self.model_version = f"v1.0_{datetime.now().strftime('%Y%m%d')}"
 
     def train_collaborative_model(self, interaction_data: pd.DataFrame) -> Dict:
@@ -46,50 +116,187 @@ class ProjectRecommendationEngine:
         logger.info("Training collaborative filtering model...")
 
         # Create user-item interaction matrix
-        self.user_item_matrix = self._create_interaction_matrix(interaction_data)
-
-        # Calculate user-user similarity using cosine similarity
-        self.similarity_model = cosine_similarity(self.user_item_matrix)
+        self.user_item_matrix, user_ids, item_ids = self._create_interaction_matrix(
+            interaction_data
+        )
 
         # Store user and item indexes
-        self.user_index = {
-            user_id: idx for idx, user_id in enumerate(self.user_item_matrix.index)
-        }
-        self.item_index = {
-            item_id: idx for idx, item_id in enumerate(self.user_item_matrix.columns)
-        }
+        self.user_index = {user_id: idx for idx, user_id in enumerate(user_ids)}
+        self.item_index = {item_id: idx for idx, item_id in enumerate(item_ids)}
+        self.item_ids = list(item_ids)
+        self._build_user_vectors()
+        self._build_neighborhoods()
+        self._build_item_vectors()
+        self._compute_matrix_stats()
 
         metrics = {
-            "num_users": len(self.user_index),
-            "num_items": len(self.item_index),
-            "sparsity": 1
-            - (self.user_item_matrix.astype(bool).sum().sum() / self.user_item_matrix.size),
+            "num_users": self.matrix_stats["num_users"],
+            "num_items": self.matrix_stats["num_projects"],
+            "sparsity": self.matrix_stats["matrix_sparsity"],
             "model_version": self.model_version,
         }
 
         logger.info(f"Collaborative model trained: {metrics}")
         return metrics
 
-    def _create_interaction_matrix(self, interaction_data: pd.DataFrame) -> pd.DataFrame:
+    def _create_interaction_matrix(
+        self, interaction_data: pd.DataFrame
+    ) -> Tuple[sparse.csr_matrix, pd.Index, pd.Index]:
         """
         Create user-item interaction matrix with weighted interactions.
 
+        Only nonzero (user, project, weight) entries are stored, so memory
+        grows with the number of interactions rather than users x projects.
+
         Interaction weights:
         - view: 1
         - apply: 3
         - hire: 5
+
+        Returns:
+            (CSR matrix with users as rows and projects as columns,
+            sorted user ids of the rows, sorted project ids of the columns)
+        """
+        # Weights are gathered from a lookup table by interaction type code;
+        # float64 keeps similarities (and their tie order) as before
+        matrix, user_ids, item_ids = InteractionAggregator.create_implicit_feedback_matrix(
+            interaction_data
+        )
+
+        return matrix.astype(np.float64), user_ids, item_ids
+
+    @staticmethod
+    def _normalize_rows(matrix: sparse.csr_matrix, dtype=np.float64) -> sparse.csr_matrix:
+        """L2-normalize the rows of a CSR matrix, keeping it sparse."""
+        data = matrix.data.astype(dtype, copy=False)
+        rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=matrix.shape[0]))
+
+        return sparse.csr_matrix(
+            ((data / norms[rows]).astype(dtype, copy=False), matrix.indices, matrix.indptr),
+            shape=matrix.shape,
+        )
+
+    def _build_user_vectors(self):
+        """
+        Precompute L2-normalized user vectors (sparse users x items, float64).
+
+        A user's cosine similarity to every other user is one sparse
+        matrix-vector product, so no users x users matrix is ever stored.
         """
-        # Map interaction types to weights
-        weight_map = {"view": 1, "apply": 3, "hire": 5}
+        self.user_vectors = self._normalize_rows(self.user_item_matrix)
 
-        interaction_data["weight"] = interaction_data["interaction_type"].map(weight_map)
+    def _build_neighborhoods(self):
+        """
+        Precompute each user's NEIGHBORHOOD_SIZE most similar users.
 
-        # Aggregate interactions by user-project
-        matrix_data = (
-            interaction_data.groupby(["user_id", "project_id"])["weight"].sum().unstack(fill_value=0)
+        Similarity rows are materialized a block of users at a time and
+        reduced to (users x K) neighbour index and similarity tables, so the
+        online path is a row lookup instead of a product and selection.
+        """
+        num_users = self.user_vectors.shape[0]
+        k = min(NEIGHBORHOOD_SIZE, max(num_users - 1, 0))
+        self.neighbor_indices = np.empty((num_users, k), dtype=np.int32)
+        self.neighbor_similarities = np.empty((num_users, k), dtype=np.float64)
+
+        block_size = max(1, NEIGHBORHOOD_BLOCK_ENTRIES // max(num_users, 1))
+        vectors_t = self.user_vectors.T.tocsr()
+        for start in range(0, num_users, block_size):
+            stop = min(start + block_size, num_users)
+            block = (self.user_vectors[start:stop] @ vectors_t).toarray()
+            for offset, user_idx in enumerate(range(start, stop)):
+                similarity_scores = block[offset]
+                neighbor_scores = similarity_scores.copy()
+                neighbor_scores[user_idx] = -np.inf
+                top = top_k_indices(neighbor_scores, k)
+                self.neighbor_indices[user_idx] = top
+                self.neighbor_similarities[user_idx] = similarity_scores[top]
+
+    def _similar_users(self, user_idx: int, top_k_similar: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (indices, similarities) of a user's most similar users, best first.
+        """
+        k = min(top_k_similar, self.user_vectors.shape[0] - 1)
+        if self.neighbor_indices is not None and k <= self.neighbor_indices.shape[1]:
+            return self.neighbor_indices[user_idx, :k], self.neighbor_similarities[user_idx, :k]
+
+        # Cosine similarity to every user, computed from the sparse
+        # normalized vectors on demand (O(nnz) rather than a stored U x U row)
+        similarity_scores = (
+            (self.user_vectors @ self.user_vectors[user_idx].T).toarray().ravel()
         )
 
-        return matrix_data
+        # Top-k similar users (excluding self); only the k selected users are sorted
+        neighbor_scores = similarity_scores.copy()
+        neighbor_scores[user_idx] = -np.inf
+        top = top_k_indices(neighbor_scores, k)
+        return top, similarity_scores[top]
+
+    def _build_item_vectors(self):
+        """
+        Precompute L2-normalized item vectors (sparse items x users, float32).
+
+        A dot product between two rows is then their cosine similarity, so
+        item-item lookups are a single sparse matrix-vector product and the
+        vectors take memory in proportion to the interactions.
+        """
+        self.item_vectors = self._normalize_rows(self.user_item_matrix.T.tocsr(), np.float32)
+
+    def _compute_matrix_stats(self):
+        """
+        Cache user/project counts and sparsity of the interaction matrix.
+
+        Only called when the matrix changes (training or load), so model-info
+        polls never rescan it.
+        """
+        matrix = self.user_item_matrix
+        if matrix is None:
+            self.matrix_stats = {"num_users": 0, "num_projects": 0, "matrix_sparsity": None}
+            return
+
+        size = matrix.shape[0] * matrix.shape[1]
+        if hasattr(matrix, "nnz"):
+            nonzero = matrix.nnz
+        else:
+            # count_nonzero avoids materializing a boolean copy of the matrix
+            nonzero = np.count_nonzero(np.asarray(matrix))
+
+        self.matrix_stats = {
+            "num_users": len(self.user_index),
+            "num_projects": len(self.item_index),
+            "matrix_sparsity": float(1 - nonzero / size) if size else None,
+        }
+
+    def find_similar_projects(self, project_id: str, limit: int = 10) -> List[Dict]:
+        """
+        Find projects whose interaction patterns are most similar to a project.
+
+        Args:
+            project_id: Reference project ID
+            limit: Number of similar projects to return
+
+        Returns:
+            List of dicts with project_id, similarity_score and rank_position
+        """
+        if self.item_vectors is None or project_id not in self.item_index:
+            return []
+
+        project_idx = self.item_index[project_id]
+        similarities = (
+            (self.item_vectors @ self.item_vectors[project_idx].T).toarray().ravel()
+        )
+        similarities[project_idx] = -np.inf  # Exclude the project itself
+
+        top = top_k_indices(similarities, min(limit, len(similarities) - 1))
+
+        return [
+            {
+                "project_id": self.item_ids[idx],
+                "similarity_score": round(float(similarities[idx]), 4),
+                "rank_position": rank,
+            }
+            for rank, idx in enumerate(top, 1)
+        ]
 
     def calculate_collaborative_scores(
         self, user_id: str, candidate_projects: List[str], top_k_similar: int = 50
@@ -105,38 +312,32 @@ class ProjectRecommendationEngine:
         Returns:
             Dictionary mapping project_id to collaborative score
         """
-        if self.similarity_model is None or user_id not in self.user_index:
+        if self.user_vectors is None or user_id not in self.user_index:
             # Cold start: return neutral scores
             return {project_id: 0.5 for project_id in candidate_projects}
 
         user_idx = self.user_index[user_id]
 
-        # Get top-k similar users (excluding self)
-        similarity_scores = self.similarity_model[user_idx]
-        similar_user_indices = np.argsort(similarity_scores)[::-1][1 : top_k_similar + 1]
+        # Get top-k similar users (excluding self), precomputed at train time
+        similar_user_indices, similarities = self._similar_users(user_idx, top_k_similar)
+
+        # Weighted average of the similar users' positive interactions, for
+        # every project at once: numerator sums similarity * interaction and
+        # denominator sums similarity over the users who interacted
+        neighbor_interactions = self.user_item_matrix[similar_user_indices]
+        numerators = neighbor_interactions.T @ similarities
+        denominators = (neighbor_interactions > 0).T @ similarities
 
         scores = {}
         for project_id in candidate_projects:
-            if project_id not in self.item_index:
+            project_idx = self.item_index.get(project_id)
+            if project_idx is None:
                 scores[project_id] = 0.5  # Neutral score for new items
                 continue
 
-            project_idx = self.item_index[project_id]
-
-            # Calculate weighted average of similar users' interactions
-            numerator = 0
-            denominator = 0
-
-            for similar_idx in similar_user_indices:
-                similarity = similarity_scores[similar_idx]
-                interaction = self.user_item_matrix.iloc[similar_idx, project_idx]
-
-                if interaction > 0:
-                    numerator += similarity * interaction
-                    denominator += similarity
-
+            denominator = denominators[project_idx]
             if denominator > 0:
-                score = numerator / denominator
+                score = numerators[project_idx] / denominator
                 # Normalize to 0-1 range
                 scores[project_id] = min(score / 10.0, 1.0)
             else:
@@ -144,8 +345,16 @@ class ProjectRecommendationEngine:
 
         return scores
 
+    @staticmethod
+    def required_skill_sets(projects: List[Dict]) -> List[frozenset]:
+        """Hash each project's required skills once, for reuse across developers."""
+        return [frozenset(project.get("required_skills", [])) for project in projects]
+
     def calculate_content_scores(
-        self, developer_profile: Dict, projects: List[Dict]
+        self,
+        developer_profile: Dict,
+        projects: List[Dict],
+        required_skill_sets: Optional[List[frozenset]] = None,
     ) -> Dict[str, Dict]:
         """
         Calculate content-based scores using profile-project matching.
@@ -153,63 +362,88 @@ class ProjectRecommendationEngine:
         Args:
             developer_profile: Dict with keys [skills, experience_level, hourly_rate, preferences]
             projects: List of project dicts with [id, required_skills, complexity, budget_range]
+            required_skill_sets: required_skill_sets(projects), when already
+                computed for another developer
+
+        Each component is computed for all projects at once as a column.
 
         Returns:
             Dictionary mapping project_id to score breakdown
         """
-        scores = {}
-
         developer_skills = set(developer_profile.get("skills", []))
         experience_level = developer_profile.get("experience_level", "mid")
         hourly_rate = developer_profile.get("hourly_rate", 50)
         preferences = developer_profile.get("preferences", {})
 
-        for project in projects:
-            project_id = project["id"]
-
-            # Skill match score
-            required_skills = set(project.get("required_skills", []))
-            if len(required_skills) > 0:
-                skill_overlap = len(developer_skills & required_skills)
-                skill_match = skill_overlap / len(required_skills)
-            else:
-                skill_match = 0.5
+        # Skill match score: share of each project's required skills covered
+        required_skills = required_skill_sets
+        if required_skills is None:
+            required_skills = self.required_skill_sets(projects)
+        required_counts = np.array([len(skills) for skills in required_skills], dtype=np.float64)
+        skill_overlaps = np.array(
+            [len(developer_skills & skills) for skills in required_skills], dtype=np.float64
+        )
+        skill_match = np.divide(
+            skill_overlaps,
+            required_counts,
+            out=np.full(len(projects), 0.5),
+            where=required_counts > 0,
+        )
 
-            # Experience match score
-            experience_match = self._calculate_experience_fit(
-                experience_level, project.get("complexity_level", "medium")
-            )
+        # Experience match score
+        experience_match = experience_fit_scores(
+            experience_level,
+            [project.get("complexity_level", "medium") for project in projects],
+        )
 
-            # Budget fit score
-            budget_fit = self._calculate_budget_alignment(
-                hourly_rate, project.get("budget_range", {})
-            )
+        # Budget fit score
+        budget_fit = np.array(
+            [
+                self._calculate_budget_alignment(hourly_rate, project.get("budget_range", {}))
+                for project in projects
+            ],
+            dtype=np.float64,
+        )
 
-            # Recency bonus (newer projects get slight boost)
-            recency_score = self._calculate_recency_score(project.get("created_at"))
+        # Recency bonus (newer projects get slight boost)
+        recency_score = self._recency_scores([project.get("created_at") for project in projects])
 
-            # Preference match (project type, remote vs onsite, etc.)
-            preference_match = self._calculate_preference_match(preferences, project)
+        # Preference match (project type, remote vs onsite, etc.)
+        preference_match = np.array(
+            [self._calculate_preference_match(preferences, project) for project in projects],
+            dtype=np.float64,
+        )
 
-            # Composite score with weights
-            composite_score = (
-                skill_match * 0.35
-                + experience_match * 0.20
-                + budget_fit * 0.25
-                + recency_score * 0.10
-                + preference_match * 0.10
-            )
+        # Composite score with weights
+        composite_score = (
+            skill_match * 0.35
+            + experience_match * 0.20
+            + budget_fit * 0.25
+            + recency_score * 0.10
+            + preference_match * 0.10
+        )
 
-            scores[project_id] = {
-                "skill_match": round(skill_match, 4),
-                "experience_match": round(experience_match, 4),
-                "budget_fit": round(budget_fit, 4),
-                "recency_score": round(recency_score, 4),
-                "preference_match": round(preference_match, 4),
-                "composite_score": round(composite_score, 4),
+        columns = zip(
+            skill_match.tolist(),
+            experience_match.tolist(),
+            budget_fit.tolist(),
+            recency_score.tolist(),
+            preference_match.tolist(),
+            composite_score.tolist(),
+        )
+        return {
+            project["id"]: {
+                "skill_match": round(skill, 4),
+                "experience_match": round(experience, 4),
+                "budget_fit": round(budget, 4),
+                "recency_score": round(recency, 4),
+                "preference_match": round(preference, 4),
+                "composite_score": round(composite, 4),
             }
-
-        return scores
+            for project, (skill, experience, budget, recency, preference, composite) in zip(
+                projects, columns
+            )
+        }
 
     def _calculate_skill_overlap(
         self, developer_skills: set, required_skills: set
@@ -223,30 +457,6 @@ class ProjectRecommendationEngine:
 
         return intersection / union if union > 0 else 0
 
-    def _calculate_experience_fit(
-        self, developer_level: str, project_complexity: str
-    ) -> float:
-        """
-        Calculate experience-complexity match.
-
-        Levels: junior, mid, senior, expert
-        Complexity: low, medium, high, expert
-        """
-        level_map = {"junior": 1, "mid": 2, "senior": 3, "expert": 4}
-        complexity_map = {"low": 1, "medium": 2, "high": 3, "expert": 4}
-
-        dev_level = level_map.get(developer_level, 2)
-        proj_complexity = complexity_map.get(project_complexity, 2)
-
-        # Perfect match = 1.0, one level off = 0.7, two+ levels = 0.4
-        diff = abs(dev_level - proj_complexity)
-        if diff == 0:
-            return 1.0
-        elif diff == 1:
-            return 0.7
-        else:
-            return 0.4
-
     def _calculate_budget_alignment(self, hourly_rate: float, budget_range: Dict) -> float:
         """
         Calculate budget alignment score.
@@ -287,31 +497,38 @@ class ProjectRecommendationEngine:
             ratio = budget_max / hourly_rate
             return max(ratio * 0.6, 0.2)
 
-    def _calculate_recency_score(self, created_at: Optional[datetime]) -> float:
+    def _recency_scores(self, created_ats: List[Optional[datetime]]) -> np.ndarray:
         """
         Give slight boost to newer projects.
 
         Projects < 7 days: 1.0
         Projects < 14 days: 0.9
         Projects < 30 days: 0.8
-        Projects older: 0.7
-        """
-        if not created_at:
-            return 0.7
-
-        if isinstance(created_at, str):
-            created_at = pd.to_datetime(created_at)
-
-        days_old = (datetime.now() - created_at).days
+        Projects older (or undated): 0.7
 
-        if days_old < 7:
-            return 1.0
-        elif days_old < 14:
-            return 0.9
-        elif days_old < 30:
-            return 0.8
+        All timestamps are aged against one clock reading. Naive datetimes (as
+        the API delivers after validation) are aged with NumPy datetime64
+        arithmetic; anything else is parsed in one pandas call.
+        """
+        scores = np.full(len(created_ats), 0.7)
+        dated = [idx for idx, created_at in enumerate(created_ats) if created_at]
+        if not dated:
+            return scores
+
+        values = [created_ats[idx] for idx in dated]
+        now = datetime.now()
+        if all(isinstance(value, datetime) and value.tzinfo is None for value in values):
+            created = np.array(values, dtype="datetime64[us]")
+            days_old = (np.datetime64(now, "us") - created) // np.timedelta64(1, "D")
         else:
-            return 0.7
+            # format="mixed" infers each string's format, as parsing them one by one did
+            created = pd.to_datetime(values, format="mixed")
+            days_old = (pd.Timestamp(now) - created).days.to_numpy()
+
+        scores[dated] = np.select(
+            [days_old < 7, days_old < 14, days_old < 30], [1.0, 0.9, 0.8], 0.7
+        )
+        return scores
 
     def _calculate_preference_match(self, preferences: Dict, project: Dict) -> float:
         """
@@ -360,6 +577,7 @@ class ProjectRecommendationEngine:
         candidate_projects: List[Dict],
         limit: int = 10,
         hybrid_weights: Dict[str, float] = None,
+        required_skill_sets: Optional[List[frozenset]] = None,
     ) -> List[Dict]:
         """
         Generate hybrid recommendations combining collaborative and content-based scores.
@@ -370,6 +588,7 @@ class ProjectRecommendationEngine:
             candidate_projects: List of open projects to consider
             limit: Number of recommendations to return
             hybrid_weights: Dict with 'collaborative' and 'content' weights (default 0.6/0.4)
+            required_skill_sets: Precomputed required_skill_sets(candidate_projects)
 
         Returns:
             List of recommendation dicts with scores and explanations
@@ -382,11 +601,14 @@ class ProjectRecommendationEngine:
         collaborative_scores = self.calculate_collaborative_scores(developer_id, project_ids)
 
         # Get content-based scores
-        content_scores = self.calculate_content_scores(developer_profile, candidate_projects)
+        content_scores = self.calculate_content_scores(
+            developer_profile, candidate_projects, required_skill_sets
+        )
 
         # Combine scores
-        recommendations = []
-        for project in candidate_projects:
+        hybrid_scores = []
+        relevance_scores = np.empty(len(candidate_projects))
+        for row, project in enumerate(candidate_projects):
             project_id = project["id"]
 
             collab_score = collaborative_scores.get(project_id, 0.5)
@@ -399,6 +621,16 @@ class ProjectRecommendationEngine:
                 + content_score * hybrid_weights["content"]
             )
 
+            relevance_scores[row] = round(relevance_score, 4)
+            hybrid_scores.append((collab_score, content_breakdown, content_score))
+
+        # Rank by rounded relevance, ties in candidate order; explanations and
+        # result dicts are only built for the top `limit` projects
+        recommendations = []
+        for rank, idx in enumerate(top_k_indices(relevance_scores, limit), 1):
+            project = candidate_projects[idx]
+            collab_score, content_breakdown, content_score = hybrid_scores[idx]
+
             # Generate explanation
             explanation = self._generate_explanation(
                 content_breakdown, collab_score, developer_profile, project
@@ -406,8 +638,8 @@ class ProjectRecommendationEngine:
 
             recommendations.append(
                 {
-                    "project_id": project_id,
-                    "relevance_score": round(relevance_score, 4),
+                    "project_id": project["id"],
+                    "relevance_score": float(relevance_scores[idx]),
                     "collaborative_score": round(collab_score, 4),
                     "content_score": round(content_score, 4),
                     "skill_match_score": content_breakdown.get("skill_match", 0.5),
@@ -416,17 +648,58 @@ class ProjectRecommendationEngine:
                     "recency_score": content_breakdown.get("recency_score", 0.7),
                     "explanation": explanation,
                     "model_version": self.model_version,
+                    "rank_position": rank,
                 }
             )
 
-        # Sort by relevance and rank
-        recommendations.sort(key=lambda x: x["relevance_score"], reverse=True)
+        return recommendations
 
-        # Add rank position
-        for idx, rec in enumerate(recommendations[:limit]):
-            rec["rank_position"] = idx + 1
+    def generate_project_recommendations_batch(
+        self,
+        developers: List[Tuple[str, Dict]],
+        candidate_projects: List[Dict],
+        limit: int = 10,
+        hybrid_weights: Dict[str, float] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[List[Dict]]:
+        """
+        Generate recommendations for many developers over one candidate list.
+
+        Developers are scored concurrently on a thread pool that shares this
+        engine's neighbourhoods and interaction matrix; nothing is copied per
+        worker. Only the sparse and NumPy steps release the GIL; the
+        per-project dict and loop work still runs one thread at a time, so the
+        speed-up is bounded by the vectorized share. Project skill sets are
+        hashed once for the whole batch.
 
-        return recommendations[:limit]
+        Args:
+            developers: (developer_id, developer_profile) pairs
+            candidate_projects: Open projects considered for every developer
+            limit: Number of recommendations per developer
+            hybrid_weights: As for generate_project_recommendations
+            executor: Pool to run on, e.g. the API's engine_executor (defaults
+                to the module's BATCH_EXECUTOR). Do not pass the pool this call
+                itself runs on: it would wait on its own workers.
+
+        Returns:
+            One recommendation list per developer, in input order
+        """
+        required_skill_sets = self.required_skill_sets(candidate_projects)
+
+        pool = executor or BATCH_EXECUTOR
+        futures = [
+            pool.submit(
+                self.generate_project_recommendations,
+                developer_id,
+                developer_profile,
+                candidate_projects,
+                limit,
+                hybrid_weights,
+                required_skill_sets,
+            )
+            for developer_id, developer_profile in developers
+        ]
+        return [future.result() for future in futures]
 
     def _generate_explanation(
         self, content_breakdown: Dict, collab_score: float, profile: Dict, project: Dict
@@ -467,32 +740,194 @@ class ProjectRecommendationEngine:
 
         return explanation
 
+    @staticmethod
+    def _array_path(filepath: str, name: str, array_stem: Optional[str] = None) -> str:
+        """
+        Path of a model array stored next to the model file at `filepath`.
+
+        Manifests written by save_model name a per-save `array_stem`; older
+        ones keep their arrays under the model file's own base name.
+        """
+        if array_stem is None:
+            return f"{os.path.splitext(filepath)[0]}.{name}.npy"
+        return os.path.join(os.path.dirname(filepath), f"{array_stem}.{name}.npy")
+
+    def _manifest_array_paths(self, filepath: str) -> List[str]:
+        """Array files named by the JSON manifest currently at `filepath`, if any."""
+        try:
+            with open(filepath, "rb") as f:
+                raw = f.read()
+            model_data = orjson.loads(raw) if raw[:1] == b"{" else {}
+        except (OSError, orjson.JSONDecodeError):
+            return []
+
+        return [
+            self._array_path(filepath, name, model_data.get("array_stem"))
+            for name in model_data.get("array_files", [])
+        ]
+
+    @staticmethod
+    def _csr_arrays(name: str, matrix: sparse.csr_matrix) -> Dict[str, np.ndarray]:
+        """The three component arrays of a CSR matrix, keyed `<name>_<part>`."""
+        return {
+            f"{name}_data": matrix.data,
+            f"{name}_indices": matrix.indices,
+            f"{name}_indptr": matrix.indptr,
+        }
+
+    @staticmethod
+    def _csr_from_arrays(
+        arrays: Dict[str, np.ndarray], name: str, shape: List[int]
+    ) -> sparse.csr_matrix:
+        """Reassemble a CSR matrix around (possibly memory-mapped) component arrays."""
+        return sparse.csr_matrix(
+            (arrays[f"{name}_data"], arrays[f"{name}_indices"], arrays[f"{name}_indptr"]),
+            shape=tuple(shape),
+            copy=False,
+        )
+
     def save_model(self, filepath: str):
-        """Save trained model to disk."""
+        """
+        Save trained model to disk.
+
+        Large arrays are written as .npy files next to `filepath` so that
+        load_model can memory-map them. The sparse interaction matrix and
+        item vectors are stored as their three CSR component arrays. User
+        vectors share the interaction matrix's sparsity structure, so only
+        their normalized values are stored; the precomputed neighbourhoods
+        are stored as is. `filepath` itself holds a JSON manifest with the
+        array names, the user/item ids in index order and the model version.
+
+        Every save writes its arrays under a fresh stem that only the new
+        manifest names, then swaps the manifest in with os.replace. Readers
+        therefore see either the old model or the new one, never a mix, and a
+        failed save leaves the old model untouched. The superseded arrays are
+        deleted afterwards; workers that mapped them keep their pages, but a
+        load that read the old manifest just before the swap must be retried.
+        """
+        interactions = self.user_item_matrix
+        arrays = {
+            **self._csr_arrays("interactions", interactions),
+            **self._csr_arrays("item_vectors", self.item_vectors),
+            "user_vectors_data": self.user_vectors.data,
+            "neighbor_indices": self.neighbor_indices,
+            "neighbor_similarities": self.neighbor_similarities,
+        }
+        array_stem = f"{os.path.splitext(os.path.basename(filepath))[0]}.{uuid.uuid4().hex[:12]}"
         model_data = {
-            "similarity_model": self.similarity_model,
-            "user_item_matrix": self.user_item_matrix,
-            "user_index": self.user_index,
-            "item_index": self.item_index,
+            "array_files": sorted(arrays),
+            "array_stem": array_stem,
+            "interactions_shape": list(interactions.shape),
+            "item_vectors_shape": list(self.item_vectors.shape),
+            # Ids are stored as lists (not dict keys) so non-string ids
+            # round-trip with their JSON type
+            "user_ids": sorted(self.user_index, key=self.user_index.get),
+            "item_labels": self.item_ids,
             "model_version": self.model_version,
             "saved_at": datetime.now().isoformat(),
         }
-
-        with open(filepath, "wb") as f:
-            pickle.dump(model_data, f)
+        manifest = orjson.dumps(model_data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+        superseded = self._manifest_array_paths(filepath)
+        temp_manifest = f"{filepath}.tmp"
+        written = []
+        try:
+            for name, array in arrays.items():
+                path = self._array_path(filepath, name, array_stem)
+                written.append(path)
+                np.save(path, np.ascontiguousarray(array))
+            with open(temp_manifest, "wb") as f:
+                f.write(manifest)
+        except BaseException:
+            for path in written + [temp_manifest]:
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+
+        # Swapping the manifest is the single commit point of the save
+        os.replace(temp_manifest, filepath)
+
+        for path in superseded:
+            if path not in written and os.path.exists(path):
+                os.remove(path)
 
         logger.info(f"Model saved to {filepath}")
 
     def load_model(self, filepath: str):
-        """Load trained model from disk."""
-        with open(filepath, "rb") as f:
-            model_data = pickle.load(f)
+        """
+        Load trained model from disk.
 
-        self.similarity_model = model_data["similarity_model"]
-        self.user_item_matrix = model_data["user_item_matrix"]
-        self.user_index = model_data["user_index"]
-        self.item_index = model_data["item_index"]
+        Arrays saved alongside the manifest are opened read-only with
+        mmap_mode="r", so every worker process maps the same page-cache pages
+        instead of holding a private copy. Older pickled manifests, single-file
+        pickles and dense interaction or item-vector arrays are still
+        accepted; they are converted to CSR in memory.
+        """
+        with open(filepath, "rb") as f:
+            raw = f.read()
+
+        # JSON manifests start with "{"; anything else predates them
+        model_data = orjson.loads(raw) if raw[:1] == b"{" else pickle.loads(raw)
+
+        if "array_files" in model_data:
+            arrays = {
+                name: np.load(
+                    self._array_path(filepath, name, model_data.get("array_stem")),
+                    mmap_mode="r",
+                )
+                for name in model_data["array_files"]
+            }
+            if "interactions" in arrays:
+                self.user_item_matrix = sparse.csr_matrix(arrays["interactions"])
+            else:
+                self.user_item_matrix = self._csr_from_arrays(
+                    arrays, "interactions", model_data["interactions_shape"]
+                )
+            if "user_vectors_data" in arrays:
+                self.user_vectors = sparse.csr_matrix(
+                    (
+                        arrays["user_vectors_data"],
+                        self.user_item_matrix.indices,
+                        self.user_item_matrix.indptr,
+                    ),
+                    shape=self.user_item_matrix.shape,
+                    copy=False,
+                )
+            else:
+                self._build_user_vectors()
+            if "item_vectors_data" in arrays:
+                self.item_vectors = self._csr_from_arrays(
+                    arrays, "item_vectors", model_data["item_vectors_shape"]
+                )
+            else:
+                # Dense item vectors predate the sparse layout
+                self._build_item_vectors()
+            self.neighbor_indices = arrays.get("neighbor_indices")
+            self.neighbor_similarities = arrays.get("neighbor_similarities")
+            self.item_ids = list(model_data["item_labels"])
+        else:
+            legacy_matrix = model_data["user_item_matrix"]
+            self.user_item_matrix = sparse.csr_matrix(
+                legacy_matrix.to_numpy(dtype=np.float64)
+            )
+            self.item_ids = list(legacy_matrix.columns)
+            self.neighbor_indices = None
+            self.neighbor_similarities = None
+            self._build_user_vectors()
+            self._build_item_vectors()
+
+        if "user_ids" in model_data:
+            self.user_index = {
+                user_id: idx for idx, user_id in enumerate(model_data["user_ids"])
+            }
+            self.item_index = {item_id: idx for idx, item_id in enumerate(self.item_ids)}
+        else:
+            self.user_index = model_data["user_index"]
+            self.item_index = model_data["item_index"]
         self.model_version = model_data["model_version"]
+        if self.neighbor_indices is None:
+            self._build_neighborhoods()
+        self._compute_matrix_stats()
 
         logger.info(f"Model loaded from {filepath} (version: {self.model_version})")
 
@@ -519,26 +954,38 @@ class TalentRecommendationEngine:
         Returns:
             List of developer recommendation dicts
         """
-        recommendations = []
-
         required_skills = set(project.get("required_skills", []))
         project_complexity = project.get("complexity_level", "medium")
         budget_range = project.get("budget_range", {})
 
-        for developer in candidate_developers:
-            dev_skills = set(developer.get("skills", []))
+        # Score every candidate first; explanations and result dicts are only
+        # built for the developers that make the top `limit`
+        experience_matches = experience_fit_scores(
+            [developer.get("experience_level", "mid") for developer in candidate_developers],
+            project_complexity,
+        ).tolist()
+
+        # Skill match for all candidates; intersecting the required set with
+        # each skill list avoids building a set per developer
+        if required_skills:
+            skill_overlaps = np.array(
+                [
+                    len(required_skills.intersection(developer.get("skills", [])))
+                    for developer in candidate_developers
+                ],
+                dtype=np.float64,
+            )
+            skill_matches = (skill_overlaps / len(required_skills)).tolist()
+        else:
+            skill_matches = [0.5] * len(candidate_developers)
 
+        component_scores = []
+        for row, developer in enumerate(candidate_developers):
             # Skill match
-            if required_skills:
-                skill_overlap = len(dev_skills & required_skills)
-                skill_match = skill_overlap / len(required_skills)
-            else:
-                skill_match = 0.5
+            skill_match = skill_matches[row]
 
             # Experience match
-            experience_match = self._calculate_experience_fit(
-                developer.get("experience_level", "mid"), project_complexity
-            )
+            experience_match = experience_matches[row]
 
             # Budget alignment
             hourly_rate = developer.get("hourly_rate", 50)
@@ -550,13 +997,29 @@ class TalentRecommendationEngine:
             # Availability score
             availability_score = self._calculate_availability_score(developer)
 
-            # Composite score
-            relevance_score = (
-                skill_match * 0.35
-                + experience_match * 0.20
-                + budget_fit * 0.20
-                + reputation_score * 0.15
-                + availability_score * 0.10
+            component_scores.append(
+                (skill_match, experience_match, budget_fit, reputation_score, availability_score)
+            )
+
+        # Composite score, one weighted sum over the component columns
+        components = np.array(component_scores, dtype=np.float64).reshape(-1, 5)
+        composite_scores = (
+            components[:, 0] * 0.35
+            + components[:, 1] * 0.20
+            + components[:, 2] * 0.20
+            + components[:, 3] * 0.15
+            + components[:, 4] * 0.10
+        )
+        relevance_scores = np.array(
+            [round(score, 4) for score in composite_scores.tolist()], dtype=np.float64
+        )
+
+        # Rank by rounded relevance, ties in candidate order
+        recommendations = []
+        for rank, idx in enumerate(top_k_indices(relevance_scores, limit), 1):
+            developer = candidate_developers[idx]
+            skill_match, experience_match, budget_fit, reputation_score, availability_score = (
+                component_scores[idx]
             )
 
             # Generate explanation
@@ -567,7 +1030,7 @@ class TalentRecommendationEngine:
             recommendations.append(
                 {
                     "developer_user_id": developer["user_id"],
-                    "relevance_score": round(relevance_score, 4),
+                    "relevance_score": float(relevance_scores[idx]),
                     "skill_match_score": round(skill_match, 4),
                     "experience_match_score": round(experience_match, 4),
                     "budget_fit_score": round(budget_fit, 4),
@@ -575,35 +1038,18 @@ class TalentRecommendationEngine:
                     "availability_score": round(availability_score, 4),
                     "explanation": explanation,
                     "model_version": self.model_version,
+                    "rank_position": rank,
                 }
             )
 
-        # Sort and rank
-        recommendations.sort(key=lambda x: x["relevance_score"], reverse=True)
-
-        for idx, rec in enumerate(recommendations[:limit]):
-            rec["rank_position"] = idx + 1
-
-        return recommendations[:limit]
-
-    def _calculate_experience_fit(self, dev_level: str, complexity: str) -> float:
-        """Same as ProjectRecommendationEngine."""
-        level_map = {"junior": 1, "mid": 2, "senior": 3, "expert": 4}
-        complexity_map = {"low": 1, "medium": 2, "high": 3, "expert": 4}
-
-        dev_level_num = level_map.get(dev_level, 2)
-        complexity_num = complexity_map.get(complexity, 2)
-
-        diff = abs(dev_level_num - complexity_num)
-        if diff == 0:
-            return 1.0
-        elif diff == 1:
-            return 0.7
-        else:
-            return 0.4
+        return recommendations
 
     def _calculate_budget_alignment(self, hourly_rate: float, budget_range: Dict) -> float:
-        """Same as ProjectRecommendationEngine."""
+        """
+        Calculate budget alignment from the client's side: any rate within
+        range fits fully, unlike the developer-facing score, which prefers
+        the middle of the range and prices fixed budgets.
+        """
         if not budget_range:
             return 0.5
 
@@ -688,6 +1134,10 @@ class ColdStartRecommender:
     def __init__(self):
         self.popular_projects = []
         self.popular_developers = []
+        self._skill_index = {}
+        self._project_skill_matrix = np.zeros((0, 0), dtype=np.float32)
+        self._required_skill_counts = np.zeros(0)
+        self._popularity_scores = np.zeros(0)
 
     def set_popular_items(self, projects: List[Dict], developers: List[Dict]):
         """
@@ -699,6 +1149,29 @@ class ColdStartRecommender:
         """
         self.popular_projects = projects
         self.popular_developers = developers
+        self._index_popular_projects()
+
+    def _index_popular_projects(self):
+        """
+        Precompute the project x skill matrix and popularity vector so that
+        scoring a developer is one matrix-vector product.
+        """
+        skill_sets = [set(p.get("required_skills", [])) for p in self.popular_projects]
+        self._skill_index = {
+            skill: idx for idx, skill in enumerate(sorted(set().union(*skill_sets)))
+        }
+
+        matrix = np.zeros((len(skill_sets), len(self._skill_index)), dtype=np.float32)
+        for row, skills in enumerate(skill_sets):
+            matrix[row, [self._skill_index[skill] for skill in skills]] = 1.0
+
+        application_counts = np.array(
+            [p.get("application_count", 0) for p in self.popular_projects], dtype=np.float64
+        )
+
+        self._project_skill_matrix = matrix
+        self._required_skill_counts = matrix.sum(axis=1, dtype=np.float64)
+        self._popularity_scores = np.minimum(application_counts / 50, 1.0)  # Normalize
 
     def get_cold_start_project_recommendations(
         self, developer_profile: Dict, limit: int = 10
@@ -706,42 +1179,39 @@ class ColdStartRecommender:
         """
         Generate recommendations for new developers using popularity + basic matching.
         """
-        recommendations = []
+        if not self.popular_projects:
+            return []
 
         dev_skills = set(developer_profile.get("skills", []))
 
-        for project in self.popular_projects:
-            required_skills = set(project.get("required_skills", []))
+        query = np.zeros(len(self._skill_index), dtype=np.float32)
+        query[[self._skill_index[s] for s in dev_skills if s in self._skill_index]] = 1.0
 
-            # Basic skill match
-            if required_skills:
-                skill_match = len(dev_skills & required_skills) / len(required_skills)
-            else:
-                skill_match = 0.5
-
-            # Popularity score
-            application_count = project.get("application_count", 0)
-            popularity_score = min(application_count / 50, 1.0)  # Normalize
+        # Basic skill match: share of each project's required skills the developer has
+        overlap = (self._project_skill_matrix @ query).astype(np.float64)
+        counts = self._required_skill_counts
+        skill_match = np.divide(
+            overlap, counts, out=np.full_like(overlap, 0.5), where=counts > 0
+        )
 
-            # Hybrid: 70% popularity, 30% skill match for cold start
-            relevance_score = popularity_score * 0.7 + skill_match * 0.3
+        # Hybrid: 70% popularity, 30% skill match for cold start
+        relevance_scores = np.round(self._popularity_scores * 0.7 + skill_match * 0.3, 4)
 
+        recommendations = []
+        for rank, idx in enumerate(top_k_indices(relevance_scores, limit), 1):
+            match = float(skill_match[idx])
             recommendations.append(
                 {
-                    "project_id": project["id"],
-                    "relevance_score": round(relevance_score, 4),
-                    "skill_match_score": round(skill_match, 4),
+                    "project_id": self.popular_projects[idx]["id"],
+                    "relevance_score": float(relevance_scores[idx]),
+                    "skill_match_score": round(match, 4),
                     "explanation": [
                         "Popular project on the platform",
-                        f"Matches {int(skill_match * 100)}% of your skills",
+                        f"Matches {int(match * 100)}% of your skills",
                     ],
                     "model_version": "cold_start_v1",
+                    "rank_position": rank,
                 }
             )
 
-        recommendations.sort(key=lambda x: x["relevance_score"], reverse=True)
-
-        for idx, rec in enumerate(recommendations[:limit]):
-            rec["rank_position"] = idx + 1
-
-        return recommendations[:limit]
+        return recommendations